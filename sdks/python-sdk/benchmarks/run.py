@@ -0,0 +1,363 @@
+"""
+WhatsApp API Platform - Python SDK
+Benchmark runner
+
+Measures the SDK's own overhead against a local stub of the ``/api/v1``
+endpoints and writes the results as JSON:
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline results.json  # exit 1 on regression
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import whatsapp_api  # noqa: E402
+from whatsapp_api import WhatsAppAPI, WhatsAppAPIError  # noqa: E402
+from whatsapp_api.codec import get_codec  # noqa: E402
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+# JSON codec used by every client, set from --json-codec
+CODEC = None
+
+# Options that must match for results to be comparable
+WORKLOAD = ("requests", "concurrency", "records", "media_mb", "latency", "rate_429", "rate_5xx", "seed", "json_codec")
+
+# Result fields compared against a baseline, and whether higher is better
+TRACKED = {
+    "ops_per_sec": True,
+    "records_per_sec": True,
+    "mb_per_sec": True,
+    "bytes_per_request": False,
+    "peak_bytes": False,
+}
+
+
+class StubServer:
+    """Run ``stub_server.py`` in a child process for the duration of a block"""
+
+    def __init__(self, **options: Any):
+        self.options = options
+        self.process = None
+        self.url = None
+
+    def __enter__(self) -> "StubServer":
+        command = [sys.executable, os.path.join(HERE, "stub_server.py")]
+        for name, value in self.options.items():
+            command += [f"--{name.replace('_', '-')}", str(value)]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        self.url = self.process.stdout.readline().strip()
+        if not self.url:
+            raise RuntimeError("Stub server failed to start")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.process.stdin.close()
+        self.process.wait(timeout=10)
+
+
+def _percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def _median_run(repeat: int, run: Callable[[], Dict[str, Any]], key: str) -> Dict[str, Any]:
+    """Run a benchmark ``repeat`` times and keep the run with the median ``key``"""
+    runs = sorted((run() for _ in range(repeat)), key=lambda result: result[key])
+    result = runs[len(runs) // 2]
+    result["runs"] = [r[key] for r in runs]
+    return result
+
+
+def bench_send_sequential(url: str, requests: int) -> Dict[str, Any]:
+    """``send_text`` from a single thread"""
+    latencies = []
+    errors = 0
+    with WhatsAppAPI("bench-key", base_url=url, json_codec=CODEC) as client:
+        client.messages.send_text("bench-session", "15550000000", "warm-up")
+        start = time.perf_counter()
+        for i in range(requests):
+            sent = time.perf_counter()
+            try:
+                client.messages.send_text("bench-session", f"1555{i:07d}", "Benchmark message")
+            except WhatsAppAPIError:
+                errors += 1
+            latencies.append(time.perf_counter() - sent)
+        elapsed = time.perf_counter() - start
+    return {
+        "requests": requests,
+        "errors": errors,
+        "seconds": elapsed,
+        "ops_per_sec": requests / elapsed,
+        "p50_ms": _percentile(latencies, 0.5) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+    }
+
+
+def bench_send_concurrent(url: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    """``send_text`` through ``broadcast`` with a thread pool"""
+    with WhatsAppAPI("bench-key", base_url=url, json_codec=CODEC, pool_maxsize=concurrency) as client:
+        start = time.perf_counter()
+        stats = client.messages.broadcast(
+            "bench-session",
+            (f"1555{i:07d}" for i in range(requests)),
+            "Benchmark message",
+            concurrency=concurrency,
+        )
+        elapsed = time.perf_counter() - start
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": stats.failed,
+        "seconds": elapsed,
+        "ops_per_sec": requests / elapsed,
+    }
+
+
+def bench_send_async(url: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    """``send_text`` through ``AsyncWhatsAppAPI.messages.broadcast``"""
+    from whatsapp_api import AsyncWhatsAppAPI
+
+    async def run() -> Dict[str, Any]:
+        async with AsyncWhatsAppAPI("bench-key", base_url=url, json_codec=CODEC) as client:
+            start = time.perf_counter()
+            stats = await client.messages.broadcast(
+                "bench-session",
+                (f"1555{i:07d}" for i in range(requests)),
+                "Benchmark message",
+                concurrency=concurrency,
+            )
+            elapsed = time.perf_counter() - start
+        return {
+            "requests": requests,
+            "concurrency": concurrency,
+            "errors": stats.failed,
+            "seconds": elapsed,
+            "ops_per_sec": requests / elapsed,
+        }
+
+    return asyncio.run(run())
+
+
+def bench_pagination(url: str, records: int, concurrency: int) -> Dict[str, Any]:
+    """``messages.iter_all`` over every page of ``GET /messages``"""
+    count = 0
+    errors = 0
+    with WhatsAppAPI("bench-key", base_url=url, json_codec=CODEC) as client:
+        start = time.perf_counter()
+        try:
+            for _ in client.messages.iter_all(limit=100, concurrency=concurrency):
+                count += 1
+        except WhatsAppAPIError:
+            errors += 1
+        elapsed = time.perf_counter() - start
+    if not errors and count != records:
+        raise RuntimeError(f"Paginated {count} of {records} messages")
+    return {
+        "records": count,
+        "errors": errors,
+        "pages": -(-count // 100),
+        "concurrency": concurrency,
+        "seconds": elapsed,
+        "records_per_sec": count / elapsed,
+    }
+
+
+def bench_media_upload(url: str, size_mb: int) -> Dict[str, Any]:
+    """``send_media`` of a file on disk, with traced peak memory"""
+    size = size_mb * 1024 * 1024
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+        block = os.urandom(1024 * 1024)
+        for _ in range(size_mb):
+            f.write(block)
+        path = f.name
+
+    try:
+        with WhatsAppAPI("bench-key", base_url=url, json_codec=CODEC) as client:
+            client.messages.send_text("bench-session", "15550000000", "warm-up")
+            gc.collect()
+            tracemalloc.start()
+            start = time.perf_counter()
+            errors = 0
+            try:
+                response = client.messages.send_media("bench-session", "15550000000", path, media_type="video")
+            except WhatsAppAPIError:
+                errors += 1
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    finally:
+        os.unlink(path)
+
+    if not errors and response["data"]["received_bytes"] < size:
+        raise RuntimeError(f"Stub received {response['data']['received_bytes']} of {size} bytes")
+    return {
+        "bytes": size,
+        "errors": errors,
+        "seconds": elapsed,
+        "mb_per_sec": size_mb / elapsed,
+        "peak_bytes": peak,
+    }
+
+
+def bench_memory_per_request(url: str, concurrency: int, requests: int) -> Dict[str, Any]:
+    """Traced heap growth per in-flight ``send_text`` against a slow server"""
+    with WhatsAppAPI("bench-key", base_url=url, json_codec=CODEC, pool_maxsize=concurrency) as client:
+        # Open the pooled connections and worker threads before measuring
+        client.messages.broadcast("bench-session", ["15550000000"] * concurrency, "warm-up", concurrency=concurrency)
+        gc.collect()
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        stats = client.messages.broadcast(
+            "bench-session",
+            (f"1555{i:07d}" for i in range(requests)),
+            "Benchmark message",
+            concurrency=concurrency,
+        )
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": stats.failed,
+        "peak_bytes": peak - baseline,
+        "bytes_per_request": (peak - baseline) / concurrency,
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    stub = {
+        "latency": args.latency,
+        "rate_429": args.rate_429,
+        "rate_5xx": args.rate_5xx,
+        "messages": args.records,
+        "seed": args.seed,
+    }
+    results: Dict[str, Any] = {}
+
+    with StubServer(**stub) as server:
+        results["send_text_sequential"] = _median_run(
+            args.repeat, lambda: bench_send_sequential(server.url, args.requests), "ops_per_sec"
+        )
+        results["send_text_concurrent"] = _median_run(
+            args.repeat, lambda: bench_send_concurrent(server.url, args.requests, args.concurrency), "ops_per_sec"
+        )
+        if aiohttp is not None:
+            results["send_text_async"] = _median_run(
+                args.repeat, lambda: bench_send_async(server.url, args.requests, args.concurrency), "ops_per_sec"
+            )
+        results["pagination"] = _median_run(
+            args.repeat, lambda: bench_pagination(server.url, args.records, 1), "records_per_sec"
+        )
+        results["pagination_concurrent"] = _median_run(
+            args.repeat, lambda: bench_pagination(server.url, args.records, 4), "records_per_sec"
+        )
+        results["media_upload"] = _median_run(
+            args.repeat, lambda: bench_media_upload(server.url, args.media_mb), "mb_per_sec"
+        )
+
+    # Slow responses keep every request in flight at once
+    with StubServer(latency=max(args.latency, 0.2), seed=args.seed) as server:
+        results["memory_per_request"] = bench_memory_per_request(
+            server.url, args.concurrency, args.concurrency * 4
+        )
+
+    return {
+        "meta": {
+            "sdk_version": whatsapp_api.__version__,
+            "json_codec": get_codec(CODEC).name,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "options": vars(args),
+        },
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """List tracked results that regressed by more than ``tolerance``"""
+    options = report["meta"]["options"]
+    previous_options = baseline.get("meta", {}).get("options", {})
+    mismatched = [key for key in WORKLOAD if options.get(key) != previous_options.get(key)]
+    if mismatched:
+        raise ValueError(f"Baseline was run with different options: {', '.join(mismatched)}")
+
+    regressions = []
+    for name, result in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        for key, higher_is_better in TRACKED.items():
+            if key not in result or not previous.get(key):
+                continue
+            change = (result[key] - previous[key]) / previous[key]
+            if (change < -tolerance) if higher_is_better else (change > tolerance):
+                regressions.append(f"{name}.{key}: {previous[key]:.1f} -> {result[key]:.1f} ({change:+.0%})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the SDK against a local stub API server")
+    parser.add_argument("--requests", type=int, default=2000, help="sends per send benchmark")
+    parser.add_argument("--concurrency", type=int, default=16, help="requests in flight for concurrent benchmarks")
+    parser.add_argument("--records", type=int, default=10000, help="messages served for pagination")
+    parser.add_argument("--media-mb", type=int, default=50, help="size of the uploaded media file")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark; the median is reported")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the stub adds to each response")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for error injection")
+    parser.add_argument("--json-codec", help="JSON codec for the SDK clients (default: fastest installed)")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed regression against the baseline")
+    args = parser.parse_args(argv)
+
+    global CODEC
+    CODEC = args.json_codec
+
+    report = run(args)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            try:
+                regressions = compare(report, json.load(f), args.tolerance)
+            except ValueError as e:
+                print(e, file=sys.stderr)
+                return 2
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
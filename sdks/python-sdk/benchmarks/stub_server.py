@@ -0,0 +1,277 @@
+"""
+WhatsApp API Platform - Python SDK
+Stub API server for benchmarks
+"""
+
+import argparse
+import json
+import random
+import re
+import socket
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+PREFIX = "/api/v1"
+READ_SIZE = 64 * 1024
+# Session of every message served by ``GET /messages``
+SESSION_ID = "bench-session"
+
+# Body fields the server's send routes require (express-validator rules)
+REQUIRED_FIELDS = {
+    "/messages/send": ("session_id", "to", "content"),
+    "/messages/media": ("session_id", "to", "type", "media_url"),
+    "/messages/location": ("session_id", "to", "location.latitude", "location.longitude"),
+}
+
+
+class StubConfig:
+    """
+    Behaviour of the stub server
+
+    Args:
+        latency: Seconds added to every response
+        rate_429: Fraction of requests answered with 429 (Retry-After: 0)
+        rate_5xx: Fraction of requests answered with 503
+        messages: Number of messages served by ``GET /messages``
+        rate_limit: Limit advertised in RateLimit headers
+        seed: Random seed for error injection
+        conflicts: Sends first answered with 409 "in progress"
+            (Retry-After: 0), as while a request with the same
+            Idempotency-Key is being processed
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_429: float = 0.0,
+        rate_5xx: float = 0.0,
+        messages: int = 10000,
+        rate_limit: int = 1000000,
+        seed: int = 0,
+        conflicts: int = 0,
+    ):
+        self.latency = latency
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.messages = messages
+        self.rate_limit = rate_limit
+        self.random = random.Random(seed)
+        self.conflicts = conflicts
+        self.lock = threading.Lock()
+        # Responses of sends, by Idempotency-Key
+        self.sent = {}
+
+    def roll(self) -> float:
+        with self.lock:
+            return self.random.random()
+
+
+def _message(index: int, session_id: str = SESSION_ID) -> dict:
+    return {
+        "id": str(uuid.UUID(int=index + 1)),
+        "session_id": session_id,
+        "direction": "outbound",
+        "from": "15550000000",
+        "to": f"1555{index:07d}",
+        "type": "text",
+        "content": f"Benchmark message {index}",
+        "status": "delivered",
+        "created_at": "2024-01-01T00:00:00.000Z",
+    }
+
+
+def _validation_errors(body: object, fields: tuple) -> list:
+    """Errors for the required fields missing from a JSON body"""
+    errors = []
+    for field in fields:
+        value = body
+        for name in field.split("."):
+            value = value.get(name) if isinstance(value, dict) else None
+        if value is None or value == "":
+            errors.append({"field": field, "message": f"{field} is required"})
+    return errors
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers the ``/api/v1`` routes the benchmarks exercise"""
+
+    protocol_version = "HTTP/1.1"
+    config = StubConfig()
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body are written separately; without this, Nagle's
+        # algorithm and delayed ACKs add ~40ms to every response
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _read_body(self) -> int:
+        """Consume the request body without keeping it; returns its size"""
+        size = 0
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            while True:
+                length = int(self.rfile.readline().split(b";")[0], 16)
+                if length == 0:
+                    self.rfile.readline()
+                    return size
+                while length:
+                    chunk = self.rfile.read(min(length, READ_SIZE))
+                    length -= len(chunk)
+                    size += len(chunk)
+                self.rfile.readline()
+
+        remaining = int(self.headers.get("Content-Length") or 0)
+        while remaining:
+            chunk = self.rfile.read(min(remaining, READ_SIZE))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            size += len(chunk)
+        return size
+
+    def _read_json(self) -> tuple:
+        """Read a JSON request body; returns its size and the parsed value"""
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        try:
+            return len(raw), json.loads(raw) if raw else None
+        except ValueError:
+            return len(raw), None
+
+    def _send(self, status: int, data: dict, headers: dict = None) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("RateLimit-Limit", str(self.config.rate_limit))
+        self.send_header("RateLimit-Remaining", str(self.config.rate_limit))
+        self.send_header("RateLimit-Reset", "60")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self) -> None:
+        is_json = self.headers.get("Content-Type", "").startswith("application/json")
+        size, body = self._read_json() if is_json else (self._read_body(), None)
+        config = self.config
+        if config.latency:
+            time.sleep(config.latency)
+
+        roll = config.roll()
+        if roll < config.rate_429:
+            return self._send(429, {"error": "Too many requests"}, {"Retry-After": "0"})
+        if roll < config.rate_429 + config.rate_5xx:
+            return self._send(503, {"error": "Service unavailable"})
+
+        url = urlsplit(self.path)
+        path = url.path[len(PREFIX):] if url.path.startswith(PREFIX) else url.path
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        # Multipart uploads are only consumed; JSON sends are validated
+        if self.command == "POST" and is_json and path in REQUIRED_FIELDS:
+            errors = _validation_errors(body, REQUIRED_FIELDS[path])
+            if errors:
+                return self._send(400, {"success": False, "error": "Validation error", "errors": errors})
+
+        if self.command == "POST" and path in ("/messages/send", "/messages/location"):
+            key = self.headers.get("Idempotency-Key")
+            with config.lock:
+                conflict = config.conflicts > 0
+                config.conflicts -= conflict
+            if conflict:
+                return self._send(
+                    409, {"error": "A request with this Idempotency-Key is in progress"}, {"Retry-After": "0"}
+                )
+            with config.lock:
+                data = config.sent.get(key) if key else None
+                if data is None:
+                    data = _message(0)
+                    data["id"] = str(uuid.uuid4())
+                    if key:
+                        config.sent[key] = data
+            return self._send(201, {"success": True, "message": "Message sent successfully", "data": data})
+
+        if self.command == "POST" and path == "/messages/media":
+            data = _message(0)
+            data.update({"id": str(uuid.uuid4()), "type": "image", "received_bytes": size})
+            return self._send(201, {"success": True, "message": "Media sent successfully", "data": data})
+
+        if self.command == "GET" and path == "/messages":
+            page = max(1, int(query.get("page", 1)))
+            limit = min(100, max(1, int(query.get("limit", 50))))
+            total = config.messages if query.get("session_id", SESSION_ID) == SESSION_ID else 0
+            start = (page - 1) * limit
+            end = min(start + limit, total)
+            return self._send(200, {
+                "success": True,
+                "data": {
+                    "messages": [_message(i) for i in range(start, end)],
+                    "pagination": {
+                        "page": page,
+                        "limit": limit,
+                        "total": total,
+                        "totalPages": -(-total // limit),
+                    },
+                },
+            })
+
+        match = re.fullmatch(r"/messages/([^/]+)/status", path)
+        if self.command == "GET" and match:
+            return self._send(200, {
+                "success": True,
+                "data": {"id": match.group(1), "status": "delivered"},
+            })
+
+        if self.command == "GET" and path == "/health":
+            return self._send(200, {"success": True, "status": "ok"})
+
+        self._send(404, {"error": "Route not found"})
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops connection bursts from concurrent
+    # clients, and the dropped SYNs are only retried after a second
+    request_queue_size = 128
+
+
+def serve(config: StubConfig, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start the stub server in a background thread"""
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"config": config})
+    server = _StubHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stub WhatsApp API server for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to each response")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="fraction of 503 responses")
+    parser.add_argument("--messages", type=int, default=10000, help="messages served by GET /messages")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = StubConfig(args.latency, args.rate_429, args.rate_5xx, args.messages, seed=args.seed)
+    server = serve(config, args.host, args.port)
+    # The benchmark runner reads the base URL from the first line
+    print(f"http://{args.host}:{server.server_port}{PREFIX}", flush=True)
+    try:
+        sys.stdin.read()
+    except KeyboardInterrupt:
+        pass
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -31,11 +31,25 @@ setup(
         "Programming Language :: Python :: 3.11",
     ],
     python_requires=">=3.7",
+    entry_points={
+        "console_scripts": [
+            "whatsapp-api=whatsapp_api.cli:main",
+        ],
+    },
     install_requires=[
         "requests>=2.28.0",
         "urllib3>=1.26.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "realtime": [
+            "python-socketio[client]>=5.3.0",
+        ],
+        "speedups": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from stub_server import StubConfig, serve  # noqa: E402
+
+from whatsapp_api import WhatsAppAPI  # noqa: E402
+
+
+@pytest.fixture
+def stub():
+    """Stub API server; yields its config, with the base URL as ``url``"""
+    config = StubConfig()
+    server = serve(config)
+    config.url = f"http://127.0.0.1:{server.server_port}/api/v1"
+    yield config
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stub):
+    """WhatsAppAPI client of the stub server"""
+    with WhatsAppAPI(api_key="test-key", base_url=stub.url) as client:
+        yield client
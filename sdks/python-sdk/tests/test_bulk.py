@@ -0,0 +1,43 @@
+import asyncio
+
+from whatsapp_api.bulk import SKIP, AsyncBulkSend, BulkSend
+
+
+def _send(item):
+    if item % 2:
+        raise ValueError(item)
+    return {"success": True}
+
+
+def test_failures_keep_only_the_latest():
+    bulk = BulkSend(_send, range(100), concurrency=1, max_failures=3)
+    stats = bulk.run()
+
+    assert (stats.succeeded, stats.failed) == (50, 50)
+    assert stats.errors == {"ValueError": 50}
+    assert [result.item for result in stats.failures] == [95, 97, 99]
+
+
+def test_prepare_skips_and_fails_items():
+    def prepare(item):
+        if item == 0:
+            return SKIP
+        if item == 1:
+            raise ValueError(item)
+        return item * 2
+
+    stats = BulkSend(_send, range(4), prepare=prepare).run()
+    assert (stats.succeeded, stats.failed, stats.skipped) == (2, 1, 1)
+
+
+def test_async_failures_keep_only_the_latest():
+    async def send(item):
+        return _send(item)
+
+    async def run():
+        bulk = AsyncBulkSend(send, range(100), concurrency=1, max_failures=2)
+        return await bulk.run()
+
+    stats = asyncio.run(run())
+    assert stats.failed == 50
+    assert [result.item for result in stats.failures] == [97, 99]
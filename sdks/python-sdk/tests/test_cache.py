@@ -0,0 +1,53 @@
+import time
+
+from stub_server import SESSION_ID
+
+from whatsapp_api import ResponseCache, WhatsAppAPI
+
+
+def test_key_ignores_param_order():
+    assert ResponseCache.key("messages/", {"page": 1, "limit": 20}) == ResponseCache.key("/messages", {
+        "limit": 20, "page": 1,
+    })
+    assert ResponseCache.key("/messages", {"page": 1}) != ResponseCache.key("/messages", {"page": 2})
+
+
+def test_key_is_none_for_unhashable_params():
+    assert ResponseCache.key("/contacts", {"labels": ["a", "b"]}) is None
+
+
+def test_entries_expire_after_resource_ttl():
+    cache = ResponseCache(ttl=60, ttls={"messages": 0.05, "groups": 0})
+    messages = ResponseCache.key("/messages")
+    contacts = ResponseCache.key("/contacts")
+    cache.set(messages, {"data": 1}, cache.generation("/messages"))
+    cache.set(contacts, {"data": 2}, cache.generation("/contacts"))
+    cache.set(ResponseCache.key("/groups"), {"data": 3}, cache.generation("/groups"))
+
+    assert cache.get(messages) == {"data": 1}
+    assert cache.stats()["size"] == 2
+    time.sleep(0.06)
+    assert cache.get(messages) is None
+    assert cache.get(contacts) == {"data": 2}
+
+
+def test_write_during_read_is_not_cached():
+    cache = ResponseCache()
+    key = ResponseCache.key("/contacts/1")
+    generation = cache.generation("/contacts/1")
+    cache.invalidate("PUT", "/contacts/1")
+    cache.set(key, {"data": "stale"}, generation)
+    assert cache.get(key) is None
+
+
+def test_client_skips_cache_for_unhashable_params(stub):
+    sent = []
+    with WhatsAppAPI(api_key="test-key", base_url=stub.url, cache=ResponseCache()) as client:
+        client.on("after_response")(sent.append)
+        for _ in range(2):
+            client.get("/messages", params={"session_id": SESSION_ID, "limit": 5})
+        for _ in range(2):
+            client.get("/messages", params={"session_id": SESSION_ID, "limit": 5, "type": ["text"]})
+
+    assert len(sent) == 3
+    assert client.cache.stats()["size"] == 1
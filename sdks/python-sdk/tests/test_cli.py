@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from stub_server import SESSION_ID
+
+from whatsapp_api.cli import _Checkpoint, _read_rows, _recipient, main
+
+
+def _write(path, lines):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+    return str(path)
+
+
+def test_read_rows_from_csv_and_ndjson(tmp_path):
+    csv = _write(tmp_path / "rows.csv", ["to,message", "15550000001,Hi", "15550000002,"])
+    ndjson = _write(tmp_path / "rows.ndjson", ['"15550000001"', "", '{"to": "15550000002"}'])
+
+    assert [dict(row) for row in _read_rows(csv)] == [
+        {"to": "15550000001", "message": "Hi"},
+        {"to": "15550000002", "message": ""},
+    ]
+    assert list(_read_rows(ndjson)) == ["15550000001", {"to": "15550000002"}]
+
+
+@pytest.mark.parametrize(
+    "row, item",
+    [
+        ("15550000001", "15550000001"),
+        ({"phone": "15550000001", "message": ""}, "15550000001"),
+        ({"phone_number": "15550000001", "message": "Hi"}, {"to": "15550000001", "message": "Hi"}),
+        (
+            {"to": "15550000001", "latitude": "1.5", "longitude": "-2", "name": "HQ", "message": "Hi"},
+            {"to": "15550000001", "latitude": 1.5, "longitude": -2.0, "name": "HQ"},
+        ),
+        (
+            {"to": "15550000001", "media_url": "https://x/a.png", "caption": "A", "session_id": "s2"},
+            {"to": "15550000001", "media_url": "https://x/a.png", "caption": "A", "session_id": "s2"},
+        ),
+    ],
+)
+def test_recipient_maps_rows_to_send_items(row, item):
+    assert _recipient(row) == item
+
+
+def test_recipient_requires_a_number():
+    with pytest.raises(ValueError, match="no to, phone_number or phone"):
+        _recipient({"message": "Hi"})
+
+
+def test_checkpoint_round_trip(tmp_path):
+    path = str(tmp_path / "rows.checkpoint")
+    checkpoint = _Checkpoint(path, "/data/rows.csv")
+    for index, ok in [(0, True), (2, True), (1, False), (4, True)]:
+        checkpoint.add(index, ok)
+    checkpoint.save()
+
+    loaded = _Checkpoint.load(path)
+    assert (loaded.source, loaded.run_id) == ("/data/rows.csv", checkpoint.run_id)
+    assert (loaded.watermark, loaded.done, loaded.failed_rows) == (3, {4}, {1})
+    assert (loaded.completed, loaded.succeeded, loaded.failed) == (4, 3, 1)
+
+    # A retried row that now succeeds is no longer failed, and is not counted twice
+    loaded.add(1, True)
+    assert (loaded.watermark, loaded.done, loaded.completed, loaded.failed) == (3, {4}, 4, 0)
+
+
+def _broadcast(path, stub, *options):
+    argv = ["broadcast", path, "--session", SESSION_ID, "--api-key", "test-key", "--base-url", stub.url]
+    return main(argv + ["--quiet", *options])
+
+
+def _keys(stub):
+    return sorted(int(key.split(":")[1]) for key in stub.sent)
+
+
+def test_broadcast_shards_rows_across_workers(tmp_path, stub, capsys):
+    path = _write(tmp_path / "rows.ndjson", [json.dumps(f"1555{index:07d}") for index in range(40)])
+
+    assert _broadcast(path, stub, "--message", "Hi", "--workers", "3", "--concurrency", "4") == 0
+    assert "Sent 40, failed 0" in capsys.readouterr().out
+    assert _keys(stub) == list(range(40))
+
+    checkpoint = _Checkpoint.load(path + ".checkpoint")
+    assert (checkpoint.watermark, checkpoint.done, checkpoint.failed) == (40, set(), 0)
+
+    # A finished run resumes to nothing
+    assert _broadcast(path, stub, "--message", "Hi", "--workers", "3") == 0
+    assert "Sent 40, failed 0" in capsys.readouterr().out
+    assert len(stub.sent) == 40
+
+
+def test_resume_skips_sent_rows_and_retries_failed_ones(tmp_path, stub, capsys):
+    # Rows without a message fail while there is no --message
+    rows = [{"to": f"1555{index:07d}", "message": "Hi" if index % 4 else ""} for index in range(12)]
+    path = _write(tmp_path / "rows.ndjson", [json.dumps(row) for row in rows])
+    failures = str(tmp_path / "failed.ndjson")
+
+    assert _broadcast(path, stub, "--workers", "2", "--failures", failures) == 0
+    assert "Sent 9, failed 3" in capsys.readouterr().out
+    assert _keys(stub) == [1, 2, 3, 5, 6, 7, 9, 10, 11]
+    with open(failures, encoding="utf-8") as f:
+        assert sorted(json.loads(line)["to"] for line in f) == ["15550000000", "15550000004", "15550000008"]
+    assert _Checkpoint.load(path + ".checkpoint").failed_rows == {0, 4, 8}
+
+    stub.sent.clear()
+    assert _broadcast(path, stub, "--workers", "2", "--message", "Hi") == 0
+    out, err = capsys.readouterr()
+    assert "9 rows already sent, 3 failed rows to retry" in err
+    assert "Sent 12, failed 0" in out
+    # Only the failed rows were sent again
+    assert _keys(stub) == [0, 4, 8]
+
+    checkpoint = _Checkpoint.load(path + ".checkpoint")
+    assert (checkpoint.watermark, checkpoint.done, checkpoint.failed_rows) == (12, set(), set())
@@ -0,0 +1,31 @@
+import asyncio
+import json
+
+import pytest
+
+from whatsapp_api import AsyncWhatsAppAPI, NotFoundError, WhatsAppAPI
+from whatsapp_api.codec import JSONCodec
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+
+# Decodes every body to a JSON array, as a proxy or misrouted request might return
+ARRAY_CODEC = JSONCodec("array", lambda obj: json.dumps(obj).encode(), lambda body: [json.loads(body)])
+
+
+def test_non_object_body_is_reported(stub):
+    with WhatsAppAPI(api_key="test-key", base_url=stub.url, json_codec=ARRAY_CODEC) as client:
+        with pytest.raises(NotFoundError, match="Invalid JSON response"):
+            client.get("/unknown")
+        result = client.messages.send_text(SESSION_ID, "15550001111", "Hello", idempotency_key="key-1")
+
+    assert result == {"error": "Invalid JSON response", "idempotency_key": "key-1"}
+
+
+def test_async_non_object_body_is_reported(stub):
+    async def send():
+        async with AsyncWhatsAppAPI(api_key="test-key", base_url=stub.url, json_codec=ARRAY_CODEC) as client:
+            with pytest.raises(NotFoundError, match="Invalid JSON response"):
+                await client.get("/unknown")
+            return await client.messages.send_text(SESSION_ID, "15550001111", "Hello", idempotency_key="key-1")
+
+    assert asyncio.run(send()) == {"error": "Invalid JSON response", "idempotency_key": "key-1"}
@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+import pytest
+from stub_server import SESSION_ID
+
+from whatsapp_api import AsyncWhatsAppAPI, NotFoundError, WhatsAppAPI
+from whatsapp_api.codec import CODECS, STDLIB, JSONCodec, get_codec
+
+
+class RecordingCodec(JSONCodec):
+    """Standard library JSON, recording what it encodes and decodes"""
+
+    __slots__ = ("encoded", "decoded")
+
+    def __init__(self):
+        super().__init__("recording", self._dumps, self._loads)
+        self.encoded = []
+        self.decoded = []
+
+    def _dumps(self, obj):
+        self.encoded.append(obj)
+        return json.dumps(obj).encode()
+
+    def _loads(self, body):
+        self.decoded.append(body)
+        return json.loads(body)
+
+
+def test_custom_codec_encodes_requests_and_decodes_responses(stub):
+    codec = RecordingCodec()
+    with WhatsAppAPI(api_key="test-key", base_url=stub.url, json_codec=codec) as client:
+        assert client.json_codec is codec
+        result = client.messages.send_text(SESSION_ID, "15550000001", "Hello")
+
+    assert [body["content"] for body in codec.encoded] == ["Hello"]
+    assert len(codec.decoded) == 1 and isinstance(codec.decoded[0], bytes)
+    assert result["success"] is True
+
+
+def test_decode_false_returns_the_status_code(stub):
+    codec = RecordingCodec()
+    with WhatsAppAPI(api_key="test-key", base_url=stub.url, json_codec=codec) as client:
+        payload = {"session_id": SESSION_ID, "to": "15550000001", "content": "Hello"}
+        assert client.post("/messages/send", payload, decode=False) == 201
+        assert client.get("/health", decode=False) == 200
+        assert codec.decoded == []
+
+        # Errors are still decoded, for their message
+        with pytest.raises(NotFoundError, match="Route not found"):
+            client.get("/unknown", decode=False)
+    assert len(codec.decoded) == 1
+
+
+def test_async_custom_codec_and_decode_false(stub):
+    codec = RecordingCodec()
+
+    async def run():
+        async with AsyncWhatsAppAPI(api_key="test-key", base_url=stub.url, json_codec=codec) as client:
+            sent = await client.messages.send_text(SESSION_ID, "15550000001", "Hello")
+            status = await client.get("/health", decode=False)
+            return sent, status
+
+    sent, status = asyncio.run(run())
+    assert (sent["success"], status) == (True, 200)
+    assert [body["content"] for body in codec.encoded] == ["Hello"]
+    assert len(codec.decoded) == 1
+
+
+def test_get_codec_resolves_names():
+    codec = RecordingCodec()
+
+    assert get_codec(codec) is codec
+    assert get_codec("json") is STDLIB
+    assert get_codec() is CODECS.get("orjson", CODECS.get("ujson", STDLIB))
+    with pytest.raises(ValueError, match="JSON codec 'simdjson' is not installed"):
+        get_codec("simdjson")
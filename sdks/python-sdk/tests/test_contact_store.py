@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime, timezone
+
+from whatsapp_api import AsyncContactStore, ContactStore, ResponseCache, WhatsAppAPI
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+OLD = "2024-01-01T00:00:00.000Z"
+
+
+def _now():
+    moment = datetime.now(timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}Z"
+
+
+class FakeContacts:
+    """contacts.list with the server's updated_since/after_id keyset semantics"""
+
+    def __init__(self, count):
+        self.rows = {
+            f"c{index:04d}": {
+                "id": f"c{index:04d}",
+                "session_id": SESSION_ID,
+                "phone_number": f"+1555{index:07d}",
+                "name": f"Contact {index}",
+                "updated_at": OLD,
+            }
+            for index in range(count)
+        }
+        self.fetched = 0
+
+    def update(self, contact_id, **fields):
+        row = self.rows.setdefault(contact_id, {"id": contact_id, "session_id": SESSION_ID})
+        row.update(fields, updated_at=_now())
+
+    def list(self, session_id=None, search=None, page=1, limit=50, updated_since=None, after_id=None, cache=True):
+        rows = sorted(self.rows.values(), key=lambda row: (row["updated_at"], row["id"]))
+        if updated_since:
+            rows = [
+                row for row in rows
+                if row["updated_at"] > updated_since
+                or (row["updated_at"] == updated_since and row["id"] > (after_id or ""))
+            ]
+            self.fetched += len(rows[:limit])
+        return {"data": {"contacts": rows[:limit], "pagination": {"total": len(self.rows)}}}
+
+
+class FakeClient:
+    def __init__(self, count):
+        self.contacts = FakeContacts(count)
+
+
+class AsyncFakeContacts(FakeContacts):
+    async def list(self, *args, **kwargs):
+        return FakeContacts.list(self, *args, **kwargs)
+
+
+def test_refresh_fetches_only_changes():
+    client = FakeClient(250)
+    store = ContactStore(client, SESSION_ID, page_size=100)
+    store.refresh()
+    assert len(store) == 250 and store.rebuilds == 1
+
+    client.contacts.fetched = 0
+    client.contacts.update("c0007", name="Renamed", phone_number="+31 6 1234 5678")
+    client.contacts.update("new", name="Newcomer", phone_number="+44 20 7946 0000")
+    store.refresh()
+
+    assert client.contacts.fetched == 2
+    assert (store.refreshes, store.rebuilds) == (1, 1)
+    assert store.by_phone("0031612345678").name == "Renamed"
+    assert store.by_phone("+1 555 0000007") is None
+    assert [contact.id for contact in store.search("ren")] == ["c0007"]
+    assert store.get("new").name == "Newcomer"
+
+
+def test_deletions_trigger_rebuild():
+    client = FakeClient(30)
+    store = ContactStore(client, SESSION_ID, page_size=10)
+    store.refresh()
+
+    del client.contacts.rows["c0003"]
+    store.refresh()
+
+    assert store.rebuilds == 2
+    assert len(store) == 29 and "c0003" not in store
+
+
+def test_refresh_bypasses_the_response_cache():
+    contacts = FakeContacts(30)
+    client = WhatsAppAPI(api_key="test-key", cache=ResponseCache(ttl=300))
+    # Served by the fake instead of the network, through the client's cache
+    client._request = lambda method, endpoint, params=None, **kwargs: contacts.list(**params)
+    with client:
+        client.contacts.list(SESSION_ID, limit=1)
+        store = ContactStore(client, SESSION_ID, page_size=10)
+        store.refresh()
+
+        del contacts.rows["c0003"]
+        store.refresh()
+        assert client.contacts.list(SESSION_ID, limit=1)["data"]["pagination"]["total"] == 29
+
+    assert store.rebuilds == 2
+    assert len(store) == 29 and "c0003" not in store
+
+
+def test_restart_resumes_from_cursor(tmp_path):
+    path = str(tmp_path / "contacts.db")
+    client = FakeClient(120)
+    with ContactStore(client, SESSION_ID, path=path, page_size=50) as store:
+        store.refresh()
+
+    client.contacts.update("c0001", name="Changed")
+    client.contacts.fetched = 0
+    with ContactStore(client, SESSION_ID, path=path, page_size=50) as store:
+        assert len(store) == 120
+        store.refresh()
+        assert store.rebuilds == 0
+        assert store.get("c0001").name == "Changed"
+    assert client.contacts.fetched == 1
+
+
+def test_async_refresh_fetches_only_changes():
+    client = FakeClient(0)
+    client.contacts = AsyncFakeContacts(150)
+
+    async def run():
+        store = AsyncContactStore(client, SESSION_ID, page_size=100)
+        await store.refresh()
+        client.contacts.fetched = 0
+        client.contacts.update("c0100", name="Changed")
+        await store.refresh()
+        return store
+
+    store = asyncio.run(run())
+    assert client.contacts.fetched == 1
+    assert store.get("c0100").name == "Changed"
+    assert (store.refreshes, store.rebuilds) == (1, 1)
@@ -0,0 +1,52 @@
+import asyncio
+
+from whatsapp_api.resources.contacts import AsyncContacts, Contacts
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+
+ROWS = [
+    {"phone_number": "+31 6 1234 5678", "name": "Ann"},
+    {"phone_number": "", "name": "No number"},
+    {"phone_number": "0612345678", "name": "Ann again"},
+    {"phone_number": "+1 555 000 1111", "name": "Bob"},
+    {"phone_number": "12", "name": "Too short"},
+]
+
+
+class FakeClient:
+    def __init__(self):
+        self.chunks = []
+
+    def post(self, endpoint, data=None):
+        self.chunks.append(data["contacts"])
+        return {"data": {"imported": len(data["contacts"]), "errors": 0, "details": []}}
+
+
+class AsyncFakeClient(FakeClient):
+    async def post(self, endpoint, data=None):
+        return FakeClient.post(self, endpoint, data)
+
+
+def _check(summary, client):
+    assert summary["imported"] == 2
+    assert summary["errors"] == 3
+    assert [detail["error"] for detail in summary["details"]] == [
+        "Phone number and name are required", "Duplicate phone number", "Invalid phone number",
+    ]
+    assert [len(chunk) for chunk in client.chunks] == [1, 1]
+
+
+def test_bulk_import_reports_rows_rejected_while_streaming():
+    client = FakeClient()
+    summary = Contacts(client).bulk_import(
+        SESSION_ID, iter(ROWS), chunk_size=1, normalize=True, default_country_code="31"
+    )
+    _check(summary, client)
+
+
+def test_async_bulk_import_reports_rows_rejected_while_streaming():
+    client = AsyncFakeClient()
+    summary = asyncio.run(AsyncContacts(client).bulk_import(
+        SESSION_ID, iter(ROWS), chunk_size=1, normalize=True, default_country_code="31"
+    ))
+    _check(summary, client)
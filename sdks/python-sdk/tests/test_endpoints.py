@@ -0,0 +1,143 @@
+import asyncio
+import socket
+import time
+
+import aiohttp
+import pytest
+from stub_server import StubConfig, serve
+
+from whatsapp_api import WhatsAppAPI
+from whatsapp_api.endpoints import AsyncEndpoints, Endpoints
+from whatsapp_api.exceptions import WhatsAppAPIError
+from whatsapp_api.retry import Backoff
+
+
+@pytest.fixture
+def stubs():
+    """Starts stub servers on demand; yields a factory of their configs"""
+    servers = []
+
+    def start(**options):
+        config = StubConfig(**options)
+        server = serve(config)
+        config.url = f"http://127.0.0.1:{server.server_port}/api/v1"
+        config.server = server
+        servers.append(server)
+        return config
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _stop(stub):
+    stub.server.shutdown()
+    stub.server.server_close()
+
+
+def _dead_url():
+    """Base URL of a port nothing listens on"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/api/v1"
+
+
+def _health(endpoints):
+    return [node["healthy"] for node in endpoints.snapshot()]
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_prefers_the_fastest_healthy_node_then_fails_over_in_order(stubs):
+    slow, fast = stubs(latency=0.05), stubs()
+    dead = _dead_url()
+    endpoints = Endpoints([dead, slow.url, fast.url], timeout=1)
+    endpoints.check()
+
+    assert _health(endpoints) == [False, True, True]
+    assert {endpoints.current() for _ in range(4)} == {fast.url}
+
+    assert endpoints.mark_down(fast.url) is True
+    assert {endpoints.current() for _ in range(4)} == {slow.url}
+
+    # Every node down: the one that failed longest ago is tried
+    assert endpoints.mark_down(slow.url) is False
+    assert endpoints.current() == dead
+    endpoints.stop()
+
+
+def test_nodes_within_tolerance_take_turns(stubs):
+    first, second = stubs(), stubs()
+    endpoints = Endpoints([first.url, second.url], tolerance=10)
+    endpoints.check()
+
+    assert {endpoints.current() for _ in range(4)} == {first.url, second.url}
+    endpoints.stop()
+
+
+def test_health_checks_eject_and_readmit_a_node(stubs):
+    flaky, steady = stubs(), stubs()
+    endpoints = Endpoints([flaky.url, steady.url], interval=0.05, timeout=1)
+    endpoints.start()
+    try:
+        _wait_for(lambda: all(node["latency"] is not None for node in endpoints.snapshot()))
+
+        flaky.rate_5xx = 1
+        _wait_for(lambda: _health(endpoints) == [False, True])
+        assert {endpoints.current() for _ in range(4)} == {steady.url}
+
+        flaky.rate_5xx = 0
+        _wait_for(lambda: _health(endpoints) == [True, True])
+        assert endpoints.snapshot()[0]["failures"] >= 1
+    finally:
+        endpoints.stop()
+
+
+def test_client_retries_a_request_on_the_next_node(stubs):
+    first, second = stubs(), stubs()
+    retries = []
+    with WhatsAppAPI(api_key="test-key", base_url=[first.url, second.url], health_check_interval=60) as client:
+        client.on("on_retry")(lambda info: retries.append(info.base_url))
+        _wait_for(lambda: all(node["latency"] is not None for node in client.endpoints.snapshot()))
+
+        _stop(second)
+        for _ in range(4):
+            assert client.get("/health")["status"] == "ok"
+
+        assert retries == [second.url]
+        assert _health(client.endpoints) == [True, False]
+
+
+def test_client_raises_when_every_node_is_down():
+    urls = [_dead_url(), _dead_url()]
+    errors = []
+    client = WhatsAppAPI(api_key="test-key", base_url=urls, max_retries=3, backoff=Backoff(base=0.01))
+    client.on("on_error")(errors.append)
+    try:
+        with pytest.raises(WhatsAppAPIError, match="Connection error"):
+            client.get("/health")
+    finally:
+        client.close()
+
+    assert len(errors) == 1
+    assert _health(client.endpoints) == [False, False]
+
+
+def test_async_health_checks(stubs):
+    stub = stubs()
+    endpoints = AsyncEndpoints([_dead_url(), stub.url], timeout=1)
+
+    async def check():
+        async with aiohttp.ClientSession() as session:
+            await endpoints.check(session)
+
+    asyncio.run(check())
+    assert _health(endpoints) == [False, True]
+    assert endpoints.current() == stub.url
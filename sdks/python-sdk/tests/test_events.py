@@ -0,0 +1,18 @@
+import asyncio
+
+from whatsapp_api import AsyncEventStream, StreamEvent
+
+
+def test_async_stream_is_created_outside_the_event_loop():
+    stream = AsyncEventStream("http://127.0.0.1:1", "token", buffer_size=2)
+    assert stream._queue is None
+
+    async def consume():
+        for index in range(3):
+            stream._put(StreamEvent("message:received", index))
+        stream._put(None)
+        return [event.data async for event in stream]
+
+    # The oldest events are dropped once the buffer is full
+    assert asyncio.run(consume()) == [2]
+    assert stream.dropped == 2
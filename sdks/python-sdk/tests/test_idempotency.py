@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+
+import whatsapp_api.client
+from whatsapp_api import AsyncWhatsAppAPI
+from whatsapp_api.idempotency import in_progress_delay
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def test_in_progress_delay():
+    assert in_progress_delay(409, {"Retry-After": "1"}) == 1.0
+    assert in_progress_delay(409, {}) is None
+    assert in_progress_delay(429, {"Retry-After": "1"}) is None
+
+
+def test_retry_reuses_key(client, stub):
+    stub.rate_429 = 0.5
+    first = client.messages.send_text(SESSION_ID, "15550001111", "Hello", idempotency_key="key-1")
+    again = client.messages.send_text(SESSION_ID, "15550001111", "Hello", idempotency_key="key-1")
+
+    assert first["idempotency_key"] == "key-1"
+    assert again["data"]["id"] == first["data"]["id"]
+    assert list(stub.sent) == ["key-1"]
+
+
+def test_in_progress_conflict_is_retried(client, stub):
+    stub.conflicts = 2
+    result = client.messages.send_text(SESSION_ID, "15550001111", "Hello", idempotency_key="key-2")
+
+    assert result["success"]
+    assert stub.conflicts == 0
+    assert list(stub.sent) == ["key-2"]
+
+
+def test_async_in_progress_conflict_is_retried(stub):
+    stub.conflicts = 1
+
+    async def send():
+        async with AsyncWhatsAppAPI(api_key="test-key", base_url=stub.url) as client:
+            return await client.messages.send_text(SESSION_ID, "15550001111", "Hello", idempotency_key="key-3")
+
+    assert asyncio.run(send())["success"]
+    assert list(stub.sent) == ["key-3"]
+
+
+def test_concurrent_first_hedges_share_one_executor(client, stub, monkeypatch):
+    created = []
+
+    class CountingExecutor(whatsapp_api.client.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            # Widen the window in which other threads could see no executor
+            time.sleep(0.05)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(whatsapp_api.client, "ThreadPoolExecutor", CountingExecutor)
+    barrier = threading.Barrier(8)
+
+    def send():
+        barrier.wait()
+        client.messages.send_text(SESSION_ID, "15550001111", "Hello", hedge_after=1)
+
+    threads = [threading.Thread(target=send) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert len(created) == 1
+    assert created[0]._shutdown
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from whatsapp_api import AsyncWhatsAppAPI, ValidationError
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def test_sends_pass_route_validation(client):
+    assert client.messages.send_text(SESSION_ID, "15550001111", "Hello")["success"]
+    assert client.messages.send_location(SESSION_ID, "15550001111", 52.37, 4.89, name="Dam")["success"]
+    assert client.messages.send_media(
+        SESSION_ID, "15550001111", media_url="https://example.com/a.jpg", media_type="image"
+    )["success"]
+
+
+def test_stub_rejects_unknown_field_names(client):
+    with pytest.raises(ValidationError):
+        client.post("/messages/media", data={
+            "sessionId": SESSION_ID, "to": "15550001111", "type": "image", "mediaUrl": "https://example.com/a.jpg",
+        })
+
+
+def test_media_upload_is_streamed(client):
+    result = client.messages.send_media(SESSION_ID, "15550001111", file_path=b"x" * 100000, media_type="image")
+    assert result["data"]["received_bytes"] > 100000
+
+
+def test_bulk_dispatches_by_payload(client, stub):
+    stats = client.messages.broadcast(SESSION_ID, [
+        "15550001111",
+        {"to": "15550002222", "message": "Hi"},
+        {"to": "15550003333", "latitude": 1.0, "longitude": 2.0},
+        {"to": "15550004444", "media_url": "https://example.com/a.jpg", "media_type": "image"},
+    ], "Hello")
+
+    assert stats.succeeded == 4 and stats.failed == 0
+
+
+def test_async_sends_pass_route_validation(stub):
+    async def send():
+        async with AsyncWhatsAppAPI(api_key="test-key", base_url=stub.url) as client:
+            return await asyncio.gather(
+                client.messages.send_text(SESSION_ID, "15550001111", "Hello"),
+                client.messages.send_location(SESSION_ID, "15550001111", 52.37, 4.89),
+                client.messages.send_media(
+                    SESSION_ID, "15550001111", media_url="https://example.com/a.jpg", media_type="image"
+                ),
+            )
+
+    assert all(result["success"] for result in asyncio.run(send()))
@@ -0,0 +1,89 @@
+import pytest
+
+from whatsapp_api import MetricsCollector, NotFoundError, WhatsAppAPI
+from whatsapp_api.hooks import Hooks, RequestInfo
+from whatsapp_api.metrics import _Histogram, route
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected",
+    [
+        ("/messages/123/status", "/messages/:id/status"),
+        ("/messages/0b6a8e1c-2f4d-4c3a-9b1e-7d5f6a8c9e0b/status?x=1", "/messages/:id/status"),
+        ("contacts/5f1b2c3d4e5f6a7b8c9d0e1f/", "/contacts/:id"),
+        ("/sessions/my-session", "/sessions/my-session"),
+        ("/webhooks/abc123/logs", "/webhooks/abc123/logs"),
+        ("/contacts", "/contacts"),
+    ],
+)
+def test_route_masks_ids(endpoint, expected):
+    assert route(endpoint) == expected
+
+
+def test_histogram_quantile_interpolates_within_buckets():
+    histogram = _Histogram((1, 2, 4))
+    assert histogram.quantile(0.5) is None
+
+    for value in (0.5, 1.5, 1.5, 2):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 3, 0, 0]
+    assert [histogram.quantile(q) for q in (0.25, 0.5, 1)] == pytest.approx([1, 1 + 1 / 3, 2])
+
+    # Past the last bound the estimate is capped at it
+    for _ in range(4):
+        histogram.observe(10)
+    assert histogram.quantile(0.99) == 4
+
+
+def _response(method, endpoint, status_code, elapsed):
+    info = RequestInfo(method, endpoint, 0)
+    info.status_code = status_code
+    info.elapsed = elapsed
+    info.request_bytes = 10
+    info.response_bytes = 100
+    return info
+
+
+def test_prometheus_buckets_are_cumulative():
+    metrics = MetricsCollector(buckets=(0.1, 1))
+    hooks = Hooks()
+    metrics.attach(hooks)
+    for elapsed in (0.05, 0.5, 0.5, 5):
+        hooks.emit("after_response", _response("GET", "/messages/1/status", 200, elapsed))
+    hooks.emit("after_response", _response("GET", "/messages/2/status", 404, 0.05))
+
+    lines = metrics.prometheus().splitlines()
+    labels = 'method="GET",route="/messages/:id/status"'
+    buckets = [line for line in lines if line.startswith("whatsapp_api_request_duration_seconds_bucket")]
+
+    assert buckets == [
+        f'whatsapp_api_request_duration_seconds_bucket{{{labels},le="0.1"}} 2',
+        f'whatsapp_api_request_duration_seconds_bucket{{{labels},le="1.0"}} 4',
+        f'whatsapp_api_request_duration_seconds_bucket{{{labels},le="+Inf"}} 5',
+    ]
+    assert f"whatsapp_api_request_duration_seconds_count{{{labels}}} 5" in lines
+    assert f'whatsapp_api_requests_total{{{labels},status="200"}} 4' in lines
+    assert f'whatsapp_api_requests_total{{{labels},status="404"}} 1' in lines
+    assert f"whatsapp_api_response_bytes_total{{{labels}}} 500" in lines
+    assert lines[:2] == [
+        "# HELP whatsapp_api_requests_total Request attempts by response status",
+        "# TYPE whatsapp_api_requests_total counter",
+    ]
+
+
+def test_collects_from_a_client(stub):
+    metrics = MetricsCollector()
+    with WhatsAppAPI(api_key="test-key", base_url=stub.url, metrics=metrics) as client:
+        for index in range(1, 4):
+            client.get(f"/messages/{index}/status")
+        with pytest.raises(NotFoundError):
+            client.get("/unknown")
+
+    snapshot = metrics.snapshot()
+    assert set(snapshot) == {"GET /messages/:id/status", "GET /unknown"}
+    status = snapshot["GET /messages/:id/status"]
+    assert (status["responses"], status["statuses"], status["errors"]) == (3, {200: 3}, {})
+    assert status["latency"]["p50"] is not None
+    assert snapshot["GET /unknown"]["errors"] == {"NotFoundError": 1}
+    assert metrics.percentile("GET", "/messages/99/status", 0.5) == status["latency"]["p50"]
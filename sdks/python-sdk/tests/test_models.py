@@ -0,0 +1,78 @@
+import pytest
+
+from whatsapp_api.models import Contact, Message, RecordList
+
+MESSAGE = {
+    "id": "m1",
+    "session_id": "session-1",
+    "direction": "outgoing",
+    "from": "15550000001",
+    "to": "15550000002",
+    "type": "text",
+    "content": "Hello",
+    "status": "sent",
+    "created_at": "2024-01-01T00:00:00.000Z",
+    "reactions": [{"emoji": "+1"}],
+}
+
+
+def _contacts(count):
+    return [{"id": f"c{index}", "session_id": "session-1", "phone_number": f"1555000000{index}"} for index in range(count)]
+
+
+def test_record_round_trip_keeps_unknown_keys():
+    message = Message.from_dict(MESSAGE)
+
+    assert message.extra == {"reactions": [{"emoji": "+1"}]}
+    assert message.content == "Hello" and message.read_at is None
+    data = message.to_dict()
+    assert {key: value for key, value in data.items() if value is not None} == MESSAGE
+    assert Message.from_dict(data) == message
+    assert Message.from_dict({**MESSAGE, "reactions": []}) != message
+
+
+def test_record_without_unknown_keys_has_no_extra():
+    assert Contact.from_dict(_contacts(1)[0]).extra is None
+
+
+def test_message_from_():
+    assert Message.from_dict(MESSAGE).from_ == "15550000001"
+    assert Message.from_dict({"id": "m2"}).from_ is None
+
+
+def test_interned_fields_share_one_string():
+    first, second = (Message.from_dict(dict(MESSAGE, session_id="".join(["session-", "1"]))) for _ in range(2))
+
+    assert first.session_id is second.session_id
+    assert first.status is second.status
+
+
+def test_record_list_indexes_and_slices():
+    contacts = RecordList(Contact, _contacts(5))
+
+    assert len(contacts) == 5
+    assert contacts[0].id == "c0"
+    assert contacts[-1].id == "c4"
+    assert contacts[-5].id == "c0"
+    for index in (5, -6):
+        with pytest.raises(IndexError):
+            contacts[index]
+
+    sliced = contacts[1:4]
+    assert isinstance(sliced, RecordList) and len(sliced) == 3
+    assert [contact.id for contact in sliced] == ["c1", "c2", "c3"]
+    assert [contact.id for contact in contacts[::-2]] == ["c4", "c2", "c0"]
+    assert sliced[-1].phone_number == "15550000003"
+    assert len(contacts[10:]) == 0
+
+
+def test_record_list_columns():
+    contacts = RecordList(Contact, _contacts(3))
+    contacts.append(Contact.from_dict({"id": "c3", "phone_number": "15550000003", "source": "import"}))
+
+    assert contacts.column("phone_number") == [f"1555000000{index}" for index in range(4)]
+    assert contacts.column("name") == [None] * 4
+    assert contacts[3].extra == {"source": "import"}
+    assert contacts.to_dicts()[3]["source"] == "import"
+    with pytest.raises(KeyError, match="Contact has no field 'source'"):
+        contacts.column("source")
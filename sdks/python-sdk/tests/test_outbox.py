@@ -0,0 +1,100 @@
+import threading
+import time
+
+from whatsapp_api import Outbox
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+PHONES = [f"1555000{index:04d}" for index in range(25)]
+
+
+def test_queued_sends_survive_restart(client, stub, tmp_path):
+    path = str(tmp_path / "outbox.db")
+    with Outbox(client, path, batch_size=10) as outbox:
+        for phone in PHONES:
+            outbox.enqueue(SESSION_ID, phone, "Hello")
+    # Closing flushed the sends still buffered
+
+    with Outbox(client, path) as outbox:
+        assert outbox.counts()["pending"] == len(PHONES)
+        stats = outbox.drain()
+        entries = outbox.entries()
+
+    assert stats.succeeded == len(PHONES)
+    assert all(entry["state"] == "sent" and entry["message_id"] for entry in entries)
+    assert sorted(stub.sent) == sorted(entry["idempotency_key"] for entry in entries)
+
+
+def test_sends_claimed_before_a_crash_are_resent_with_their_key(client, stub, tmp_path):
+    path = str(tmp_path / "outbox.db")
+    crashed = Outbox(client, path, batch_size=10)
+    crashed.enqueue_many(SESSION_ID, PHONES, "Hello")
+    claimed = crashed._claim(10)
+    assert len(claimed) == 10
+    crashed.close()
+    time.sleep(0.6)
+
+    with Outbox(client, path, lease=0.5) as outbox:
+        stats = outbox.drain()
+        entries = outbox.entries()
+
+    assert stats.succeeded == len(PHONES)
+    assert [entry["attempts"] for entry in entries[:10]] == [2] * 10
+    assert sorted(stub.sent) == sorted(entry["idempotency_key"] for entry in entries)
+
+
+def test_stop_during_run_is_not_lost(client, tmp_path):
+    outbox = Outbox(client, str(tmp_path / "outbox.db"))
+    flush = outbox.flush
+
+    def flush_then_stop():
+        # Stop right as a drain pass starts
+        flush()
+        outbox.stop()
+
+    outbox.flush = flush_then_stop
+    runner = threading.Thread(target=outbox.run, kwargs={"poll_interval": 0.01}, daemon=True)
+    runner.start()
+    runner.join(2)
+
+    assert not runner.is_alive()
+    outbox.close()
+
+
+def test_claims_only_what_is_in_flight(client, tmp_path):
+    outbox = Outbox(client, str(tmp_path / "outbox.db"), concurrency=2)
+    outbox.enqueue_many(SESSION_ID, PHONES, "Hello")
+    claim = outbox._claim
+    claims = []
+
+    def recording_claim(limit):
+        rows = claim(limit)
+        claims.append(len(rows))
+        return rows
+
+    outbox._claim = recording_claim
+    stats = outbox.drain()
+    outbox.close()
+
+    assert stats.succeeded == len(PHONES)
+    assert max(claims) == 4 and sum(claims) == len(PHONES)
+
+
+def test_stop_releases_claimed_sends_not_attempted(client, tmp_path):
+    outbox = Outbox(client, str(tmp_path / "outbox.db"), concurrency=1)
+    outbox.enqueue_many(SESSION_ID, PHONES, "Hello")
+    send = outbox._send
+
+    def send_then_stop(row):
+        outbox.stop()
+        return send(row)
+
+    outbox._send = send_then_stop
+    stats = outbox.drain()
+    counts = outbox.counts()
+    pending = outbox.entries(state="pending")
+    outbox.close()
+
+    assert counts["sending"] == 0
+    assert counts["sent"] == stats.succeeded < len(PHONES)
+    assert counts["pending"] == len(PHONES) - stats.succeeded
+    assert {entry["attempts"] for entry in pending} == {0}
@@ -0,0 +1,92 @@
+import asyncio
+import random
+import threading
+import time
+
+from stub_server import SESSION_ID
+
+from whatsapp_api import AsyncWhatsAppAPI, Message, RecordList
+from whatsapp_api.pagination import Paginator
+
+TOTAL = 250
+LIMIT = 20
+
+
+def _page(page, limit=LIMIT, total=TOTAL):
+    start = (page - 1) * limit
+    items = [{"id": str(index)} for index in range(start, min(start + limit, total))]
+    return {"data": {"items": items, "pagination": {"page": page, "limit": limit, "total": total}}}
+
+
+def test_prefetch_keeps_page_order():
+    rng = random.Random(1)
+    lock = threading.Lock()
+
+    def fetch(page):
+        with lock:
+            delay = rng.uniform(0, 0.01)
+        time.sleep(delay)
+        return _page(page)
+
+    paginator = Paginator(fetch, "items", LIMIT, concurrency=4)
+    assert [item["id"] for item in paginator] == [str(index) for index in range(TOTAL)]
+    assert paginator.total == TOTAL
+
+
+def test_prefetch_stays_one_page_ahead_without_total():
+    fetched = []
+
+    def fetch(page):
+        fetched.append(page)
+        response = _page(page)
+        del response["data"]["pagination"]
+        return response
+
+    pages = Paginator(fetch, "items", LIMIT).pages()
+    next(pages)
+    next(pages)
+    time.sleep(0.05)
+    assert fetched == [1, 2, 3]
+    pages.close()
+
+
+def test_stops_on_short_page_without_total():
+    fetched = []
+
+    def fetch(page):
+        fetched.append(page)
+        return {"data": {"items": _page(page)["data"]["items"]}}
+
+    assert len(list(Paginator(fetch, "items", LIMIT, prefetch=False))) == TOTAL
+    assert fetched == list(range(1, TOTAL // LIMIT + 2))
+
+
+def test_async_prefetch_keeps_page_order():
+    async def fetch(page):
+        await asyncio.sleep(random.uniform(0, 0.005))
+        return _page(page)
+
+    async def collect():
+        return [item["id"] async for item in Paginator(fetch, "items", LIMIT, concurrency=4)]
+
+    assert asyncio.run(collect()) == [str(index) for index in range(TOTAL)]
+
+
+def test_iter_all_filters_by_session(client, stub):
+    stub.messages = 120
+    messages = client.messages.iter_all(session_id=SESSION_ID, limit=50).collect()
+
+    assert isinstance(messages, RecordList) and messages.model is Message
+    assert len(messages) == 120
+    assert list(client.messages.iter_all(session_id="other-session")) == []
+
+
+def test_async_iter_all_filters_by_session(stub):
+    stub.messages = 30
+
+    async def collect(session_id):
+        async with AsyncWhatsAppAPI(api_key="test-key", base_url=stub.url) as client:
+            return await client.messages.iter_all(session_id=session_id, limit=10, concurrency=3).acollect()
+
+    assert len(asyncio.run(collect(SESSION_ID))) == 30
+    assert len(asyncio.run(collect("other-session"))) == 0
@@ -0,0 +1,54 @@
+import pytest
+
+from whatsapp_api import normalize_phone, normalize_phones
+
+VALUES = [
+    "+31 6 1234 5678",
+    "0031612345678",
+    "06-1234-5678",
+    "(020) 123.4567",
+    "612345678",
+    "31612345678",
+    4915112345678,
+    "  +1 (555) 000-1111 ",
+    "120363000000000000@g.us",
+    "abc",
+    "",
+    None,
+    "12",
+    "+0612345678",
+    "1234567890123456",
+]
+
+
+@pytest.mark.parametrize("values", [VALUES, VALUES + ["+31 6\n1234 5678"]])
+def test_column_matches_single_numbers(values):
+    result = normalize_phones(values, default_country_code="31")
+
+    expected = [normalize_phone(value, "31") for value in values]
+    numbers = []
+    for number in expected:
+        if number is not None and number not in numbers:
+            numbers.append(number)
+    assert result.numbers == numbers
+    assert [position for position, _ in result.invalid] == [
+        position for position, number in enumerate(expected) if number is None
+    ]
+    assert [values[position] for position in result.positions] == [
+        values[expected.index(number)] for number in numbers
+    ]
+
+
+def test_reports_duplicates_and_invalid_values():
+    result = normalize_phones(["+31 6 1234 5678", "06 12345678", "x", "+1 555 000 1111"], 31)
+
+    assert list(result) == ["31612345678", "15550001111"]
+    assert result.positions == [0, 3]
+    assert result.duplicates == [(1, "31612345678")]
+    assert result.invalid == [(2, "x")]
+
+
+def test_national_numbers_need_a_country_code():
+    assert normalize_phone("0612345678") is None
+    assert normalize_phone("0612345678", "+31") == "31612345678"
+    assert normalize_phone("31612345678", 31) == "31612345678"
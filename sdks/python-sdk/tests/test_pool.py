@@ -0,0 +1,158 @@
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from whatsapp_api import AsyncSessionPool, SessionPool
+from whatsapp_api.exceptions import NotFoundError, ValidationError, WhatsAppAPIError
+
+
+class FakeSessions:
+    def __init__(self, *session_ids):
+        self.connected = list(session_ids)
+        self.loads = 0
+
+    def iter_all(self, status=None):
+        self.loads += 1
+        return [{"id": session_id, "status": "connected"} for session_id in self.connected]
+
+
+class FakeMessages:
+    """Sends succeed unless the session has an error queued in ``errors``"""
+
+    def __init__(self):
+        self.errors = {}
+        self.sent = []
+
+    def send_text(self, session_id, to, message, **kwargs):
+        error = self.errors.get(session_id)
+        if error is not None:
+            raise error
+        self.sent.append(session_id)
+        return {"success": True, "session_id": session_id}
+
+
+class FakeClient:
+    def __init__(self, *session_ids):
+        self.sessions = FakeSessions(*session_ids)
+        self.messages = FakeMessages()
+
+
+def _in_flight(pool):
+    return {session_id: state["in_flight"] for session_id, state in pool.snapshot().items()}
+
+
+def test_round_robin_interleaves_by_weight():
+    pool = SessionPool(FakeClient("a", "b"), strategy="round_robin", weights={"a": 3}, sticky=False)
+    chosen = []
+    for _ in range(8):
+        chosen.append(pool.acquire())
+        pool.release(chosen[-1])
+
+    assert chosen == ["a", "a", "b", "a"] * 2
+
+
+def test_least_in_flight_balances_by_weight():
+    pool = SessionPool(FakeClient("a", "b"), weights={"a": 2}, sticky=False)
+
+    held = Counter(pool.acquire() for _ in range(6))
+
+    assert held == {"a": 4, "b": 2}
+    assert _in_flight(pool) == {"a": 4, "b": 2}
+
+
+def test_sticky_keeps_a_recipient_on_its_session():
+    pool = SessionPool(FakeClient("a", "b"), strategy="round_robin", sticky=True)
+
+    assert [pool.send_text("15550000001", "Hi")["session_id"] for _ in range(3)] == ["a"] * 3
+    assert pool.send_text("15550000002", "Hi")["session_id"] == "b"
+
+
+def test_session_down_is_ejected_and_the_send_fails_over():
+    client = FakeClient("a", "b")
+    client.messages.errors["a"] = NotFoundError("Session not found", 404)
+    pool = SessionPool(client, strategy="round_robin", sticky=False)
+
+    assert pool.send_text("15550000001", "Hi")["session_id"] == "b"
+    assert pool.sessions == ["b"]
+    assert pool.snapshot()["a"]["failed"] == 1
+    assert [pool.send_text("15550000001", "Hi")["session_id"] for _ in range(3)] == ["b"] * 3
+
+    # Seen connected again on the next refresh
+    del client.messages.errors["a"]
+    pool.refresh()
+    assert pool.sessions == ["a", "b"]
+    assert {pool.send_text("15550000001", "Hi")["session_id"] for _ in range(4)} == {"a", "b"}
+
+
+def test_status_events_eject_and_readmit_sessions():
+    pool = SessionPool(FakeClient("a", "b"), refresh_interval=None)
+    pool.refresh()
+
+    pool._on_status(SimpleNamespace(session_id="a", data={"status": "disconnected"}))
+    assert pool.sessions == ["b"]
+    pool._on_status(SimpleNamespace(session_id="a", data={"status": "connected"}))
+    assert pool.sessions == ["a", "b"]
+
+
+def test_every_session_down_raises():
+    client = FakeClient("a", "b")
+    client.messages.errors = {"a": NotFoundError("Session not found", 404), "b": NotFoundError("gone", 404)}
+    pool = SessionPool(client)
+
+    with pytest.raises(NotFoundError):
+        pool.send_text("15550000001", "Hi")
+    assert pool.sessions == []
+    assert _in_flight(pool) == {"a": 0, "b": 0}
+
+    # The session list is reloaded once before giving up
+    loads = client.sessions.loads
+    client.sessions.connected = []
+    with pytest.raises(WhatsAppAPIError, match="No connected session"):
+        pool.acquire()
+    assert client.sessions.loads == loads + 1
+
+
+def test_failed_sends_release_their_slot():
+    client = FakeClient("a")
+    client.messages.errors["a"] = ValidationError("Invalid phone number", 400)
+    pool = SessionPool(client, max_in_flight=1)
+
+    for _ in range(3):
+        with pytest.raises(ValidationError):
+            pool.send_text("15550000001", "Hi")
+
+    # Not a session error: the session stays in rotation, with nothing in flight
+    assert pool.snapshot()["a"] == {"active": True, "weight": 1, "in_flight": 0, "sent": 0, "failed": 3}
+    assert pool.acquire(timeout=0.1) == "a"
+    with pytest.raises(WhatsAppAPIError, match="Timed out"):
+        pool.acquire(timeout=0.1)
+
+
+def test_async_failed_sends_release_their_slot():
+    class AsyncFakeSessions(FakeSessions):
+        async def iter_all(self, status=None):
+            for session in super().iter_all(status):
+                yield session
+
+    class AsyncFakeMessages(FakeMessages):
+        async def send_text(self, session_id, to, message, **kwargs):
+            await asyncio.sleep(0)
+            return super().send_text(session_id, to, message, **kwargs)
+
+    client = FakeClient()
+    client.sessions = AsyncFakeSessions("a", "b")
+    client.messages = AsyncFakeMessages()
+    client.messages.errors["a"] = NotFoundError("Session not found", 404)
+
+    async def run():
+        pool = AsyncSessionPool(client, strategy="round_robin", sticky=False, max_in_flight=1)
+        sends = [pool.send_text(f"1555000000{index}", "Hi") for index in range(6)]
+        return pool, await asyncio.gather(*sends)
+
+    pool, results = asyncio.run(run())
+    assert [result["session_id"] for result in results] == ["b"] * 6
+    assert pool.sessions == ["b"]
+    assert _in_flight(pool) == {"a": 0, "b": 0}
+    assert client.messages.sent == ["b"] * 6
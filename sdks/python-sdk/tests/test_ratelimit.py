@@ -0,0 +1,115 @@
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+from whatsapp_api import RateLimiter
+
+
+def _headers(limit, remaining, reset, **extra):
+    return {"RateLimit-Limit": str(limit), "RateLimit-Remaining": str(remaining), "RateLimit-Reset": str(reset), **extra}
+
+
+def test_no_pacing_before_the_server_reports_a_limit():
+    limiter = RateLimiter(burst=1)
+    assert [limiter.reserve("/messages/send") for _ in range(20)] == [0.0] * 20
+    assert limiter.update("/messages/send", 200, {}) is None
+
+
+def test_paces_at_the_reported_rate_after_the_burst():
+    limiter = RateLimiter(burst=2)
+    limiter.update("/messages/send", 200, _headers(10, 50, 1))
+
+    waits = [limiter.reserve("/messages/send") for _ in range(5)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == pytest.approx([0.1, 0.2, 0.3], abs=0.02)
+
+
+def test_policy_header_sets_the_window():
+    limiter = RateLimiter(burst=1)
+    limiter.update("/contacts", 200, _headers(100, 50, 5, **{"RateLimit-Policy": "100;w=10"}))
+
+    limiter.reserve("/contacts")
+    assert limiter.reserve("/contacts") == pytest.approx(0.1, abs=0.02)
+
+
+def test_exhausted_limit_holds_until_reset():
+    limiter = RateLimiter()
+    limiter.update("/messages/send", 200, _headers(10, 0, 0.3))
+
+    # The reset, then one interval at 10 requests per 0.3s, since no tokens are left
+    assert limiter.reserve("/messages/send") == pytest.approx(0.33, abs=0.02)
+
+
+def test_429_holds_for_retry_after():
+    limiter = RateLimiter()
+    delay = limiter.update("/messages/send", 429, {"Retry-After": "0.4"})
+
+    assert delay == 0.4
+    assert limiter.reserve("/messages/send") == pytest.approx(0.4, abs=0.02)
+
+
+def test_retry_after_http_date():
+    limiter = RateLimiter()
+    # HTTP dates have whole seconds, so the delay is 2-3 seconds
+    delay = limiter.update("/messages/send", 429, {"Retry-After": formatdate(time.time() + 3, usegmt=True)})
+
+    assert 2 <= delay <= 3
+    assert limiter.reserve("/messages/send") == pytest.approx(delay, abs=0.02)
+
+
+def test_429_without_retry_after_uses_the_reset():
+    limiter = RateLimiter()
+    reset_ms = int((time.time() + 0.5) * 1000)
+    delay = limiter.update("/messages/send", 429, {"X-RateLimit-Reset": str(reset_ms)})
+
+    assert delay == pytest.approx(0.5, abs=0.05)
+
+
+def test_scopes_are_separate():
+    limiter = RateLimiter()
+    limiter.update("/messages/send", 429, {"Retry-After": "5"})
+
+    assert limiter.reserve("/messages/abc/status") > 4
+    assert limiter.reserve("/contacts") == 0.0
+    assert limiter.reserve("/groups?page=2") == 0.0
+
+
+def test_garbage_headers_are_ignored():
+    limiter = RateLimiter(burst=1)
+    garbage = {
+        "RateLimit-Limit": "lots",
+        "RateLimit-Remaining": "-",
+        "RateLimit-Reset": "soon",
+        "RateLimit-Policy": "100;w=never",
+        "Retry-After": "Someday",
+    }
+
+    assert limiter.update("/messages/send", 429, garbage) is None
+    assert [limiter.reserve("/messages/send") for _ in range(5)] == [0.0] * 5
+
+
+def test_acquire_paces_threads_together():
+    limiter = RateLimiter(burst=1)
+    limiter.update("/messages/send", 200, _headers(50, 50, 1))
+    sent = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(5):
+            limiter.acquire("/messages/send")
+            with lock:
+                sent.append(time.monotonic())
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 20 requests at 50/s, the first free: 19 intervals of 20ms
+    assert time.monotonic() - start >= 0.37
+    gaps = [b - a for a, b in zip(sorted(sent), sorted(sent)[1:])]
+    assert sum(gaps) / len(gaps) == pytest.approx(0.02, abs=0.005)
@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import hmac
+import io
+import json
+import threading
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+import requests
+
+from whatsapp_api import WebhookReceiver
+
+SECRET = "whsec"
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def _delivery(event="message:received", data=None, secret=SECRET):
+    body = json.dumps({"event": event, "timestamp": "2024-01-01T00:00:00.000Z", "data": data or {}}).encode()
+    signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return body, {"x-webhook-signature": signature, "x-webhook-event": event, "x-webhook-id": "wh-1"}
+
+
+def test_coroutine_handlers_share_the_worker_loop():
+    receiver = WebhookReceiver(SECRET, workers=1)
+    loops = []
+
+    @receiver.on()
+    async def handler(event):
+        await asyncio.sleep(0)
+        loops.append(asyncio.get_running_loop())
+
+    for index in range(3):
+        assert receiver.handle(*_delivery(data={"index": index}))[0] == 200
+    receiver.stop(timeout=5)
+
+    assert len(loops) == 3 and len(set(map(id, loops))) == 1
+    assert loops[0].is_closed()
+
+
+def _wsgi(receiver, body, headers, **environ):
+    environ.setdefault("CONTENT_LENGTH", str(len(body)))
+    environ.update({
+        "REQUEST_METHOD": "POST",
+        "wsgi.input": io.BytesIO(body),
+        **{"HTTP_" + name.upper().replace("-", "_"): value for name, value in headers.items()},
+    })
+    statuses = []
+    response = b"".join(receiver.wsgi_app(environ, lambda status, headers: statuses.append(status)))
+    return int(statuses[0].split()[0]), json.loads(response)
+
+
+def test_wsgi_reads_chunked_body_to_the_end():
+    receiver = WebhookReceiver(SECRET)
+    received = []
+    receiver.on()(received.append)
+    body, headers = _delivery()
+
+    status, _ = _wsgi(receiver, body, headers, CONTENT_LENGTH="", **{"wsgi.input_terminated": True})
+    receiver.stop(timeout=5)
+
+    assert status == 200 and len(received) == 1
+
+
+def test_wsgi_requires_a_length_it_cannot_read_to():
+    receiver = WebhookReceiver(SECRET)
+    body, headers = _delivery()
+
+    assert _wsgi(receiver, body, headers, CONTENT_LENGTH="") == (411, {"error": "Content-Length required"})
+    assert _wsgi(receiver, body, headers, CONTENT_LENGTH="ten")[0] == 400
+
+
+def test_wsgi_rejects_oversized_bodies():
+    receiver = WebhookReceiver(SECRET, max_body_size=10)
+    body, headers = _delivery()
+
+    assert _wsgi(receiver, body, headers)[0] == 413
+    assert _wsgi(receiver, body, headers, CONTENT_LENGTH="", **{"wsgi.input_terminated": True})[0] == 413
+
+
+def _collecting(receiver, event="*"):
+    received = []
+    receiver.add_handler(event, received.append)
+    return received
+
+
+def test_signed_delivery_reaches_handler():
+    receiver = WebhookReceiver(SECRET)
+    received = _collecting(receiver)
+
+    assert receiver.handle(*_delivery(data={"id": "m1"})) == (200, {"received": True})
+    receiver.stop(timeout=5)
+
+    (event,) = received
+    assert (event.event, event.data, event.webhook_id) == ("message:received", {"id": "m1"}, "wh-1")
+
+
+def test_unverified_deliveries_are_rejected():
+    receiver = WebhookReceiver(SECRET)
+    received = _collecting(receiver)
+    body, headers = _delivery()
+
+    tampered = body.replace(b"message:received", b"message:deleted!")
+    assert receiver.handle(tampered, headers)[0] == 401
+    assert receiver.handle(body, {**headers, "x-webhook-signature": ""})[0] == 401
+    assert receiver.handle(body, {"x-webhook-event": "message:received"})[0] == 401
+    assert receiver.handle(*_delivery(secret="other-secret"))[0] == 401
+    receiver.stop(timeout=5)
+
+    assert received == []
+
+
+def test_routes_by_event_name_and_wildcard():
+    receiver = WebhookReceiver(SECRET)
+    messages = _collecting(receiver, "message:received")
+    sessions = _collecting(receiver, "session:status")
+    everything = _collecting(receiver)
+
+    for event in ("message:received", "session:status", "group:updated"):
+        receiver.handle(*_delivery(event))
+    receiver.stop(timeout=5)
+
+    assert [event.event for event in messages] == ["message:received"]
+    assert [event.event for event in sessions] == ["session:status"]
+    assert sorted(event.event for event in everything) == ["group:updated", "message:received", "session:status"]
+
+
+def test_full_queue_answers_503():
+    receiver = WebhookReceiver(SECRET, workers=1, queue_size=1)
+    started = threading.Event()
+    release = threading.Event()
+    handled = []
+
+    @receiver.on()
+    def slow(event):
+        started.set()
+        release.wait(5)
+        handled.append(event.data["index"])
+
+    assert receiver.handle(*_delivery(data={"index": 0}))[0] == 200
+    assert started.wait(5)
+    assert receiver.handle(*_delivery(data={"index": 1}))[0] == 200
+    assert receiver.handle(*_delivery(data={"index": 2})) == (503, {"error": "Receiver busy"})
+    release.set()
+    receiver.stop(timeout=5)
+
+    assert handled == [0, 1]
+
+
+def test_wsgi_app_end_to_end():
+    receiver = WebhookReceiver(SECRET)
+    received = _collecting(receiver)
+    server = make_server("127.0.0.1", 0, receiver.wsgi_app, handler_class=_QuietHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/webhooks"
+    try:
+        body, headers = _delivery()
+        ok = requests.post(url, data=body, headers=headers)
+        forged = requests.post(url, data=body, headers={**headers, "x-webhook-signature": "0" * 64})
+        wrong_method = requests.get(url)
+    finally:
+        server.shutdown()
+        server.server_close()
+    receiver.stop(timeout=5)
+
+    assert (ok.status_code, ok.json()) == (200, {"received": True})
+    assert forged.status_code == 401
+    assert wrong_method.status_code == 405
+    assert len(received) == 1
+
+
+def _asgi(receiver, scope, messages):
+    sent = []
+    incoming = iter(messages)
+
+    async def receive():
+        return next(incoming)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(receiver.asgi_app(scope, receive, send))
+    return sent
+
+
+def _asgi_post(receiver, chunks, headers):
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(name.encode(), value.encode()) for name, value in headers.items()],
+    }
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+        for index, chunk in enumerate(chunks)
+    ]
+    start, body = _asgi(receiver, scope, messages)
+    return start["status"], json.loads(body["body"])
+
+
+def test_asgi_app_end_to_end():
+    receiver = WebhookReceiver(SECRET)
+    received = _collecting(receiver)
+    lifespan = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+
+    body, headers = _delivery()
+    assert _asgi_post(receiver, [body[:10], body[10:]], headers) == (200, {"received": True})
+    assert _asgi_post(receiver, [body + b" "], headers)[0] == 401
+    assert _asgi_post(WebhookReceiver(SECRET, max_body_size=10), [body], headers)[0] == 413
+
+    sent = _asgi(receiver, {"type": "lifespan"}, lifespan)
+    assert [message["type"] for message in sent] == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert len(received) == 1
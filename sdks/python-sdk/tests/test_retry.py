@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+
+from whatsapp_api import AsyncWhatsAppAPI, Backoff, CircuitBreaker, CircuitOpenError, RetryBudget, WhatsAppAPI
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+ENDPOINT = "/messages/send"
+
+
+def _half_open(breaker, endpoint=ENDPOINT):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(endpoint)
+    time.sleep(breaker.recovery_timeout + 0.01)
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+    breaker.record_failure(ENDPOINT)
+    breaker.record_failure(ENDPOINT)
+    breaker.record_success(ENDPOINT)
+    breaker.record_failure(ENDPOINT)
+    breaker.record_failure(ENDPOINT)
+    assert breaker.state(ENDPOINT) == "closed"
+
+    breaker.record_failure(ENDPOINT)
+    assert breaker.state(ENDPOINT) == "open"
+    assert not breaker.allow(ENDPOINT)
+    assert breaker.retry_in(ENDPOINT) > 59
+    assert breaker.snapshot()[ENDPOINT]["rejected"] == 1
+
+
+def test_circuits_are_per_endpoint():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure("/messages/media")
+    assert not breaker.allow("/messages/media")
+    assert breaker.allow(ENDPOINT)
+
+
+def test_half_open_probes_then_closes():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05, success_threshold=2)
+    _half_open(breaker)
+
+    assert breaker.allow(ENDPOINT)
+    assert breaker.state(ENDPOINT) == "half_open"
+    assert not breaker.allow(ENDPOINT)
+
+    breaker.record_success(ENDPOINT)
+    assert breaker.allow(ENDPOINT)
+    breaker.record_success(ENDPOINT)
+    assert breaker.state(ENDPOINT) == "closed"
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    _half_open(breaker)
+
+    assert breaker.allow(ENDPOINT)
+    breaker.record_failure(ENDPOINT)
+    assert breaker.state(ENDPOINT) == "open"
+    assert not breaker.allow(ENDPOINT)
+
+
+def test_release_gives_back_probe():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    _half_open(breaker)
+
+    assert breaker.allow(ENDPOINT)
+    assert not breaker.allow(ENDPOINT)
+    breaker.release(ENDPOINT)
+    assert breaker.allow(ENDPOINT)
+    assert breaker.state(ENDPOINT) == "half_open"
+
+
+def test_cancelled_probe_is_released(stub):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+
+    async def run():
+        async with AsyncWhatsAppAPI(api_key="test-key", base_url=stub.url, circuit_breaker=breaker) as client:
+            _half_open(breaker)
+            stub.latency = 0.5
+            probe = asyncio.ensure_future(client.messages.send_text(SESSION_ID, "15550001111", "Hello"))
+            await asyncio.sleep(0.1)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+            stub.latency = 0
+            return await client.messages.send_text(SESSION_ID, "15550001111", "Hello")
+
+    assert asyncio.run(run())["success"]
+    assert breaker.state(ENDPOINT) == "closed"
+
+
+def test_open_circuit_fails_fast(stub):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    breaker.record_failure(ENDPOINT)
+    with WhatsAppAPI(api_key="test-key", base_url=stub.url, circuit_breaker=breaker) as client:
+        with pytest.raises(CircuitOpenError):
+            client.messages.send_text(SESSION_ID, "15550001111", "Hello")
+    assert stub.sent == {}
+
+
+def test_retry_budget_caps_retries():
+    budget = RetryBudget(ratio=0.1, min_per_second=0, window=10)
+    for _ in range(20):
+        budget.record_request()
+    assert [budget.try_retry() for _ in range(3)] == [True, True, False]
+
+
+def test_backoff_stays_within_bounds():
+    backoff = Backoff(base=0.1, cap=1.0)
+    delay = None
+    for _ in range(50):
+        delay = backoff.next(delay)
+        assert 0.1 <= delay <= 1.0
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+
+import pytest
+
+from whatsapp_api import AsyncWhatsAppAPI, WhatsAppAPI
+from whatsapp_api.exceptions import NotFoundError
+
+CALLERS = 8
+STATUS = "/messages/00000000-0000-0000-0000-000000000001/status"
+
+
+def _concurrently(call, callers=CALLERS):
+    """Run ``call`` in threads released together; returns results or exceptions"""
+    barrier = threading.Barrier(callers)
+    outcomes = [None] * callers
+
+    def run(index):
+        barrier.wait()
+        try:
+            outcomes[index] = call()
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def _counting(client):
+    sent = []
+    client.on("after_response")(lambda info: sent.append(info.endpoint))
+    return sent
+
+
+def test_concurrent_reads_share_one_request(client, stub):
+    stub.latency = 0.2
+    sent = _counting(client)
+
+    results = _concurrently(lambda: client.get(STATUS))
+
+    assert sent == [STATUS]
+    assert all(result == results[0] for result in results)
+    assert results[0]["data"]["status"] == "delivered"
+    # Each caller gets its own copy
+    assert len({id(result) for result in results}) == CALLERS
+    assert client.single_flight.snapshot() == {"requests": 1, "coalesced": CALLERS - 1, "in_flight": 0}
+
+
+def test_errors_reach_every_waiter(client, stub):
+    stub.latency = 0.2
+    sent = _counting(client)
+
+    errors = _concurrently(lambda: client.get("/unknown"))
+
+    assert sent == ["/unknown"]
+    assert all(isinstance(error, NotFoundError) for error in errors)
+    # The next read is a new request
+    with pytest.raises(NotFoundError):
+        client.get("/unknown")
+    assert len(sent) == 2
+
+
+def test_coalescing_can_be_turned_off(stub):
+    stub.latency = 0.1
+    with WhatsAppAPI(api_key="test-key", base_url=stub.url, coalesce_reads=False) as client:
+        sent = _counting(client)
+        _concurrently(lambda: client.get(STATUS))
+
+    assert len(sent) == CALLERS
+
+
+def test_async_concurrent_reads_share_one_request(stub):
+    stub.latency = 0.2
+
+    async def read():
+        async with AsyncWhatsAppAPI(api_key="test-key", base_url=stub.url) as client:
+            sent = _counting(client)
+            results = await asyncio.gather(*(client.get(STATUS) for _ in range(CALLERS)))
+            errors = await asyncio.gather(*(client.get("/unknown") for _ in range(CALLERS)), return_exceptions=True)
+            return sent, results, errors
+
+    sent, results, errors = asyncio.run(read())
+    assert sent == [STATUS, "/unknown"]
+    assert all(result == results[0] for result in results)
+    assert all(isinstance(error, NotFoundError) for error in errors)
@@ -0,0 +1,36 @@
+import asyncio
+import uuid
+
+from stub_server import SESSION_ID
+
+from whatsapp_api import AsyncWhatsAppAPI
+
+MESSAGE_IDS = [str(uuid.UUID(int=index + 1)) for index in range(150)]
+
+
+def test_sweep_reads_the_session_message_list(client, stub):
+    stub.messages = 500
+    tracker = client.messages.track(MESSAGE_IDS, session_id=SESSION_ID)
+
+    assert set(tracker.wait()) == set(MESSAGE_IDS)
+    assert tracker.requests == 2
+
+
+def test_messages_missing_from_sweep_are_polled(client, stub):
+    tracker = client.messages.track(MESSAGE_IDS, session_id="other-session")
+
+    assert set(tracker.wait()) == set(MESSAGE_IDS)
+    assert tracker.requests == 1 + len(MESSAGE_IDS)
+
+
+def test_async_sweep_reads_the_session_message_list(stub):
+    stub.messages = 500
+
+    async def track():
+        async with AsyncWhatsAppAPI(api_key="test-key", base_url=stub.url) as client:
+            tracker = client.messages.track(MESSAGE_IDS, session_id=SESSION_ID)
+            return await tracker.wait(), tracker.requests
+
+    statuses, requests = asyncio.run(track())
+    assert set(statuses) == set(MESSAGE_IDS)
+    assert requests == 2
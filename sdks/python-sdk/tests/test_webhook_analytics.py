@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from whatsapp_api import WebhookAnalytics
+from whatsapp_api.webhook_analytics import _epochs, _percentile
+
+NOW = 1704110400.0  # 2024-01-01T12:00:00Z
+
+
+def _log(webhook_id, at, success=True, duration=100, event="message:received", status_code=200):
+    created_at = datetime.fromtimestamp(at, timezone.utc).isoformat(timespec="milliseconds")
+    return {
+        "webhook_id": webhook_id,
+        "event": event,
+        "status_code": status_code if success else 500,
+        "success": success,
+        "duration": duration,
+        "created_at": created_at.replace("+00:00", "Z"),
+    }
+
+
+def test_epochs_parse_both_timestamp_shapes():
+    timestamps = [
+        "2024-01-01T12:00:00.123Z",
+        "2024-01-01T12:00:00.900Z",
+        "2024-01-01T12:00:01.000Z",
+        "2024-01-01T12:00:00Z",
+        "2024-01-01T14:00:00.5+02:00",
+        None,
+        "",
+    ]
+
+    assert _epochs(timestamps) == pytest.approx([NOW + 0.123, NOW + 0.9, NOW + 1, NOW, NOW + 0.5, None, None])
+
+
+def test_percentile_of_one_and_two_values():
+    assert [_percentile([5.0], percentile) for percentile in (0, 50, 99, 100)] == [5.0] * 4
+    assert [_percentile([10.0, 20.0], percentile) for percentile in (0, 50, 90, 100)] == pytest.approx(
+        [10, 15, 19, 20]
+    )
+
+
+def test_latency_percentiles_by_group():
+    logs = [_log("a", NOW, duration=duration) for duration in (10, 20, 30, 40)]
+    logs += [_log("a", NOW, event="session:status", duration=5), _log("a", NOW, duration=None)]
+    analytics = WebhookAnalytics(logs)
+
+    latency = analytics.latency_percentiles(percentiles=(50, 100))
+    assert latency["message:received"] == {"count": 4, "mean": 25, "p50": 25, "p100": 40}
+    assert latency["session:status"]["count"] == 1
+    assert analytics.latency_percentiles(by=None)["all"]["count"] == 5
+
+
+def test_disable_risk_streaks_and_eta():
+    logs = [_log("a", NOW - 3500)]
+    logs += [_log("a", NOW - ago, success=False) for ago in (3000, 2000, 1000, 500)]
+    logs += [_log("b", NOW - 100 * index, success=False) for index in range(1, 7)]
+    logs += [_log("c", NOW - 7200, success=False), _log("c", NOW - 60)]
+    # Out of order: the streak follows the attempt times, not the list order
+    logs.reverse()
+    analytics = WebhookAnalytics(logs, retry_attempts=2)
+
+    risk = analytics.disable_risk(now=NOW)
+
+    assert risk["a"] == {
+        "consecutive_failures": 4,
+        "threshold": 6,
+        "remaining": 2,
+        "attempts": 5,
+        "failure_rate": 0.8,
+        "failures_per_hour": 4,
+        "last_success_at": pytest.approx(NOW - 3500),
+        "eta": 1800,
+    }
+    assert (risk["b"]["remaining"], risk["b"]["eta"], risk["b"]["last_success_at"]) == (0, 0.0, None)
+    # The failure two hours ago is before the horizon, and the streak is broken
+    assert (risk["c"]["consecutive_failures"], risk["c"]["attempts"], risk["c"]["eta"]) == (0, 1, None)
+
+    # The server default: disabled after 3 * 3 failures in a row
+    assert WebhookAnalytics(logs).disable_risk(now=NOW)["a"]["threshold"] == 9
+
+
+def test_failure_rates_per_window():
+    logs = [_log("a", NOW + offset, success=offset != 30) for offset in (0, 30, 59, 61)]
+    rates = WebhookAnalytics(logs).failure_rates(window=60)
+
+    assert [(rate["start"], rate["attempts"], rate["failures"]) for rate in rates] == [(NOW, 3, 1), (NOW + 60, 1, 0)]
+
+
+def test_status_codes_by_webhook():
+    logs = [_log("a", NOW), _log("a", NOW, success=False), _log("b", NOW)]
+    analytics = WebhookAnalytics(logs)
+
+    assert analytics.status_codes() == {200: 2, 500: 1}
+    assert analytics.status_codes(by="webhook_id") == {"a": {200: 1, 500: 1}, "b": {200: 1}}
+
+
+@pytest.mark.parametrize("method", ["latency_percentiles", "status_codes", "failure_rates"])
+def test_unknown_group_is_rejected(method):
+    analytics = WebhookAnalytics([_log("a", NOW)])
+
+    with pytest.raises(ValueError, match="Cannot group logs by 'created_at'; use one of event, webhook_id"):
+        getattr(analytics, method)(by="created_at")
@@ -4,6 +4,23 @@ Main client module
 """
 
 from .client import WhatsAppAPI
+from .async_client import AsyncWhatsAppAPI
+from .cache import ResponseCache
+from .contact_store import ContactStore, AsyncContactStore
+from .endpoints import Endpoints, AsyncEndpoints
+from .hooks import Hooks, RequestInfo
+from .metrics import MetricsCollector
+from .models import Record, RecordList, Contact, Message, Group, Session, WebhookLog
+from .multipart import Media
+from .outbox import Outbox
+from .phones import NormalizedPhones, normalize_phone, normalize_phones
+from .pool import SessionPool, AsyncSessionPool
+from .ratelimit import RateLimiter
+from .retry import Backoff, CircuitBreaker, RetryBudget
+from .singleflight import SingleFlight, AsyncSingleFlight
+from .receiver import WebhookReceiver, WebhookEvent, verify_signature
+from .webhook_analytics import WebhookAnalytics
+from .events import EventStream, AsyncEventStream, StreamEvent
 from .exceptions import (
     WhatsAppAPIError,
     AuthenticationError,
@@ -11,16 +28,54 @@ from .exceptions import (
     RateLimitError,
     NotFoundError,
     ServerError,
+    CircuitOpenError,
 )
 
 __version__ = "1.0.0"
 __all__ = [
     "WhatsAppAPI",
+    "AsyncWhatsAppAPI",
+    "EventStream",
+    "AsyncEventStream",
+    "StreamEvent",
+    "Media",
+    "ResponseCache",
+    "ContactStore",
+    "AsyncContactStore",
+    "Endpoints",
+    "AsyncEndpoints",
+    "Hooks",
+    "RequestInfo",
+    "MetricsCollector",
+    "Record",
+    "RecordList",
+    "Contact",
+    "Message",
+    "Group",
+    "Session",
+    "WebhookLog",
+    "Outbox",
+    "NormalizedPhones",
+    "normalize_phone",
+    "normalize_phones",
+    "SessionPool",
+    "AsyncSessionPool",
+    "RateLimiter",
+    "CircuitBreaker",
+    "RetryBudget",
+    "Backoff",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "WebhookReceiver",
+    "WebhookEvent",
+    "verify_signature",
+    "WebhookAnalytics",
     "WhatsAppAPIError",
     "AuthenticationError",
     "ValidationError",
     "RateLimitError",
     "NotFoundError",
     "ServerError",
+    "CircuitOpenError",
 ]
 
@@ -0,0 +1,11 @@
+"""
+WhatsApp API Platform - Python SDK
+Entry point for ``python -m whatsapp_api``
+"""
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
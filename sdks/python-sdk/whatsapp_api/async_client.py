@@ -0,0 +1,497 @@
+"""
+WhatsApp API Platform - Python SDK
+Asyncio client class
+"""
+
+import asyncio
+import time
+from typing import Callable, Optional, Dict, Any, List, Sequence, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .cache import ResponseCache
+from .codec import JSONCodec, get_codec
+from .endpoints import AsyncEndpoints
+from .events import AsyncEventStream, gateway_url
+from .exceptions import WhatsAppAPIError, CircuitOpenError, RateLimitError, ServerError, raise_for_status
+from .hooks import Hook, Hooks, RequestInfo, content_length
+from .idempotency import IDEMPOTENCY_HEADER, MUTATING_METHODS, ahedge, in_progress_delay, new_key
+from .metrics import MetricsCollector
+from .multipart import MultipartEncoder
+from .ratelimit import RateLimiter
+from .retry import RETRY_STATUSES, Backoff, CircuitBreaker, RetryBudget
+from .singleflight import AsyncSingleFlight
+from .resources import Sessions, Groups, Webhooks
+from .resources.contacts import AsyncContacts
+from .resources.messages import AsyncMessages
+
+
+class AsyncWhatsAppAPI:
+    """
+    WhatsApp API Platform asyncio client
+
+    Exposes the same resources as ``WhatsAppAPI``; every resource method
+    returns an awaitable. Requires the ``async`` extra (``aiohttp``).
+
+    Args:
+        api_key: Your API key
+        base_url: Base URL of the API (default: http://localhost:3000/api/v1),
+            or a list of base URLs of several API nodes
+        timeout: Request timeout in seconds (default: 30)
+        max_retries: Maximum number of retries (default: 3)
+        pool_maxsize: Maximum open connections across all hosts (default: 100)
+        pool_maxsize_per_host: Maximum open connections per host, 0 for no
+            per-host limit (default: 0)
+        keepalive_timeout: Seconds to keep idle connections open (default: 30)
+        rate_limiter: Rate limiter pacing requests from the server's
+            RateLimit headers; pass one to share it between clients
+        cache: Optional response cache for GET requests; writes through
+            this client invalidate affected entries
+        metrics: Optional metrics collector fed by this client's hooks
+        json_codec: JSON codec for request and response bodies: a JSONCodec,
+            ``"orjson"``, ``"ujson"`` or ``"json"`` (default: the fastest
+            one installed)
+        circuit_breaker: Optional per-route circuit breaker; requests to a
+            failing route fail fast with CircuitOpenError
+        retry_budget: Cap on retries as a fraction of traffic (default: a
+            RetryBudget of 20%); pass one to share it between clients
+        backoff: Delay between retries (default: decorrelated jitter from
+            0.5s to 30s)
+        health_check_interval: Seconds between health checks of the API
+            nodes when ``base_url`` lists several (default: 10)
+        coalesce_reads: Share one request between concurrent identical GETs
+            (default: True)
+
+    Request hooks, idempotency keys and failover between API nodes work as
+    on ``WhatsAppAPI``; hooks are plain functions called from the event
+    loop, and health checks run as a task on it.
+
+    The connection pool is created on first use inside the running event
+    loop. Call ``await close()`` (or use ``async with``) to release it.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Union[str, Sequence[str]] = "http://localhost:3000/api/v1",
+        timeout: int = 30,
+        max_retries: int = 3,
+        pool_maxsize: int = 100,
+        pool_maxsize_per_host: int = 0,
+        keepalive_timeout: float = 30,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[MetricsCollector] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        backoff: Optional[Backoff] = None,
+        health_check_interval: float = 10,
+        coalesce_reads: bool = True,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncWhatsAppAPI requires aiohttp. "
+                "Install it with: pip install whatsapp-api-platform[async]"
+            )
+
+        self.api_key = api_key
+        urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        self.base_url = urls[0].rstrip("/")
+        self.endpoints: Optional[AsyncEndpoints] = None
+        if len(urls) > 1:
+            self.endpoints = AsyncEndpoints(urls, interval=health_check_interval)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.single_flight = AsyncSingleFlight() if coalesce_reads else None
+        self.json_codec = get_codec(json_codec)
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget or RetryBudget()
+        self.backoff = backoff or Backoff()
+        self.hooks = Hooks()
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.attach(self.hooks)
+        self.pool_maxsize = pool_maxsize
+        self.pool_maxsize_per_host = pool_maxsize_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._session = None
+
+        # Initialize resource modules
+        self.sessions = Sessions(self)
+        self.messages = AsyncMessages(self)
+        self.contacts = AsyncContacts(self)
+        self.groups = Groups(self)
+        self.webhooks = Webhooks(self)
+
+    def event_stream(self, token: str, sessions: Optional[List[str]] = None, **kwargs) -> AsyncEventStream:
+        """
+        Create a real-time event stream for this API's Socket.IO gateway
+
+        Args:
+            token: JWT access token of the user (the gateway does not accept API keys)
+            sessions: Session IDs to join
+            **kwargs: Further AsyncEventStream options
+
+        Returns:
+            Unconnected AsyncEventStream; use it as a context manager or call connect()
+        """
+        return AsyncEventStream(gateway_url(self._base_url()), token, sessions=sessions, **kwargs)
+
+    def on(self, event: str) -> Callable[[Hook], Hook]:
+        """Register a request hook, as a decorator (see ``Hooks``)"""
+        return self.hooks.on(event)
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get request headers with API key"""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "User-Agent": "WhatsApp-API-Python-SDK/1.0.0",
+        }
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the shared client session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize,
+                limit_per_host=self.pool_maxsize_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            if self.endpoints is not None:
+                self.endpoints.start(self._session)
+        return self._session
+
+    def _base_url(self) -> str:
+        return self.endpoints.current() if self.endpoints is not None else self.base_url
+
+    async def close(self) -> None:
+        """Close pooled connections and stop health checks"""
+        if self.endpoints is not None:
+            await self.endpoints.stop()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncWhatsAppAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _handle_response(self, response: "aiohttp.ClientResponse") -> Dict[str, Any]:
+        """Handle API response and raise appropriate exceptions"""
+        try:
+            data = self.json_codec.loads(await response.read())
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            data = {"error": "Invalid JSON response"}
+
+        raise_for_status(response.status, data)
+        return data
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        files: Optional[Dict] = None,
+        stream: bool = False,
+        decode: bool = True,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        """
+        Make HTTP request with retry logic
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint
+            data: Request body data
+            params: Query parameters
+            files: Files to upload, sent as multipart form data with ``data``
+                as the form fields; may be a prebuilt MultipartEncoder
+            stream: Return the unread response instead of its data
+            decode: Decode successful responses; when False, their status
+                code is returned instead (error responses always raise)
+            idempotency_key: Key sent with mutating requests (default: a
+                new key per call, shared by its retries)
+
+        Returns:
+            Response data
+        """
+        path = endpoint.lstrip("/")
+        session = self._get_session()
+
+        kwargs = {"params": params}
+        if files:
+            body = files if isinstance(files, MultipartEncoder) else MultipartEncoder(data, files)
+            kwargs["data"] = body
+            kwargs["headers"] = body.headers
+        elif data is not None:
+            kwargs["data"] = self.json_codec.dumps(data)
+            kwargs["headers"] = {"Content-Type": "application/json"}
+
+        if method in MUTATING_METHODS:
+            idempotency_key = idempotency_key or new_key()
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **{IDEMPOTENCY_HEADER: idempotency_key})
+        else:
+            idempotency_key = None
+
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        delay = None
+
+        for attempt in range(self.max_retries):
+            wait = self.rate_limiter.reserve(endpoint)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._check_circuit(method, endpoint, attempt, idempotency_key)
+            info = RequestInfo(method, endpoint, attempt, wait)
+            info.idempotency_key = idempotency_key
+            info.base_url = self._base_url()
+            retry_delay = None
+            recorded = False
+            try:
+                self.hooks.emit("before_request", info)
+                start = time.monotonic()
+                response = await session.request(method, f"{info.base_url}/{path}", **kwargs)
+                info.status_code = response.status
+                info.request_bytes = content_length(response.request_info.headers.get("Content-Length"))
+                self._record_outcome(endpoint, response.status < 500)
+                recorded = True
+                retry_delay = self.rate_limiter.update(endpoint, response.status, response.headers)
+                in_progress = in_progress_delay(response.status, response.headers)
+                if in_progress is not None and idempotency_key and attempt < self.max_retries - 1:
+                    # An earlier attempt with this key is still being processed
+                    response.release()
+                    await self._retry(info, in_progress)
+                    continue
+                if stream and response.status in (200, 201):
+                    info.elapsed = time.monotonic() - start
+                    info.response_bytes = response.content_length
+                    self.hooks.emit("after_response", info)
+                    return response
+                async with response:
+                    body = await response.read()
+                    info.elapsed = time.monotonic() - start
+                    info.response_bytes = len(body)
+                    self.hooks.emit("after_response", info)
+                    if not decode and response.status in (200, 201):
+                        return response.status
+                    result = await self._handle_response(response)
+                    if idempotency_key:
+                        result["idempotency_key"] = idempotency_key
+                    return result
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                self._record_outcome(endpoint, False)
+                info.error = e
+                if self._failover(info.base_url) and attempt < self.max_retries - 1:
+                    # Another node is up: retry there without backing off
+                    await self._retry(info, 0)
+                    continue
+                if not self._may_retry(attempt):
+                    info.error = WhatsAppAPIError(f"Connection error: {str(e)}")
+                    info.error.idempotency_key = idempotency_key
+                    self.hooks.emit("on_error", info)
+                    raise info.error
+
+                delay = self.backoff.next(delay)
+                await self._retry(info, delay)
+
+            except RateLimitError as e:
+                info.error = e
+                e.idempotency_key = idempotency_key
+                if attempt == self.max_retries - 1:
+                    self.hooks.emit("on_error", info)
+                    raise
+
+                # The limiter holds the retry until the server's Retry-After
+                # or reset time; back off if it sent neither. These retries
+                # add no load, so they do not draw on the retry budget
+                if retry_delay is None:
+                    delay = self.backoff.next(delay)
+                await self._retry(info, delay if retry_delay is None else 0)
+
+            except ServerError as e:
+                info.error = e
+                e.idempotency_key = idempotency_key
+                if e.status_code not in RETRY_STATUSES or not self._may_retry(attempt):
+                    self.hooks.emit("on_error", info)
+                    raise
+
+                delay = self.backoff.next(delay)
+                await self._retry(info, delay)
+
+            except WhatsAppAPIError as e:
+                info.error = e
+                e.idempotency_key = idempotency_key
+                self.hooks.emit("on_error", info)
+                raise
+
+            except BaseException:
+                # Cancelled (e.g. the losing copy of a hedged send) or failed
+                # without telling anything about the server's health
+                if not recorded:
+                    self._release_probe(endpoint)
+                raise
+
+    def _check_circuit(self, method: str, endpoint: str, attempt: int, idempotency_key: Optional[str]) -> None:
+        """Fail fast while the endpoint's circuit is open"""
+        if self.circuit_breaker is None or self.circuit_breaker.allow(endpoint):
+            return
+        info = RequestInfo(method, endpoint, attempt)
+        info.idempotency_key = idempotency_key
+        info.error = CircuitOpenError(
+            f"Circuit open for {endpoint}; retry in {self.circuit_breaker.retry_in(endpoint):.1f}s"
+        )
+        info.error.idempotency_key = idempotency_key
+        self.hooks.emit("on_error", info)
+        raise info.error
+
+    def _record_outcome(self, endpoint: str, healthy: bool) -> None:
+        """Report whether the server handled an attempt to the circuit breaker"""
+        if self.circuit_breaker is None:
+            return
+        if healthy:
+            self.circuit_breaker.record_success(endpoint)
+        else:
+            self.circuit_breaker.record_failure(endpoint)
+
+    def _release_probe(self, endpoint: str) -> None:
+        """Give back the circuit breaker probe slot of an attempt without an outcome"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(endpoint)
+
+    def _failover(self, base_url: str) -> bool:
+        """Take a failed node out of rotation; whether another node is up"""
+        return self.endpoints is not None and self.endpoints.mark_down(base_url)
+
+    def _may_retry(self, attempt: int) -> bool:
+        """Whether a failed attempt has attempts and retry budget left"""
+        if attempt >= self.max_retries - 1:
+            return False
+        return self.retry_budget is None or self.retry_budget.try_retry()
+
+    async def _retry(self, info: RequestInfo, delay: float) -> None:
+        """Report a retried attempt to hooks and back off"""
+        info.delay = delay
+        self.hooks.emit("on_retry", info)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        decode: bool = True,
+        cache: bool = True,
+    ) -> Any:
+        """
+        Make GET request; with ``decode=False`` return only the status code
+
+        Concurrent identical requests (same endpoint and params) share one
+        in-flight request, unless ``coalesce_reads`` is off. With
+        ``cache=False`` the response cache is not read, so the response is
+        always the server's; it still replaces the cached entry.
+        """
+        if not decode:
+            return await self._request("GET", endpoint, params=params, decode=False)
+
+        cache_key = self.cache.key(endpoint, params) if cache and self.cache is not None else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        key = self.single_flight.key(endpoint, params) if self.single_flight is not None else None
+        if key is None:
+            return await self._fetch(endpoint, params)
+        return await self.single_flight.do(key, lambda: self._fetch(endpoint, params))
+
+    async def _fetch(self, endpoint: str, params: Optional[Dict]) -> Dict[str, Any]:
+        """Make GET request, storing the response in the cache"""
+        cache_key = self.cache.key(endpoint, params) if self.cache is not None else None
+        if cache_key is None:
+            return await self._request("GET", endpoint, params=params)
+
+        generation = self.cache.generation(endpoint)
+        response = await self._request("GET", endpoint, params=params)
+        self.cache.set(cache_key, response, generation)
+        return response
+
+    async def _write(
+        self,
+        method: str,
+        endpoint: str,
+        hedge_after: Optional[float] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Make a mutating request, invalidating cached reads it affects"""
+        try:
+            if hedge_after is None:
+                return await self._request(method, endpoint, **kwargs)
+
+            # Both copies of a hedged request must share one key
+            kwargs["idempotency_key"] = kwargs.get("idempotency_key") or new_key()
+            return await ahedge(lambda: self._request(method, endpoint, **kwargs), hedge_after)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(method, endpoint)
+            if self.single_flight is not None:
+                self.single_flight.forget(endpoint)
+
+    async def stream(self, endpoint: str, params: Optional[Dict] = None) -> "aiohttp.ClientResponse":
+        """Make GET request and return the unread response; the caller must release it"""
+        return await self._request("GET", endpoint, params=params, stream=True)
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        files: Optional[Union[Dict, MultipartEncoder]] = None,
+        decode: bool = True,
+        idempotency_key: Optional[str] = None,
+        hedge_after: Optional[float] = None,
+    ) -> Any:
+        """Make POST request; with ``decode=False`` return only the status code (see ``WhatsAppAPI.post``)"""
+        return await self._write(
+            "POST",
+            endpoint,
+            hedge_after=hedge_after,
+            data=data,
+            files=files,
+            decode=decode,
+            idempotency_key=idempotency_key,
+        )
+
+    async def put(
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        decode: bool = True,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        """Make PUT request; with ``decode=False`` return only the status code"""
+        return await self._write("PUT", endpoint, data=data, decode=decode, idempotency_key=idempotency_key)
+
+    async def delete(
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        decode: bool = True,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        """Make DELETE request; with ``decode=False`` return only the status code"""
+        return await self._write("DELETE", endpoint, data=data, decode=decode, idempotency_key=idempotency_key)
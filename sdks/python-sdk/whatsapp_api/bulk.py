@@ -0,0 +1,289 @@
+"""
+WhatsApp API Platform - Python SDK
+Bulk execution helpers
+"""
+
+import asyncio
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+
+# Returned by a ``prepare`` function to leave an item out of the run
+SKIP = object()
+
+
+class BulkResult:
+    """
+    Outcome of a single item in a bulk run
+
+    Attributes:
+        item: The recipient or payload that was sent
+        response: API response data, or None if the call failed
+        error: Exception raised by the call, or None on success
+        elapsed: Seconds spent on the call
+    """
+
+    __slots__ = ("item", "response", "error", "elapsed")
+
+    def __init__(self, item: Any, response: Optional[Dict[str, Any]], error: Optional[Exception], elapsed: float):
+        self.item = item
+        self.response = response
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded"""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else type(self.error).__name__
+        return f"<BulkResult {self.item!r} {status}>"
+
+
+class BulkStats:
+    """
+    Aggregate counters for a bulk run
+
+    ``failures`` keeps only the last ``max_failures`` failed results, so a
+    long run against a failing endpoint holds bounded memory; ``failed``
+    and ``errors`` still count every failure.
+
+    Args:
+        max_failures: Failed results kept in ``failures`` (default: 1000)
+    """
+
+    def __init__(self, max_failures: int = 1000):
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.errors = Counter()
+        self.failures: Deque[BulkResult] = deque(maxlen=max_failures)
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def completed(self) -> int:
+        """Number of items that finished, successfully or not"""
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started"""
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Completed items per second"""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def start(self) -> None:
+        self.started_at = time.monotonic()
+        self.finished_at = None
+
+    def finish(self) -> None:
+        self.finished_at = time.monotonic()
+
+    def record(self, result: BulkResult) -> None:
+        if result.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+            self.errors[type(result.error).__name__] += 1
+            self.failures.append(result)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "completed": self.completed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "errors": dict(self.errors),
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<BulkStats completed={self.completed} failed={self.failed} "
+            f"throughput={self.throughput:.1f}/s>"
+        )
+
+
+class BulkSend:
+    """
+    Run a send function over an iterable with bounded thread concurrency
+
+    Items are pulled from the iterable lazily, so at most ``max_pending``
+    are held in memory at once. Iterating yields a ``BulkResult`` per item
+    as it completes; a failing item never aborts the run.
+
+    ``prepare`` checks each item before it is submitted and returns the
+    item to send, or ``SKIP`` to leave it out (counted in
+    ``stats.skipped``); if it raises, the item fails without being sent.
+
+    Args:
+        send: Callable invoked once per item
+        items: Iterable or generator of items
+        concurrency: Number of worker threads (default: 10)
+        max_pending: Items submitted ahead of completion (default: 2 * concurrency)
+        prepare: Optional callable run on each item before it is sent
+        max_failures: Failed results kept in ``stats.failures`` (default: 1000)
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Any], Dict[str, Any]],
+        items: Iterable[Any],
+        concurrency: int = 10,
+        max_pending: Optional[int] = None,
+        prepare: Optional[Callable[[Any], Any]] = None,
+        max_failures: int = 1000,
+    ):
+        self._send = send
+        self._items = items
+        self._prepare = prepare
+        self.concurrency = concurrency
+        self.max_pending = max_pending or concurrency * 2
+        self.stats = BulkStats(max_failures)
+
+    def _call(self, item: Any) -> BulkResult:
+        start = time.monotonic()
+        try:
+            response = self._send(item)
+        except Exception as e:
+            return BulkResult(item, None, e, time.monotonic() - start)
+        return BulkResult(item, response, None, time.monotonic() - start)
+
+    def __iter__(self):
+        items = iter(self._items)
+        exhausted = False
+        pending = set()
+
+        self.stats.start()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while True:
+                while not exhausted and len(pending) < self.max_pending:
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if self._prepare is not None:
+                        try:
+                            item = self._prepare(item)
+                        except Exception as e:
+                            result = BulkResult(item, None, e, 0.0)
+                            self.stats.record(result)
+                            yield result
+                            continue
+                        if item is SKIP:
+                            self.stats.skipped += 1
+                            continue
+                    pending.add(executor.submit(self._call, item))
+
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    self.stats.record(result)
+                    yield result
+        self.stats.finish()
+
+    def run(self) -> BulkStats:
+        """Send every item and return the aggregate stats"""
+        for _ in self:
+            pass
+        return self.stats
+
+
+class AsyncBulkSend:
+    """
+    Run a coroutine function over an iterable with bounded task concurrency
+
+    The asyncio counterpart of ``BulkSend``: ``async for`` yields a
+    ``BulkResult`` per item as it completes.
+
+    Args:
+        send: Coroutine function invoked once per item
+        items: Iterable or generator of items
+        concurrency: Maximum sends in flight (default: 100)
+        prepare: Optional callable run on each item before it is sent,
+            as for ``BulkSend``
+        max_failures: Failed results kept in ``stats.failures`` (default: 1000)
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Any], Any],
+        items: Iterable[Any],
+        concurrency: int = 100,
+        prepare: Optional[Callable[[Any], Any]] = None,
+        max_failures: int = 1000,
+    ):
+        self._send = send
+        self._items = items
+        self._prepare = prepare
+        self.concurrency = concurrency
+        self.stats = BulkStats(max_failures)
+
+    async def _call(self, item: Any) -> BulkResult:
+        start = time.monotonic()
+        try:
+            response = await self._send(item)
+        except Exception as e:
+            return BulkResult(item, None, e, time.monotonic() - start)
+        return BulkResult(item, response, None, time.monotonic() - start)
+
+    async def __aiter__(self):
+        items = iter(self._items)
+        exhausted = False
+        pending = set()
+
+        self.stats.start()
+        try:
+            while True:
+                while not exhausted and len(pending) < self.concurrency:
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if self._prepare is not None:
+                        try:
+                            item = self._prepare(item)
+                        except Exception as e:
+                            result = BulkResult(item, None, e, 0.0)
+                            self.stats.record(result)
+                            yield result
+                            continue
+                        if item is SKIP:
+                            self.stats.skipped += 1
+                            continue
+                    pending.add(asyncio.ensure_future(self._call(item)))
+
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    self.stats.record(result)
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+        self.stats.finish()
+
+    async def run(self) -> BulkStats:
+        """Send every item and return the aggregate stats"""
+        async for _ in self:
+            pass
+        return self.stats
@@ -0,0 +1,150 @@
+"""
+WhatsApp API Platform - Python SDK
+Response caching
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+CacheKey = Tuple[str, Tuple]
+
+
+def _path(endpoint: str) -> str:
+    return "/" + endpoint.strip("/")
+
+
+def _scope(path: str) -> str:
+    return path.split("/", 2)[1]
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL/LRU cache for GET responses
+
+    Entries are keyed by endpoint and query parameters and expire after the
+    TTL of their resource (the first path segment, e.g. ``contacts``). The
+    least recently used entry is evicted once ``max_size`` is reached.
+
+    Writes made through the same client invalidate affected entries: a PUT
+    or DELETE evicts the written path, its sub-paths and its ancestors
+    (e.g. ``contacts.update`` evicts ``/contacts/{id}`` and every
+    ``/contacts`` list page), and a POST evicts the whole resource, since
+    actions such as ``/contacts/sync`` can change any record.
+
+    Args:
+        max_size: Maximum number of cached responses (default: 1024)
+        ttl: Default time to live in seconds (default: 60)
+        ttls: Per-resource TTL overrides, e.g. ``{"contacts": 300}``;
+            a TTL of 0 disables caching for that resource
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60, ttls: Optional[Dict[str, float]] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._scopes: Dict[str, Set[CacheKey]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict] = None) -> Optional[CacheKey]:
+        """Build the cache key for a GET request, or None if its params cannot be compared"""
+        items = tuple(sorted((params or {}).items()))
+        if not all(isinstance(value, Hashable) for _, value in items):
+            return None
+        return _path(endpoint), items
+
+    def ttl_for(self, endpoint: str) -> float:
+        """TTL applied to responses from an endpoint"""
+        return self.ttls.get(_scope(_path(endpoint)), self.ttl)
+
+    def generation(self, endpoint: str) -> int:
+        """Invalidation counter of the endpoint's resource"""
+        return self._generations.get(_scope(_path(endpoint)), 0)
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached response, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(value)
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def set(self, key: CacheKey, value: Dict[str, Any], generation: int) -> None:
+        """
+        Store a response
+
+        ``generation`` is the resource's generation from before the request
+        was sent; if a write invalidated the resource meanwhile, the
+        possibly stale response is not stored.
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0:
+            return
+
+        scope = _scope(key[0])
+        with self._lock:
+            if self._generations.get(scope, 0) != generation:
+                return
+            self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            self._scopes.setdefault(scope, set()).add(key)
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, method: str, endpoint: str) -> None:
+        """Evict entries affected by a write to an endpoint"""
+        path = _path(endpoint)
+        scope = _scope(path)
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for key in list(self._scopes.get(scope, ())):
+                cached = key[0]
+                if (
+                    method == "POST"
+                    or cached == path
+                    or cached.startswith(path + "/")
+                    or path.startswith(cached + "/")
+                ):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters"""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, key: CacheKey) -> None:
+        del self._entries[key]
+        keys = self._scopes.get(_scope(key[0]))
+        if keys is not None:
+            keys.discard(key)
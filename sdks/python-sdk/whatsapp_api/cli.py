@@ -0,0 +1,466 @@
+"""
+WhatsApp API Platform - Python SDK
+Command-line interface
+
+    python -m whatsapp_api broadcast recipients.csv --session my-session --message "Hello!"
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .bulk import BulkSend
+from .client import WhatsAppAPI
+from .resources.contacts import _read_csv
+from .resources.messages import Recipient
+
+DEFAULT_BASE_URL = "http://localhost:3000/api/v1"
+
+# Results a worker collects before reporting them to the parent process
+REPORT_SIZE = 1000
+REPORT_INTERVAL = 0.5
+
+# Seconds of sends the live throughput is averaged over
+RATE_WINDOW = 10
+
+
+def _read_rows(path: str) -> Iterator[Any]:
+    """Yield the rows of a CSV file, or the values of an NDJSON file, lazily"""
+    if path.endswith(".csv"):
+        yield from _read_csv(path)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _recipient(row: Any) -> Recipient:
+    """
+    Map an input row to a bulk send item
+
+    The number is read from ``to``, ``phone_number`` or ``phone``. A row
+    with ``latitude`` becomes a location, one with ``media_url`` or
+    ``file_path`` a media message and one with ``message`` a text message;
+    any other row gets the default message.
+    """
+    if isinstance(row, str):
+        return row
+
+    to = row.get("to") or row.get("phone_number") or row.get("phone")
+    if not to:
+        raise ValueError("Row has no to, phone_number or phone")
+
+    if row.get("latitude") not in (None, ""):
+        item = {"to": to, "latitude": float(row["latitude"]), "longitude": float(row["longitude"])}
+        fields = ("name", "address")
+    elif row.get("media_url") or row.get("file_path"):
+        item = {"to": to}
+        fields = ("media_url", "file_path", "caption", "media_type")
+    elif row.get("message"):
+        item = {"to": to}
+        fields = ("message",)
+    else:
+        return to
+
+    for field in fields + ("session_id",):
+        if row.get(field):
+            item[field] = row[field]
+    return item
+
+
+class _Checkpoint:
+    """
+    Rows a broadcast has finished, by row index
+
+    Every row below ``watermark`` is finished, as is every row in ``done``;
+    since workers finish rows roughly in order, ``done`` stays small and
+    the file stays a few kilobytes however large the input is. Rows whose
+    send failed are finished too, but are kept in ``failed_rows`` so a
+    resumed run sends them again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        source: str,
+        run_id: Optional[str] = None,
+        watermark: int = 0,
+        done: Iterable[int] = (),
+        succeeded: int = 0,
+        failed: Iterable[int] = (),
+    ):
+        self.path = path
+        self.source = source
+        self.run_id = run_id or uuid.uuid4().hex
+        self.watermark = watermark
+        self.done = set(done)
+        self.succeeded = succeeded
+        self.failed_rows = set(failed)
+
+    @classmethod
+    def load(cls, path: str) -> "_Checkpoint":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            path,
+            data["source"],
+            data["run_id"],
+            data["watermark"],
+            data["done"],
+            data["succeeded"],
+            data["failed"],
+        )
+
+    @property
+    def completed(self) -> int:
+        return self.watermark + len(self.done)
+
+    @property
+    def failed(self) -> int:
+        return len(self.failed_rows)
+
+    def add(self, index: int, ok: bool) -> None:
+        if ok:
+            self.succeeded += 1
+            self.failed_rows.discard(index)
+        else:
+            self.failed_rows.add(index)
+        if index >= self.watermark:
+            self.done.add(index)
+        while self.watermark in self.done:
+            self.done.remove(self.watermark)
+            self.watermark += 1
+
+    def save(self) -> None:
+        """Write the checkpoint atomically"""
+        data = {
+            "source": self.source,
+            "run_id": self.run_id,
+            "watermark": self.watermark,
+            "done": sorted(self.done),
+            "succeeded": self.succeeded,
+            "failed": sorted(self.failed_rows),
+        }
+        temp = self.path + ".tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, self.path)
+
+
+def _duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+class _Progress:
+    """Live throughput and ETA on stderr"""
+
+    def __init__(self, completed: int, stream=sys.stderr):
+        self.stream = stream
+        self.tty = stream.isatty()
+        self.started_at = time.monotonic()
+        self.printed_at = 0.0
+        self._samples = deque([(self.started_at, completed)])
+
+    def rate(self) -> float:
+        """Rows finished per second over the last RATE_WINDOW seconds"""
+        (start, first), (end, last) = self._samples[0], self._samples[-1]
+        return (last - first) / (end - start) if end > start else 0.0
+
+    def update(self, completed: int, total: Optional[int], failed: int, final: bool = False) -> None:
+        now = time.monotonic()
+        self._samples.append((now, completed))
+        while len(self._samples) > 2 and now - self._samples[1][0] >= RATE_WINDOW:
+            self._samples.popleft()
+        if not final and now - self.printed_at < (1 if self.tty else 10):
+            return
+        self.printed_at = now
+
+        rate = self.rate()
+        if total is None:
+            line = f"{completed:,} sent"
+        else:
+            line = f"{completed:,}/{total:,} ({completed / total if total else 1:.1%})"
+        line += f"  {rate:,.1f}/s  failed {failed:,}"
+        if total is not None and rate > 0 and not final:
+            line += f"  ETA {_duration((total - completed) / rate)}"
+        line += f"  elapsed {_duration(now - self.started_at)}"
+
+        if self.tty:
+            self.stream.write("\r\033[K" + line + ("\n" if final else ""))
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+
+def _broadcast_worker(
+    shard: int,
+    shards: int,
+    options: Dict[str, Any],
+    watermark: int,
+    done: List[int],
+    retry: List[int],
+    results: Any,
+    stop: Any,
+) -> None:
+    """
+    Send every ``shards``-th row of the input, starting at row ``shard``,
+    reporting finished rows to the parent process
+
+    Rows the checkpoint has finished are skipped, unless they are in
+    ``retry``.
+    """
+    # The parent handles Ctrl-C and tells workers to stop through ``stop``
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    done = set(done)
+    retry = set(retry)
+
+    def rows():
+        for index, row in enumerate(_read_rows(options["input"])):
+            if stop.is_set():
+                return
+            if index % shards != shard:
+                continue
+            if index in retry or (index >= watermark and index not in done):
+                yield index, row
+
+    client = WhatsAppAPI(
+        api_key=options["api_key"],
+        base_url=options["base_url"],
+        pool_maxsize=options["concurrency"],
+    )
+
+    def send(item):
+        index, row = item
+        return client.messages._send_one(
+            options["session_id"],
+            _recipient(row),
+            options["message"],
+            # Stable per row, so a row resent after a crash is not delivered twice
+            idempotency_key=f"{options['run_id']}:{index}",
+        )
+
+    finished, failures = [], []
+    reported_at = time.monotonic()
+    try:
+        with client:
+            for result in BulkSend(send, rows(), concurrency=options["concurrency"]):
+                index, row = result.item
+                finished.append((index, result.ok))
+                if not result.ok:
+                    failure = dict(row) if isinstance(row, dict) else {"to": row}
+                    failure["error"] = f"{type(result.error).__name__}: {result.error}"
+                    failures.append(failure)
+                if len(finished) >= REPORT_SIZE or time.monotonic() - reported_at >= REPORT_INTERVAL:
+                    results.put(("results", finished, failures))
+                    finished, failures = [], []
+                    reported_at = time.monotonic()
+    except Exception as e:
+        results.put(("results", finished, failures))
+        results.put(("exit", shard, f"{type(e).__name__}: {e}"))
+        return
+    results.put(("results", finished, failures))
+    results.put(("exit", shard, None))
+
+
+def broadcast(args: argparse.Namespace) -> int:
+    """Run the ``broadcast`` command; returns the exit status"""
+    source = os.path.abspath(args.input)
+    checkpoint_path = args.checkpoint or args.input + ".checkpoint"
+    if os.path.exists(checkpoint_path) and not args.restart:
+        checkpoint = _Checkpoint.load(checkpoint_path)
+        if checkpoint.source != source:
+            print(
+                f"{checkpoint_path} is a checkpoint of {checkpoint.source}; use --restart to replace it",
+                file=sys.stderr,
+            )
+            return 2
+        print(
+            f"Resuming from {checkpoint_path}: {checkpoint.completed - checkpoint.failed:,} rows already sent, "
+            f"{checkpoint.failed:,} failed rows to retry",
+            file=sys.stderr,
+        )
+    else:
+        checkpoint = _Checkpoint(checkpoint_path, source)
+    checkpoint.save()
+
+    base_url = args.base_url or [os.environ.get("WHATSAPP_API_URL", DEFAULT_BASE_URL)]
+    options = {
+        "input": args.input,
+        "api_key": args.api_key,
+        "base_url": base_url[0] if len(base_url) == 1 else base_url,
+        "session_id": args.session,
+        "message": args.message,
+        "concurrency": args.concurrency,
+        "run_id": checkpoint.run_id,
+    }
+
+    context = multiprocessing.get_context()
+    results = context.Queue()
+    stop = context.Event()
+    workers = [
+        context.Process(
+            target=_broadcast_worker,
+            args=(
+                shard,
+                args.workers,
+                options,
+                checkpoint.watermark,
+                sorted(checkpoint.done),
+                sorted(checkpoint.failed_rows),
+                results,
+                stop,
+            ),
+            name=f"broadcast-{shard}",
+            daemon=True,
+        )
+        for shard in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    # Count the rows alongside the sends, for the ETA
+    total: List[Optional[int]] = [None]
+
+    def count():
+        total[0] = sum(1 for _ in _read_rows(args.input))
+
+    threading.Thread(target=count, daemon=True).start()
+
+    def interrupt(signum, frame):
+        if stop.is_set():
+            raise KeyboardInterrupt
+        print("\nStopping after the sends in flight; press Ctrl-C again to abort", file=sys.stderr)
+        stop.set()
+
+    previous_handler = signal.signal(signal.SIGINT, interrupt)
+    progress = None if args.quiet else _Progress(checkpoint.completed)
+    running = set(range(args.workers))
+    errors = []
+    saved_at = time.monotonic()
+    failures = open(args.failures, "a", encoding="utf-8") if args.failures else None
+    try:
+        while running:
+            try:
+                message = results.get(timeout=0.5)
+            except queue.Empty:
+                message = None
+                for shard in list(running):
+                    if not workers[shard].is_alive() and workers[shard].exitcode != 0:
+                        running.discard(shard)
+                        errors.append(f"worker {shard} exited with code {workers[shard].exitcode}")
+
+            if message is not None and message[0] == "exit":
+                running.discard(message[1])
+                if message[2]:
+                    errors.append(f"worker {message[1]}: {message[2]}")
+            elif message is not None:
+                for index, ok in message[1]:
+                    checkpoint.add(index, ok)
+                if failures is not None:
+                    for failure in message[2]:
+                        failures.write(json.dumps(failure) + "\n")
+
+            if time.monotonic() - saved_at >= args.checkpoint_interval:
+                if failures is not None:
+                    failures.flush()
+                checkpoint.save()
+                saved_at = time.monotonic()
+            if progress is not None:
+                progress.update(checkpoint.completed, total[0], checkpoint.failed)
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        if failures is not None:
+            failures.close()
+        checkpoint.save()
+
+    for worker in workers:
+        worker.join()
+    if progress is not None:
+        progress.update(checkpoint.completed, total[0], checkpoint.failed, final=True)
+    for error in errors:
+        print(error, file=sys.stderr)
+    print(
+        f"Sent {checkpoint.succeeded:,}, failed {checkpoint.failed:,}; "
+        f"checkpoint {checkpoint_path}"
+    )
+
+    if stop.is_set():
+        return 130
+    return 1 if errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="whatsapp-api", description="WhatsApp API Platform command-line tools")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    command = commands.add_parser(
+        "broadcast",
+        help="send a message to every recipient in a file",
+        description=(
+            "Send to every row of a CSV or NDJSON file, sharded across worker "
+            "processes. Progress is checkpointed, so rerunning the same command "
+            "after an interruption resumes where it stopped."
+        ),
+    )
+    command.add_argument(
+        "input",
+        help="CSV file with a to, phone_number or phone column, or NDJSON file of "
+        "phone numbers or objects; message, media_url, caption, latitude/longitude "
+        "and session_id columns override the defaults per row",
+    )
+    command.add_argument("--session", required=True, help="session ID to send from")
+    command.add_argument("--message", help="text for rows without their own message")
+    command.add_argument(
+        "--api-key",
+        default=os.environ.get("WHATSAPP_API_KEY"),
+        help="API key (default: $WHATSAPP_API_KEY)",
+    )
+    command.add_argument(
+        "--base-url",
+        action="append",
+        help=f"API base URL, repeatable for several API nodes (default: $WHATSAPP_API_URL or {DEFAULT_BASE_URL})",
+    )
+    command.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes (default: one per CPU)",
+    )
+    command.add_argument("--concurrency", type=int, default=10, help="sends in flight per worker (default: 10)")
+    command.add_argument("--checkpoint", help="checkpoint file (default: INPUT.checkpoint)")
+    command.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=1.0,
+        help="seconds between checkpoint writes (default: 1)",
+    )
+    command.add_argument("--failures", help="append failed rows, with their error, to this NDJSON file")
+    command.add_argument("--restart", action="store_true", help="ignore an existing checkpoint and start over")
+    command.add_argument("--quiet", action="store_true", help="do not show progress")
+    command.set_defaults(handler=broadcast)
+
+    args = parser.parse_args(argv)
+    if args.command == "broadcast":
+        if not args.api_key:
+            command.error("an API key is required (--api-key or $WHATSAPP_API_KEY)")
+        if args.workers < 1 or args.concurrency < 1:
+            command.error("--workers and --concurrency must be at least 1")
+    return args.handler(args)
@@ -3,17 +3,24 @@ WhatsApp API Platform - Python SDK
 Main client class
 """
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Optional, Dict, Any
-from .exceptions import (
-    WhatsAppAPIError,
-    AuthenticationError,
-    ValidationError,
-    RateLimitError,
-    NotFoundError,
-    ServerError,
-)
+from requests.adapters import HTTPAdapter
+from typing import Callable, Optional, Dict, Any, List, Sequence, Union
+from .cache import ResponseCache
+from .codec import JSONCodec, get_codec
+from .endpoints import Endpoints
+from .events import EventStream, gateway_url
+from .exceptions import WhatsAppAPIError, CircuitOpenError, RateLimitError, ServerError, raise_for_status
+from .hooks import Hook, Hooks, RequestInfo, content_length
+from .idempotency import IDEMPOTENCY_HEADER, MUTATING_METHODS, hedge, in_progress_delay, new_key
+from .metrics import MetricsCollector
+from .multipart import MultipartEncoder
+from .ratelimit import RateLimiter
+from .retry import RETRY_STATUSES, Backoff, CircuitBreaker, RetryBudget
+from .singleflight import SingleFlight
 from .resources import Sessions, Messages, Contacts, Groups, Webhooks
 
 
@@ -23,22 +30,109 @@ class WhatsAppAPI:
     
     Args:
         api_key: Your API key
-        base_url: Base URL of the API (default: http://localhost:3000/api/v1)
+        base_url: Base URL of the API (default: http://localhost:3000/api/v1),
+            or a list of base URLs of several API nodes
         timeout: Request timeout in seconds (default: 30)
         max_retries: Maximum number of retries (default: 3)
+        pool_connections: Number of per-host connection pools to cache (default: 10)
+        pool_maxsize: Maximum keep-alive connections per host (default: 10)
+        pool_block: Block when the pool is exhausted instead of opening
+            throwaway connections (default: False)
+        rate_limiter: Rate limiter pacing requests from the server's
+            RateLimit headers; pass one to share it between clients
+        cache: Optional response cache for GET requests; writes through
+            this client invalidate affected entries
+        metrics: Optional metrics collector fed by this client's hooks
+        json_codec: JSON codec for request and response bodies: a JSONCodec,
+            ``"orjson"``, ``"ujson"`` or ``"json"`` (default: the fastest
+            one installed)
+        circuit_breaker: Optional per-route circuit breaker; requests to a
+            failing route fail fast with CircuitOpenError
+        retry_budget: Cap on retries as a fraction of traffic (default: a
+            RetryBudget of 20%); pass one to share it between clients
+        backoff: Delay between retries (default: decorrelated jitter from
+            0.5s to 30s)
+        health_check_interval: Seconds between health checks of the API
+            nodes when ``base_url`` lists several (default: 10)
+        coalesce_reads: Share one request between concurrent identical GETs
+            (default: True)
+
+    Connection errors, timeouts and 502/503/504 responses are retried up
+    to ``max_retries`` attempts while the retry budget allows.
+
+    With several base URLs, a background thread checks each node's
+    ``/health`` route and requests go to the fastest healthy node; a
+    connection error takes the node out of rotation and the request is
+    retried on another node at once. See ``endpoints.snapshot()``.
+
+    Register callbacks on ``hooks`` (or with ``on()``) to observe every
+    request attempt: ``before_request``, ``after_response``, ``on_retry``
+    and ``on_error``.
+
+    Every POST, PUT and DELETE carries an ``Idempotency-Key`` header that is
+    reused across its retries, so a send retried after a timeout is not
+    delivered twice. The key is returned as ``idempotency_key`` in the
+    response data and set on raised errors.
+
+    The client keeps a single keep-alive connection pool for its lifetime and
+    may be shared between threads. Call ``close()`` (or use the client as a
+    context manager) to release pooled connections.
     """
 
     def __init__(
         self,
         api_key: str,
-        base_url: str = "http://localhost:3000/api/v1",
+        base_url: Union[str, Sequence[str]] = "http://localhost:3000/api/v1",
         timeout: int = 30,
         max_retries: int = 3,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[MetricsCollector] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        backoff: Optional[Backoff] = None,
+        health_check_interval: float = 10,
+        coalesce_reads: bool = True,
     ):
         self.api_key = api_key
-        self.base_url = base_url.rstrip("/")
+        urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        self.base_url = urls[0].rstrip("/")
+        self.endpoints: Optional[Endpoints] = None
+        if len(urls) > 1:
+            self.endpoints = Endpoints(urls, interval=health_check_interval)
+            self.endpoints.start()
         self.timeout = timeout
         self.max_retries = max_retries
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce_reads else None
+        self.json_codec = get_codec(json_codec)
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget or RetryBudget()
+        self.backoff = backoff or Backoff()
+        self.hooks = Hooks()
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.attach(self.hooks)
+
+        # Shared keep-alive connection pool; retries are handled in _request
+        self._session = requests.Session()
+        self._session.headers.update(self._get_headers())
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=0,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._hedge_pool_size = pool_maxsize
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
 
         # Initialize resource modules
         self.sessions = Sessions(self)
@@ -47,6 +141,24 @@ class WhatsAppAPI:
         self.groups = Groups(self)
         self.webhooks = Webhooks(self)
 
+    def event_stream(self, token: str, sessions: Optional[List[str]] = None, **kwargs) -> EventStream:
+        """
+        Create a real-time event stream for this API's Socket.IO gateway
+
+        Args:
+            token: JWT access token of the user (the gateway does not accept API keys)
+            sessions: Session IDs to join
+            **kwargs: Further EventStream options
+
+        Returns:
+            Unconnected EventStream; use it as a context manager or call connect()
+        """
+        return EventStream(gateway_url(self._base_url()), token, sessions=sessions, **kwargs)
+
+    def on(self, event: str) -> Callable[[Hook], Hook]:
+        """Register a request hook, as a decorator (see ``Hooks``)"""
+        return self.hooks.on(event)
+
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with API key"""
         return {
@@ -55,30 +167,36 @@ class WhatsAppAPI:
             "User-Agent": "WhatsApp-API-Python-SDK/1.0.0",
         }
 
+    def _base_url(self) -> str:
+        return self.endpoints.current() if self.endpoints is not None else self.base_url
+
+    def close(self) -> None:
+        """Close pooled connections and stop health checks"""
+        self._session.close()
+        if self.endpoints is not None:
+            self.endpoints.stop()
+        with self._hedge_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def __enter__(self) -> "WhatsAppAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response and raise appropriate exceptions"""
         try:
-            data = response.json()
+            data = self.json_codec.loads(response.content)
         except ValueError:
+            data = None
+        if not isinstance(data, dict):
             data = {"error": "Invalid JSON response"}
 
-        if response.status_code == 200 or response.status_code == 201:
-            return data
-
-        error_message = data.get("error", "Unknown error")
-
-        if response.status_code == 401:
-            raise AuthenticationError(error_message, response.status_code, data)
-        elif response.status_code == 400:
-            raise ValidationError(error_message, response.status_code, data)
-        elif response.status_code == 429:
-            raise RateLimitError(error_message, response.status_code, data)
-        elif response.status_code == 404:
-            raise NotFoundError(error_message, response.status_code, data)
-        elif response.status_code >= 500:
-            raise ServerError(error_message, response.status_code, data)
-        else:
-            raise WhatsAppAPIError(error_message, response.status_code, data)
+        raise_for_status(response.status_code, data)
+        return data
 
     def _request(
         self,
@@ -87,7 +205,10 @@ class WhatsAppAPI:
         data: Optional[Dict] = None,
         params: Optional[Dict] = None,
         files: Optional[Dict] = None,
-    ) -> Dict[str, Any]:
+        stream: bool = False,
+        decode: bool = True,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
         """
         Make HTTP request with retry logic
         
@@ -96,64 +217,295 @@ class WhatsAppAPI:
             endpoint: API endpoint
             data: Request body data
             params: Query parameters
-            files: Files to upload
+            files: Files to upload, sent as multipart form data with ``data``
+                as the form fields; may be a prebuilt MultipartEncoder
+            stream: Return the unread response instead of its data
+            decode: Decode successful responses; when False, their status
+                code is returned instead (error responses always raise)
+            idempotency_key: Key sent with mutating requests (default: a
+                new key per call, shared by its retries)
             
         Returns:
             Response data
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = self._get_headers()
+        path = endpoint.lstrip("/")
 
-        # Remove Content-Type for file uploads
+        body = None
+        headers = None
         if files:
-            headers.pop("Content-Type", None)
+            body = files if isinstance(files, MultipartEncoder) else MultipartEncoder(data, files)
+            headers = body.headers
+        elif data is not None:
+            body = self.json_codec.dumps(data)
+
+        if method in MUTATING_METHODS:
+            idempotency_key = idempotency_key or new_key()
+            headers = dict(headers or {}, **{IDEMPOTENCY_HEADER: idempotency_key})
+        else:
+            idempotency_key = None
+
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        delay = None
 
         for attempt in range(self.max_retries):
+            wait = self.rate_limiter.acquire(endpoint)
+            self._check_circuit(method, endpoint, attempt, idempotency_key)
+            info = RequestInfo(method, endpoint, attempt, wait)
+            info.idempotency_key = idempotency_key
+            info.base_url = self._base_url()
+            retry_delay = None
+            recorded = False
             try:
-                response = requests.request(
+                self.hooks.emit("before_request", info)
+                start = time.monotonic()
+                response = self._session.request(
                     method=method,
-                    url=url,
-                    json=data if not files else None,
+                    url=f"{info.base_url}/{path}",
+                    data=body,
                     params=params,
-                    files=files,
                     headers=headers,
                     timeout=self.timeout,
+                    stream=stream,
                 )
+                info.elapsed = time.monotonic() - start
+                info.status_code = response.status_code
+                info.request_bytes = content_length(response.request.headers.get("Content-Length"))
+                info.response_bytes = (
+                    content_length(response.headers.get("Content-Length")) if stream else len(response.content)
+                )
+                self.hooks.emit("after_response", info)
+                self._record_outcome(endpoint, response.status_code < 500)
+                recorded = True
 
-                return self._handle_response(response)
+                retry_delay = self.rate_limiter.update(endpoint, response.status_code, response.headers)
+                in_progress = in_progress_delay(response.status_code, response.headers)
+                if in_progress is not None and idempotency_key and attempt < self.max_retries - 1:
+                    # An earlier attempt with this key is still being processed
+                    response.close()
+                    self._retry(info, in_progress)
+                    continue
+                if stream and response.status_code in (200, 201):
+                    return response
+                if not decode and response.status_code in (200, 201):
+                    return response.status_code
+                result = self._handle_response(response)
+                if idempotency_key:
+                    result["idempotency_key"] = idempotency_key
+                return result
 
             except (requests.ConnectionError, requests.Timeout) as e:
-                if attempt == self.max_retries - 1:
-                    raise WhatsAppAPIError(f"Connection error: {str(e)}")
-                
-                # Exponential backoff
-                time.sleep(2 ** attempt)
+                self._record_outcome(endpoint, False)
+                info.error = e
+                if self._failover(info.base_url) and attempt < self.max_retries - 1:
+                    # Another node is up: retry there without backing off
+                    self._retry(info, 0)
+                    continue
+                if not self._may_retry(attempt):
+                    info.error = WhatsAppAPIError(f"Connection error: {str(e)}")
+                    info.error.idempotency_key = idempotency_key
+                    self.hooks.emit("on_error", info)
+                    raise info.error
+
+                delay = self.backoff.next(delay)
+                self._retry(info, delay)
 
             except RateLimitError as e:
+                info.error = e
+                e.idempotency_key = idempotency_key
                 if attempt == self.max_retries - 1:
+                    self.hooks.emit("on_error", info)
                     raise
-                
-                # Wait before retrying on rate limit
-                time.sleep(5 * (attempt + 1))
 
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make GET request"""
-        return self._request("GET", endpoint, params=params)
+                # The limiter holds the retry until the server's Retry-After
+                # or reset time; back off if it sent neither. These retries
+                # add no load, so they do not draw on the retry budget
+                if retry_delay is None:
+                    delay = self.backoff.next(delay)
+                self._retry(info, delay if retry_delay is None else 0)
+
+            except ServerError as e:
+                info.error = e
+                e.idempotency_key = idempotency_key
+                if e.status_code not in RETRY_STATUSES or not self._may_retry(attempt):
+                    self.hooks.emit("on_error", info)
+                    raise
+
+                delay = self.backoff.next(delay)
+                self._retry(info, delay)
+
+            except WhatsAppAPIError as e:
+                info.error = e
+                e.idempotency_key = idempotency_key
+                self.hooks.emit("on_error", info)
+                raise
+
+            except BaseException:
+                # Cancelled (e.g. the losing copy of a hedged send) or failed
+                # without telling anything about the server's health
+                if not recorded:
+                    self._release_probe(endpoint)
+                raise
+
+    def _check_circuit(self, method: str, endpoint: str, attempt: int, idempotency_key: Optional[str]) -> None:
+        """Fail fast while the endpoint's circuit is open"""
+        if self.circuit_breaker is None or self.circuit_breaker.allow(endpoint):
+            return
+        info = RequestInfo(method, endpoint, attempt)
+        info.idempotency_key = idempotency_key
+        info.error = CircuitOpenError(
+            f"Circuit open for {endpoint}; retry in {self.circuit_breaker.retry_in(endpoint):.1f}s"
+        )
+        info.error.idempotency_key = idempotency_key
+        self.hooks.emit("on_error", info)
+        raise info.error
+
+    def _record_outcome(self, endpoint: str, healthy: bool) -> None:
+        """Report whether the server handled an attempt to the circuit breaker"""
+        if self.circuit_breaker is None:
+            return
+        if healthy:
+            self.circuit_breaker.record_success(endpoint)
+        else:
+            self.circuit_breaker.record_failure(endpoint)
+
+    def _release_probe(self, endpoint: str) -> None:
+        """Give back the circuit breaker probe slot of an attempt without an outcome"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(endpoint)
+
+    def _failover(self, base_url: str) -> bool:
+        """Take a failed node out of rotation; whether another node is up"""
+        return self.endpoints is not None and self.endpoints.mark_down(base_url)
+
+    def _may_retry(self, attempt: int) -> bool:
+        """Whether a failed attempt has attempts and retry budget left"""
+        if attempt >= self.max_retries - 1:
+            return False
+        return self.retry_budget is None or self.retry_budget.try_retry()
+
+    def _retry(self, info: RequestInfo, delay: float) -> None:
+        """Report a retried attempt to hooks and back off"""
+        info.delay = delay
+        self.hooks.emit("on_retry", info)
+        if delay:
+            time.sleep(delay)
+
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        decode: bool = True,
+        cache: bool = True,
+    ) -> Any:
+        """
+        Make GET request; with ``decode=False`` return only the status code
+
+        Concurrent identical requests (same endpoint and params) share one
+        in-flight request, unless ``coalesce_reads`` is off. With
+        ``cache=False`` the response cache is not read, so the response is
+        always the server's; it still replaces the cached entry.
+        """
+        if not decode:
+            return self._request("GET", endpoint, params=params, decode=False)
+
+        cache_key = self.cache.key(endpoint, params) if cache and self.cache is not None else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        key = self.single_flight.key(endpoint, params) if self.single_flight is not None else None
+        if key is None:
+            return self._fetch(endpoint, params)
+        return self.single_flight.do(key, lambda: self._fetch(endpoint, params))
+
+    def _fetch(self, endpoint: str, params: Optional[Dict]) -> Dict[str, Any]:
+        """Make GET request, storing the response in the cache"""
+        cache_key = self.cache.key(endpoint, params) if self.cache is not None else None
+        if cache_key is None:
+            return self._request("GET", endpoint, params=params)
+
+        generation = self.cache.generation(endpoint)
+        response = self._request("GET", endpoint, params=params)
+        self.cache.set(cache_key, response, generation)
+        return response
+
+    def _write(
+        self,
+        method: str,
+        endpoint: str,
+        hedge_after: Optional[float] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Make a mutating request, invalidating cached reads it affects"""
+        try:
+            if hedge_after is None:
+                return self._request(method, endpoint, **kwargs)
+
+            # Both copies of a hedged request must share one key
+            kwargs["idempotency_key"] = kwargs.get("idempotency_key") or new_key()
+            return hedge(self._hedger(), lambda: self._request(method, endpoint, **kwargs), hedge_after)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(method, endpoint)
+            if self.single_flight is not None:
+                self.single_flight.forget(endpoint)
+
+    def _hedger(self) -> ThreadPoolExecutor:
+        """Thread pool running hedged copies, created on the first hedged request"""
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=self._hedge_pool_size)
+            return self._hedge_executor
+
+    def stream(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
+        """Make GET request and return the unread response; the caller must close it"""
+        return self._request("GET", endpoint, params=params, stream=True)
 
     def post(
         self,
         endpoint: str,
         data: Optional[Dict] = None,
-        files: Optional[Dict] = None,
-    ) -> Dict[str, Any]:
-        """Make POST request"""
-        return self._request("POST", endpoint, data=data, files=files)
+        files: Optional[Union[Dict, MultipartEncoder]] = None,
+        decode: bool = True,
+        idempotency_key: Optional[str] = None,
+        hedge_after: Optional[float] = None,
+    ) -> Any:
+        """
+        Make POST request; with ``decode=False`` return only the status code
 
-    def put(self, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make PUT request"""
-        return self._request("PUT", endpoint, data=data)
+        With ``hedge_after``, a second copy of the request (same idempotency
+        key) is sent if no response arrives within that many seconds, and
+        the first response wins. Do not hedge file uploads.
+        """
+        return self._write(
+            "POST",
+            endpoint,
+            hedge_after=hedge_after,
+            data=data,
+            files=files,
+            decode=decode,
+            idempotency_key=idempotency_key,
+        )
+
+    def put(
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        decode: bool = True,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        """Make PUT request; with ``decode=False`` return only the status code"""
+        return self._write("PUT", endpoint, data=data, decode=decode, idempotency_key=idempotency_key)
 
-    def delete(self, endpoint: str) -> Dict[str, Any]:
-        """Make DELETE request"""
-        return self._request("DELETE", endpoint)
+    def delete(
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        decode: bool = True,
+        idempotency_key: Optional[str] = None,
+    ) -> Any:
+        """Make DELETE request; with ``decode=False`` return only the status code"""
+        return self._write("DELETE", endpoint, data=data, decode=decode, idempotency_key=idempotency_key)
 
@@ -0,0 +1,86 @@
+"""
+WhatsApp API Platform - Python SDK
+JSON codecs
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+
+class JSONCodec:
+    """
+    Encoder and decoder used for request and response bodies
+
+    ``dumps`` returns the encoded body as bytes; ``loads`` decodes raw
+    response bytes and raises ``ValueError`` on invalid JSON.
+
+    Args:
+        name: Codec name, reported in ``WhatsAppAPI.json_codec.name``
+        dumps: Callable encoding an object to bytes
+        loads: Callable decoding bytes to an object
+    """
+
+    __slots__ = ("name", "dumps", "loads")
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any]):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"<JSONCodec {self.name}>"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+STDLIB = JSONCodec("json", _stdlib_dumps, json.loads)
+
+CODECS = {"json": STDLIB}
+if ujson is not None:
+    CODECS["ujson"] = JSONCodec(
+        "ujson",
+        lambda obj: ujson.dumps(obj, ensure_ascii=False).encode(),
+        ujson.loads,
+    )
+if orjson is not None:
+    # orjson decodes bytes directly, without an intermediate str
+    CODECS["orjson"] = JSONCodec(
+        "orjson",
+        lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        orjson.loads,
+    )
+
+
+def get_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Resolve a JSON codec
+
+    Args:
+        codec: A JSONCodec, a codec name (``orjson``, ``ujson`` or
+            ``json``), or None for the fastest one installed
+
+    Returns:
+        The codec
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        for name in ("orjson", "ujson"):
+            if name in CODECS:
+                return CODECS[name]
+        return STDLIB
+    if codec not in CODECS:
+        raise ValueError(f"JSON codec {codec!r} is not installed")
+    return CODECS[codec]
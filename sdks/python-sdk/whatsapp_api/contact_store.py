@@ -0,0 +1,466 @@
+"""
+WhatsApp API Platform - Python SDK
+Local contact store
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .models import Contact
+
+logger = logging.getLogger(__name__)
+
+# Cursor of a store that has not loaded anything yet
+EPOCH = "1970-01-01T00:00:00.000Z"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+Cursor = Tuple[str, Optional[str]]
+
+
+def _phone_key(phone: Optional[str]) -> str:
+    """Digits of a phone number without an international ``00`` prefix"""
+    digits = "".join(c for c in phone or "" if c.isdigit())
+    return digits[2:] if digits.startswith("00") else digits
+
+
+def _name_key(name: Optional[str]) -> str:
+    return (name or "").casefold()
+
+
+def _timestamp(moment: datetime) -> str:
+    """A UTC time in the server's timestamp format, which sorts as a string"""
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}Z"
+
+
+def _now() -> str:
+    return _timestamp(datetime.now(timezone.utc))
+
+
+def _rewind(timestamp: str, seconds: float) -> str:
+    """A server timestamp moved back by some seconds"""
+    return _timestamp(datetime.fromisoformat(timestamp.replace("Z", "+00:00")) - timedelta(seconds=seconds))
+
+
+def _later(cursor: Cursor, other: Cursor) -> bool:
+    """Whether a cursor is past another (server timestamps sort as strings)"""
+    return cursor[0] > other[0] or (cursor[0] == other[0] and (cursor[1] or "") > (other[1] or ""))
+
+
+class _BaseContactStore:
+    """Indexes and persistence shared by the blocking and asyncio stores"""
+
+    def __init__(
+        self,
+        client: Any,
+        session_id: str,
+        path: Optional[str] = None,
+        page_size: int = 100,
+        overlap: float = 5,
+    ):
+        self.client = client
+        self.session_id = session_id
+        self.path = path
+        self.page_size = page_size
+        self.overlap = overlap
+
+        self.refreshes = 0
+        self.rebuilds = 0
+        self.refreshed_at: Optional[float] = None
+
+        self._by_id: Dict[str, Contact] = {}
+        self._by_phone: Dict[str, str] = {}
+        # (casefolded name, id), sorted for prefix search
+        self._names: List[Tuple[str, str]] = []
+        self._cursor: Cursor = (EPOCH, None)
+        # When the last completed refresh started
+        self._started_at: Optional[str] = None
+        self._lock = threading.RLock()
+
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+            self._load()
+
+    def get(self, contact_id: str) -> Optional[Contact]:
+        """Contact with an ID, or None"""
+        return self._by_id.get(contact_id)
+
+    def by_phone(self, phone: str) -> Optional[Contact]:
+        """
+        Contact with a phone number, or None
+
+        Numbers match on their digits, so ``+1 (555) 010-0000``,
+        ``0015550100000`` and ``15550100000`` find the same contact.
+        """
+        with self._lock:
+            contact_id = self._by_phone.get(_phone_key(phone))
+            return self._by_id.get(contact_id) if contact_id is not None else None
+
+    def search(self, prefix: str, limit: int = 10) -> List[Contact]:
+        """Contacts whose name starts with a prefix, case-insensitively, by name"""
+        key = _name_key(prefix)
+        with self._lock:
+            start = bisect.bisect_left(self._names, (key, ""))
+            found = []
+            for name, contact_id in self._names[start:start + limit]:
+                if not name.startswith(key):
+                    break
+                found.append(self._by_id[contact_id])
+            return found
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, contact_id: object) -> bool:
+        return contact_id in self._by_id
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Size, change cursor and refresh counters"""
+        with self._lock:
+            return {
+                "contacts": len(self._by_id),
+                "updated_since": self._cursor[0],
+                "refreshes": self.refreshes,
+                "rebuilds": self.rebuilds,
+                "refreshed_at": self.refreshed_at,
+            }
+
+    def _index(self, data: Dict[str, Any]) -> None:
+        self._unindex(data["id"])
+        contact = Contact.from_dict(data)
+        self._by_id[contact.id] = contact
+        phone = _phone_key(contact.phone_number)
+        if phone:
+            self._by_phone[phone] = contact.id
+        bisect.insort(self._names, (_name_key(contact.name), contact.id))
+
+    def _unindex(self, contact_id: str) -> None:
+        contact = self._by_id.pop(contact_id, None)
+        if contact is None:
+            return
+        phone = _phone_key(contact.phone_number)
+        if self._by_phone.get(phone) == contact_id:
+            del self._by_phone[phone]
+        entry = (_name_key(contact.name), contact_id)
+        index = bisect.bisect_left(self._names, entry)
+        if index < len(self._names) and self._names[index] == entry:
+            del self._names[index]
+
+    def _replace(self, contacts: Iterable[Dict[str, Any]]) -> None:
+        """Swap in a complete set of contacts"""
+        by_id = {data["id"]: Contact.from_dict(data) for data in contacts}
+        by_phone = {}
+        for contact in by_id.values():
+            phone = _phone_key(contact.phone_number)
+            if phone:
+                by_phone[phone] = contact.id
+        names = sorted((_name_key(contact.name), contact.id) for contact in by_id.values())
+        with self._lock:
+            self._by_id, self._by_phone, self._names = by_id, by_phone, names
+
+    def _load(self) -> None:
+        meta = dict(self._db.execute("SELECT key, value FROM meta"))
+        if meta.get("session_id", self.session_id) != self.session_id:
+            raise ValueError(f"{self.path} holds the contacts of session {meta['session_id']}")
+        self._replace(json.loads(data) for (data,) in self._db.execute("SELECT data FROM contacts"))
+        if "updated_since" in meta:
+            self._cursor = (meta["updated_since"], meta.get("after_id"))
+        self._started_at = meta.get("started_at")
+
+    def _save(self, contacts: List[Dict[str, Any]], cursor: Cursor, replace: bool = False) -> None:
+        if self._db is None:
+            return
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                if replace:
+                    self._db.execute("DELETE FROM contacts")
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO contacts (id, data) VALUES (?, ?)",
+                    [(data["id"], json.dumps(data)) for data in contacts],
+                )
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("session_id", self.session_id),
+                        ("updated_since", cursor[0]),
+                        ("after_id", cursor[1]),
+                        ("started_at", self._started_at),
+                    ],
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def _params(self, cursor: Cursor) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "limit": self.page_size,
+            "updated_since": cursor[0],
+            "after_id": cursor[1],
+            # A cached page could hide changes made since it was cached
+            "cache": False,
+        }
+
+    def _start_cursor(self) -> Cursor:
+        """
+        Where a refresh starts
+
+        A change the last refresh did not see, because it was committed
+        late or stamped by a slower clock, is stamped at most ``overlap``
+        seconds before that refresh started; changes since then are read
+        again, and everything older continues from the cursor.
+        """
+        floor = _rewind(self._started_at or self._cursor[0], self.overlap)
+        return (floor, None) if floor < self._cursor[0] else self._cursor
+
+    def _apply(self, contacts: List[Dict[str, Any]], cursor: Cursor) -> Cursor:
+        """Index and persist one batch of changes; returns the cursor after it"""
+        if not contacts:
+            return cursor
+        cursor = (contacts[-1]["updated_at"], contacts[-1]["id"])
+        with self._lock:
+            for data in contacts:
+                self._index(data)
+            # Changes in the overlap may end before the last one seen
+            if _later(cursor, self._cursor):
+                self._cursor = cursor
+            self._save(contacts, self._cursor)
+        return cursor
+
+    def _finish(self, started_at: str, total: Optional[int]) -> bool:
+        """Record a refresh; whether the store must be rebuilt to drop deleted contacts"""
+        with self._lock:
+            self._started_at = started_at
+            self._save([], self._cursor)
+        self.refreshes += 1
+        self.refreshed_at = time.time()
+        if total is not None and total != len(self._by_id):
+            logger.info(
+                "Contact store of session %s has %d contacts, the server %d; rebuilding",
+                self.session_id,
+                len(self._by_id),
+                total,
+            )
+            return True
+        return False
+
+    def _rebuilt(self, started_at: str, contacts: List[Dict[str, Any]], cursor: Cursor) -> None:
+        self._replace(contacts)
+        with self._lock:
+            self._started_at = started_at
+            self._save(contacts, cursor, replace=True)
+            self._cursor = cursor
+        self.rebuilds += 1
+        self.refreshed_at = time.time()
+
+    def close(self) -> None:
+        """Close the SQLite database"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+def _page(response: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    data = response.get("data") or {}
+    return data.get("contacts") or [], (data.get("pagination") or {}).get("total")
+
+
+class ContactStore(_BaseContactStore):
+    """
+    Thread-safe local copy of a session's contacts, indexed for lookups
+
+    Contacts are looked up by ID, by phone number (matching on digits) and
+    by name prefix without a network call. ``refresh`` fetches only the
+    contacts changed since the last refresh, using the ``updated_since``
+    cursor of ``contacts.list``; deletions are detected by comparing the
+    server's contact count and handled by rebuilding the store. With a
+    ``path``, the store is kept in SQLite and a restarted process resumes
+    from where its last refresh stopped.
+
+    Args:
+        client: WhatsAppAPI client
+        session_id: Session whose contacts are stored
+        path: Optional SQLite file persisting the store
+        page_size: Contacts fetched per request (default: 100)
+        overlap: Seconds before the last change seen that a refresh starts
+            from, to catch changes committed late (default: 5)
+
+    Example:
+        store = ContactStore(client, "session-id", path="contacts.db")
+        store.refresh()
+        store.start(interval=60)  # keep refreshing in the background
+        contact = store.by_phone("+1 555 010 0000")
+    """
+
+    def __init__(self, client: Any, session_id: str, **kwargs: Any):
+        super().__init__(client, session_id, **kwargs)
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _fetch(self, cursor: Cursor, apply: bool) -> Tuple[List[Dict[str, Any]], Cursor]:
+        """Fetch every contact changed since a cursor, in keyset order"""
+        fetched = []
+        while True:
+            contacts, _ = _page(self.client.contacts.list(**self._params(cursor)))
+            if apply:
+                cursor = self._apply(contacts, cursor)
+            else:
+                fetched.extend(contacts)
+                if contacts:
+                    cursor = (contacts[-1]["updated_at"], contacts[-1]["id"])
+            if len(contacts) < self.page_size:
+                return fetched, cursor
+
+    def _count(self) -> Optional[int]:
+        _, total = _page(self.client.contacts.list(self.session_id, limit=1, cache=False))
+        return total
+
+    def refresh(self) -> None:
+        """Fetch the contacts changed since the last refresh; the first refresh loads all"""
+        if self._cursor[0] == EPOCH:
+            self.rebuild()
+            return
+        started_at = _now()
+        self._fetch(self._start_cursor(), apply=True)
+        if self._finish(started_at, self._count()):
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Reload every contact, dropping deleted ones"""
+        started_at = _now()
+        contacts, cursor = self._fetch((EPOCH, None), apply=False)
+        self._rebuilt(started_at, contacts, cursor)
+
+    def start(self, interval: float = 60) -> None:
+        """Refresh every ``interval`` seconds in a daemon thread"""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, args=(interval,), name="whatsapp-api-contacts", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background refreshing"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Contact store refresh failed")
+
+    def close(self) -> None:
+        """Stop refreshing and close the SQLite database"""
+        self.stop()
+        super().close()
+
+    def __enter__(self) -> "ContactStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class AsyncContactStore(_BaseContactStore):
+    """
+    Asyncio version of ``ContactStore``, refreshed through
+    ``AsyncWhatsAppAPI``; lookups are plain methods
+    """
+
+    def __init__(self, client: Any, session_id: str, **kwargs: Any):
+        super().__init__(client, session_id, **kwargs)
+        self._task: Optional["asyncio.Task"] = None
+
+    async def _fetch(self, cursor: Cursor, apply: bool) -> Tuple[List[Dict[str, Any]], Cursor]:
+        """Fetch every contact changed since a cursor, in keyset order"""
+        fetched = []
+        while True:
+            contacts, _ = _page(await self.client.contacts.list(**self._params(cursor)))
+            if apply:
+                cursor = self._apply(contacts, cursor)
+            else:
+                fetched.extend(contacts)
+                if contacts:
+                    cursor = (contacts[-1]["updated_at"], contacts[-1]["id"])
+            if len(contacts) < self.page_size:
+                return fetched, cursor
+
+    async def _count(self) -> Optional[int]:
+        _, total = _page(await self.client.contacts.list(self.session_id, limit=1, cache=False))
+        return total
+
+    async def refresh(self) -> None:
+        """Fetch the contacts changed since the last refresh; the first refresh loads all"""
+        if self._cursor[0] == EPOCH:
+            await self.rebuild()
+            return
+        started_at = _now()
+        await self._fetch(self._start_cursor(), apply=True)
+        if self._finish(started_at, await self._count()):
+            await self.rebuild()
+
+    async def rebuild(self) -> None:
+        """Reload every contact, dropping deleted ones"""
+        started_at = _now()
+        contacts, cursor = await self._fetch((EPOCH, None), apply=False)
+        self._rebuilt(started_at, contacts, cursor)
+
+    def start(self, interval: float = 60) -> None:
+        """Refresh every ``interval`` seconds in a task"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run(interval))
+
+    async def stop(self) -> None:
+        """Stop background refreshing"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Contact store refresh failed")
+
+    async def close(self) -> None:
+        """Stop refreshing and close the SQLite database"""
+        await self.stop()
+        super().close()
+
+    async def __aenter__(self) -> "AsyncContactStore":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
@@ -0,0 +1,226 @@
+"""
+WhatsApp API Platform - Python SDK
+Health-checked API endpoints
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+HEALTH_PATH = "/health"
+
+
+class _Node:
+    """Health state of one base URL"""
+
+    __slots__ = ("url", "healthy", "latency", "checked_at", "failed_at", "failures")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.healthy = True
+        self.latency: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.failed_at = 0.0
+        self.failures = 0
+
+
+class _BaseEndpoints:
+    """Node selection shared by the blocking and asyncio health checkers"""
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        interval: float = 10,
+        timeout: float = 2,
+        tolerance: float = 0.2,
+        smoothing: float = 0.3,
+    ):
+        if not urls:
+            raise ValueError("At least one base URL is required")
+        self.urls = [url.rstrip("/") for url in urls]
+        self.interval = interval
+        self.timeout = timeout
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self._nodes: Dict[str, _Node] = {url: _Node(url) for url in self.urls}
+        self._turn = 0
+        self._lock = threading.Lock()
+
+    def current(self) -> str:
+        """
+        Base URL to send the next request to
+
+        The healthy node with the lowest health-check latency; nodes within
+        ``tolerance`` of it take turns. With no healthy node, the one that
+        failed longest ago.
+        """
+        with self._lock:
+            healthy = [node for node in self._nodes.values() if node.healthy]
+            if not healthy:
+                return min(self._nodes.values(), key=lambda node: node.failed_at).url
+
+            measured = [node.latency for node in healthy if node.latency is not None]
+            if measured:
+                limit = min(measured) * (1 + self.tolerance)
+                healthy = [node for node in healthy if node.latency is None or node.latency <= limit]
+            self._turn += 1
+            return healthy[self._turn % len(healthy)].url
+
+    def mark_down(self, url: str) -> bool:
+        """
+        Take a node out of rotation after a connection error or timeout
+
+        It returns once a health check succeeds.
+
+        Returns:
+            Whether another healthy node is available
+        """
+        with self._lock:
+            node = self._nodes.get(url)
+            if node is not None:
+                self._fail(node)
+            return any(node.healthy for node in self._nodes.values())
+
+    def _fail(self, node: _Node) -> None:
+        if node.healthy:
+            logger.warning("API node %s is down", node.url)
+        node.healthy = False
+        node.failed_at = time.monotonic()
+        node.failures += 1
+
+    def _record(self, url: str, latency: Optional[float]) -> None:
+        """Record a health check result; latency None means it failed"""
+        with self._lock:
+            node = self._nodes[url]
+            node.checked_at = time.monotonic()
+            if latency is None:
+                self._fail(node)
+                return
+            if not node.healthy:
+                logger.info("API node %s is healthy again", node.url)
+            node.healthy = True
+            node.latency = latency if node.latency is None else (
+                self.smoothing * latency + (1 - self.smoothing) * node.latency
+            )
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Health, smoothed latency and failure count of every node"""
+        with self._lock:
+            return [
+                {"url": node.url, "healthy": node.healthy, "latency": node.latency, "failures": node.failures}
+                for node in self._nodes.values()
+            ]
+
+
+class Endpoints(_BaseEndpoints):
+    """
+    Several API nodes, health-checked by a background thread
+
+    Every ``interval`` seconds each node's ``/health`` route is requested;
+    a node is healthy while it answers 200 within ``timeout`` seconds, and
+    its latency is smoothed across checks. Requests go to the fastest
+    healthy node (see ``current``), and a node that fails a request with a
+    connection error leaves rotation until its next successful check.
+
+    Args:
+        urls: Base URLs of the API nodes, e.g. ``https://node1/api/v1``
+        interval: Seconds between health checks (default: 10)
+        timeout: Health check timeout in seconds (default: 2)
+        tolerance: Nodes whose latency is within this fraction of the
+            fastest take turns (default: 0.2)
+        smoothing: Weight of the newest latency sample (default: 0.3)
+    """
+
+    def __init__(self, urls: Sequence[str], **kwargs: Any):
+        super().__init__(urls, **kwargs)
+        self._http = requests.Session()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start health checking in a daemon thread"""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="whatsapp-api-health", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop health checking"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(self.timeout + 1)
+            self._thread = None
+        self._http.close()
+
+    def check(self) -> None:
+        """Health-check every node once"""
+        for url in self.urls:
+            start = time.monotonic()
+            try:
+                response = self._http.get(url + HEALTH_PATH, timeout=self.timeout)
+                response.close()
+                healthy = response.status_code == 200
+            except requests.RequestException:
+                healthy = False
+            self._record(url, time.monotonic() - start if healthy else None)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self.check()
+            self._stopped.wait(self.interval)
+
+
+class AsyncEndpoints(_BaseEndpoints):
+    """
+    Asyncio version of ``Endpoints``; health checks run as a task on the
+    client's event loop, using its aiohttp session
+    """
+
+    def __init__(self, urls: Sequence[str], **kwargs: Any):
+        super().__init__(urls, **kwargs)
+        self._task: Optional["asyncio.Task"] = None
+
+    def start(self, session: Any) -> None:
+        """Start health checking in a task using an aiohttp session"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run(session))
+
+    async def stop(self) -> None:
+        """Stop health checking"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def check(self, session: Any) -> None:
+        """Health-check every node once, concurrently"""
+        await asyncio.gather(*(self._check(session, url) for url in self.urls))
+
+    async def _check(self, session: Any, url: str) -> None:
+        start = time.monotonic()
+        try:
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with session.get(url + HEALTH_PATH, timeout=timeout) as response:
+                healthy = response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            healthy = False
+        self._record(url, time.monotonic() - start if healthy else None)
+
+    async def _run(self, session: Any) -> None:
+        while True:
+            await self.check(session)
+            await asyncio.sleep(self.interval)
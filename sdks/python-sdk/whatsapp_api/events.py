@@ -0,0 +1,321 @@
+"""
+WhatsApp API Platform - Python SDK
+Real-time event stream
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from urllib.parse import urlsplit
+
+try:
+    import socketio
+except ImportError:  # pragma: no cover - optional dependency
+    socketio = None
+
+from .exceptions import WhatsAppAPIError
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[["StreamEvent"], Any]
+
+
+def gateway_url(base_url: str) -> str:
+    """Origin of the Socket.IO gateway for an API base URL"""
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _require_socketio() -> None:
+    if socketio is None:
+        raise ImportError(
+            "Event streams require python-socketio. "
+            "Install it with: pip install whatsapp-api-platform[realtime]"
+        )
+
+
+class StreamEvent:
+    """
+    An event pushed by the gateway
+
+    Attributes:
+        name: Event name, e.g. ``session:status`` or ``message:read``
+        data: Event payload
+        session_id: ``sessionId`` from the payload, if any
+    """
+
+    __slots__ = ("name", "data", "session_id")
+
+    def __init__(self, name: str, data: Any):
+        self.name = name
+        self.data = data
+        self.session_id = data.get("sessionId") if isinstance(data, dict) else None
+
+    def __repr__(self) -> str:
+        return f"<StreamEvent {self.name} session={self.session_id}>"
+
+
+class _BaseEventStream:
+    """State shared by the blocking and asyncio event streams"""
+
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        sessions: Optional[Iterable[str]] = None,
+        events: Optional[Iterable[str]] = None,
+        buffer_size: int = 1000,
+        reconnection_delay_max: float = 30,
+    ):
+        _require_socketio()
+        self.url = url
+        self.token = token
+        self.events: Optional[Set[str]] = set(events) if events else None
+        self.buffer_size = buffer_size
+        self.reconnection_delay_max = reconnection_delay_max
+        self.dropped = 0
+        self._sessions: Set[str] = set(sessions or ())
+        self._callbacks: Dict[str, List[Callback]] = {}
+
+    @property
+    def sessions(self) -> Set[str]:
+        """Sessions currently joined (rejoined after every reconnect)"""
+        return set(self._sessions)
+
+    def on(self, event: str = "*") -> Callable[[Callback], Callback]:
+        """Register a callback for an event name, or ``"*"`` for every event"""
+        def decorator(callback: Callback) -> Callback:
+            self._callbacks.setdefault(event, []).append(callback)
+            return callback
+        return decorator
+
+    def _wanted(self, name: str) -> bool:
+        return self.events is None or name in self.events
+
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            "reconnection": True,
+            "reconnection_attempts": 0,
+            "reconnection_delay_max": self.reconnection_delay_max,
+        }
+
+
+class EventStream(_BaseEventStream):
+    """
+    Blocking client for the Socket.IO event gateway
+
+    Connects with a user JWT, joins session rooms, and reconnects with
+    jittered backoff, rejoining every session after each reconnect. Events
+    are delivered to callbacks registered with ``on()`` and buffered for
+    iteration; when the buffer is full the oldest event is dropped and
+    counted in ``dropped``.
+
+    Requires the ``realtime`` extra (``python-socketio``).
+
+    Args:
+        url: Gateway origin, e.g. ``http://localhost:3000``
+        token: JWT access token of the user
+        sessions: Session IDs to join
+        events: Event names to buffer for iteration (default: all)
+        buffer_size: Events buffered for iteration (default: 1000)
+        reconnection_delay_max: Longest wait between reconnects (default: 30)
+
+    Example:
+        with client.event_stream(token, sessions=["session-id"]) as stream:
+            for event in stream:
+                print(event.name, event.data)
+    """
+
+    def __init__(self, url: str, token: str, **kwargs):
+        super().__init__(url, token, **kwargs)
+        self._queue: "queue.Queue[Optional[StreamEvent]]" = queue.Queue(maxsize=self.buffer_size)
+        self._lock = threading.Lock()
+        self._sio = socketio.Client(**self._client_options())
+        self._sio.on("connect", self._on_connect)
+        self._sio.on("*", self._on_event)
+
+    def connect(self, wait_timeout: float = 10) -> "EventStream":
+        """Connect to the gateway"""
+        try:
+            self._sio.connect(
+                self.url,
+                auth={"token": self.token},
+                socketio_path="socket.io",
+                wait_timeout=wait_timeout,
+            )
+        except socketio.exceptions.ConnectionError as e:
+            raise WhatsAppAPIError(f"Connection error: {str(e)}")
+        return self
+
+    def close(self) -> None:
+        """Disconnect and end iteration"""
+        self._sio.disconnect()
+        self._put(None)
+
+    def join(self, session_id: str) -> None:
+        """Subscribe to a session's events"""
+        self._sessions.add(session_id)
+        if self._sio.connected:
+            self._sio.emit("session:join", session_id)
+
+    def leave(self, session_id: str) -> None:
+        """Unsubscribe from a session's events"""
+        self._sessions.discard(session_id)
+        if self._sio.connected:
+            self._sio.emit("session:leave", session_id)
+
+    def request_status(self, session_id: str) -> None:
+        """Ask the gateway to push the current ``session:status``"""
+        self._sio.emit("session:status", {"sessionId": session_id})
+
+    def get(self, timeout: Optional[float] = None) -> Optional[StreamEvent]:
+        """Next buffered event, or None on timeout or once closed"""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def __iter__(self):
+        while True:
+            event = self._queue.get()
+            if event is None:
+                return
+            yield event
+
+    def __enter__(self) -> "EventStream":
+        return self.connect()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _on_connect(self) -> None:
+        for session_id in list(self._sessions):
+            self._sio.emit("session:join", session_id)
+
+    def _on_event(self, name: str, data: Any = None) -> None:
+        event = StreamEvent(name, data)
+        for callback in self._callbacks.get(name, []) + self._callbacks.get("*", []):
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Event callback failed for %r", event)
+        if self._wanted(name):
+            self._put(event)
+
+    def _put(self, event: Optional[StreamEvent]) -> None:
+        with self._lock:
+            while True:
+                try:
+                    self._queue.put_nowait(event)
+                    return
+                except queue.Full:
+                    try:
+                        self._queue.get_nowait()
+                        self.dropped += 1
+                    except queue.Empty:
+                        pass
+
+
+class AsyncEventStream(_BaseEventStream):
+    """
+    Asyncio client for the Socket.IO event gateway
+
+    The ``async for`` counterpart of ``EventStream``; callbacks may be
+    coroutine functions.
+    """
+
+    def __init__(self, url: str, token: str, **kwargs):
+        super().__init__(url, token, **kwargs)
+        # Created on first use, inside the event loop the stream runs in
+        self._queue: "Optional[asyncio.Queue[Optional[StreamEvent]]]" = None
+        self._sio = socketio.AsyncClient(**self._client_options())
+        self._sio.on("connect", self._on_connect)
+        self._sio.on("*", self._on_event)
+
+    def _events(self) -> "asyncio.Queue[Optional[StreamEvent]]":
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.buffer_size)
+        return self._queue
+
+    async def connect(self, wait_timeout: float = 10) -> "AsyncEventStream":
+        """Connect to the gateway"""
+        self._events()
+        try:
+            await self._sio.connect(
+                self.url,
+                auth={"token": self.token},
+                socketio_path="socket.io",
+                wait_timeout=wait_timeout,
+            )
+        except socketio.exceptions.ConnectionError as e:
+            raise WhatsAppAPIError(f"Connection error: {str(e)}")
+        return self
+
+    async def close(self) -> None:
+        """Disconnect and end iteration"""
+        await self._sio.disconnect()
+        self._put(None)
+
+    async def join(self, session_id: str) -> None:
+        """Subscribe to a session's events"""
+        self._sessions.add(session_id)
+        if self._sio.connected:
+            await self._sio.emit("session:join", session_id)
+
+    async def leave(self, session_id: str) -> None:
+        """Unsubscribe from a session's events"""
+        self._sessions.discard(session_id)
+        if self._sio.connected:
+            await self._sio.emit("session:leave", session_id)
+
+    async def request_status(self, session_id: str) -> None:
+        """Ask the gateway to push the current ``session:status``"""
+        await self._sio.emit("session:status", {"sessionId": session_id})
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[StreamEvent]:
+        """Next buffered event, or None on timeout or once closed"""
+        try:
+            return await asyncio.wait_for(self._events().get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def __aiter__(self):
+        while True:
+            event = await self._events().get()
+            if event is None:
+                return
+            yield event
+
+    async def __aenter__(self) -> "AsyncEventStream":
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _on_connect(self) -> None:
+        for session_id in list(self._sessions):
+            await self._sio.emit("session:join", session_id)
+
+    async def _on_event(self, name: str, data: Any = None) -> None:
+        event = StreamEvent(name, data)
+        for callback in self._callbacks.get(name, []) + self._callbacks.get("*", []):
+            try:
+                result = callback(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception("Event callback failed for %r", event)
+        if self._wanted(name):
+            self._put(event)
+
+    def _put(self, event: Optional[StreamEvent]) -> None:
+        events = self._events()
+        while True:
+            try:
+                events.put_nowait(event)
+                return
+            except asyncio.QueueFull:
+                events.get_nowait()
+                self.dropped += 1
@@ -12,6 +12,8 @@ class WhatsAppAPIError(Exception):
         self.message = message
         self.status_code = status_code
         self.response = response
+        # Key of the failed request, for retrying it safely
+        self.idempotency_key = None
 
 
 class AuthenticationError(WhatsAppAPIError):
@@ -43,3 +45,29 @@ class ServerError(WhatsAppAPIError):
 
     pass
 
+
+class CircuitOpenError(WhatsAppAPIError):
+    """Raised without sending the request while the endpoint's circuit is open"""
+
+    pass
+
+
+def raise_for_status(status_code: int, data: dict) -> None:
+    """Raise the exception matching an unsuccessful API response"""
+    if status_code == 200 or status_code == 201:
+        return
+
+    error_message = data.get("error", "Unknown error")
+
+    if status_code == 401:
+        raise AuthenticationError(error_message, status_code, data)
+    elif status_code == 400:
+        raise ValidationError(error_message, status_code, data)
+    elif status_code == 429:
+        raise RateLimitError(error_message, status_code, data)
+    elif status_code == 404:
+        raise NotFoundError(error_message, status_code, data)
+    elif status_code >= 500:
+        raise ServerError(error_message, status_code, data)
+    else:
+        raise WhatsAppAPIError(error_message, status_code, data)
@@ -0,0 +1,121 @@
+"""
+WhatsApp API Platform - Python SDK
+Request hooks
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+HOOK_EVENTS = ("before_request", "after_response", "on_retry", "on_error")
+
+Hook = Callable[["RequestInfo"], Any]
+
+
+class RequestInfo:
+    """
+    One attempt of an API request, as passed to hooks
+
+    Attributes:
+        method: HTTP method
+        endpoint: API endpoint, e.g. ``/messages/send``
+        attempt: Attempt number, starting at 0
+        wait: Seconds the rate limiter held the attempt before sending
+        status_code: Response status, or None if no response arrived
+        elapsed: Seconds from sending to receiving the response (headers
+            only for streamed responses)
+        request_bytes: Request body size, when known
+        response_bytes: Response body size, when known
+        delay: Seconds the client sleeps before the next attempt
+            (``on_retry`` only); a hold the rate limiter imposes after a 429
+            shows up as the next attempt's ``wait`` instead
+        error: Exception raised by the attempt, if any
+        idempotency_key: Key sent with a mutating request, shared by its
+            retries and hedged copies
+        base_url: Base URL of the API node the attempt was sent to
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "attempt",
+        "wait",
+        "status_code",
+        "elapsed",
+        "request_bytes",
+        "response_bytes",
+        "delay",
+        "error",
+        "idempotency_key",
+        "base_url",
+    )
+
+    def __init__(self, method: str, endpoint: str, attempt: int, wait: float = 0.0):
+        self.method = method
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.wait = wait
+        self.status_code: Optional[int] = None
+        self.elapsed: Optional[float] = None
+        self.request_bytes: Optional[int] = None
+        self.response_bytes: Optional[int] = None
+        self.delay: Optional[float] = None
+        self.error: Optional[Exception] = None
+        self.idempotency_key: Optional[str] = None
+        self.base_url: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<RequestInfo {self.method} {self.endpoint} attempt={self.attempt} status={self.status_code}>"
+
+
+def content_length(value: Optional[str]) -> Optional[int]:
+    """Parse a Content-Length header"""
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class Hooks:
+    """
+    Callbacks run around every request attempt
+
+    Events:
+        before_request: The attempt is about to be sent
+        after_response: A response arrived, whatever its status
+        on_retry: The attempt failed and another follows after ``delay``
+        on_error: The request failed for good
+
+    Hooks run in the calling thread (or event loop) and should be quick;
+    an exception raised by a hook is logged and never fails the request.
+    """
+
+    def __init__(self):
+        self._hooks: Dict[str, List[Hook]] = {event: [] for event in HOOK_EVENTS}
+
+    def add(self, event: str, hook: Hook) -> None:
+        """Register a hook for an event"""
+        if event not in self._hooks:
+            raise ValueError(f"Unknown hook event: {event!r}")
+        self._hooks[event].append(hook)
+
+    def remove(self, event: str, hook: Hook) -> None:
+        """Unregister a hook"""
+        if hook in self._hooks.get(event, ()):
+            self._hooks[event].remove(hook)
+
+    def on(self, event: str) -> Callable[[Hook], Hook]:
+        """Register a hook for an event, as a decorator"""
+        def decorator(hook: Hook) -> Hook:
+            self.add(event, hook)
+            return hook
+        return decorator
+
+    def emit(self, event: str, info: RequestInfo) -> None:
+        """Run the hooks registered for an event"""
+        for hook in self._hooks[event]:
+            try:
+                hook(info)
+            except Exception:
+                logger.exception("Request hook failed for %r", info)
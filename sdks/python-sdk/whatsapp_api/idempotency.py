@@ -0,0 +1,82 @@
+"""
+WhatsApp API Platform - Python SDK
+Idempotency keys and hedged requests
+"""
+
+import asyncio
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from typing import Any, Awaitable, Callable, Mapping, Optional
+
+from .ratelimit import _parse_retry_after
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Requests that get an idempotency key
+MUTATING_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+
+def new_key() -> str:
+    """Generate an idempotency key"""
+    return str(uuid.uuid4())
+
+
+def in_progress_delay(status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Seconds to wait before retrying a request the server is still processing
+
+    While a request with the same idempotency key is in progress (e.g. the
+    attempt that timed out), the server answers 409 with a Retry-After
+    header. Returns None for any other response.
+    """
+    if status_code != 409:
+        return None
+    return _parse_retry_after(headers.get("Retry-After"))
+
+
+def hedge(executor: Executor, call: Callable[[], Any], hedge_after: float) -> Any:
+    """
+    Run a call, and a second copy of it if the first takes longer than
+    ``hedge_after`` seconds
+
+    The first copy to succeed wins; the other is left to finish in the
+    background and its result is discarded. The call must be idempotent,
+    i.e. both copies carry the same idempotency key. If both fail, the
+    error of the last to fail is raised.
+    """
+    first = executor.submit(call)
+    done, _ = wait([first], timeout=hedge_after)
+    if done:
+        return first.result()
+
+    pending = {first, executor.submit(call)}
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+    raise error
+
+
+async def ahedge(call: Callable[[], Awaitable[Any]], hedge_after: float) -> Any:
+    """Asyncio version of ``hedge``; the losing copy is cancelled"""
+    first = asyncio.ensure_future(call())
+    done, _ = await asyncio.wait([first], timeout=hedge_after)
+    if done:
+        return first.result()
+
+    pending = {first, asyncio.ensure_future(call())}
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,248 @@
+"""
+WhatsApp API Platform - Python SDK
+Request metrics
+"""
+
+import bisect
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .hooks import Hooks, RequestInfo
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{24,})$",
+    re.IGNORECASE,
+)
+
+
+def route(endpoint: str) -> str:
+    """Endpoint with IDs replaced by ``:id``, e.g. ``/messages/:id/status``"""
+    path = endpoint.split("?", 1)[0].strip("/")
+    return "/" + "/".join(":id" if _ID_SEGMENT.match(part) else part for part in path.split("/"))
+
+
+class _Histogram:
+    """Fixed-bucket latency histogram"""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating within its bucket"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
+
+
+class _RouteStats:
+    """Counters of one method and route"""
+
+    __slots__ = (
+        "latency",
+        "statuses",
+        "errors",
+        "retries",
+        "rate_limited",
+        "request_bytes",
+        "response_bytes",
+        "retry_sleep",
+        "limiter_wait",
+    )
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.latency = _Histogram(bounds)
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.retries = 0
+        self.rate_limited = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retry_sleep = 0.0
+        self.limiter_wait = 0.0
+
+
+def _labels(**labels: Any) -> str:
+    def escape(value: Any) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class MetricsCollector:
+    """
+    Thread-safe per-endpoint request metrics, collected through hooks
+
+    Tracks, per method and route (IDs in paths are replaced by ``:id``):
+    attempts by status code, a latency histogram with p50/p95/p99
+    estimates, request and response bytes, retries and 429 responses,
+    seconds slept between retries and seconds held by the rate limiter,
+    and failed requests by exception type.
+
+    Pass it to a client as ``metrics=`` (or ``attach`` it to a client's
+    ``hooks``); one collector may serve several clients.
+
+    Args:
+        buckets: Latency histogram bucket bounds in seconds
+
+    Example:
+        metrics = MetricsCollector()
+        client = WhatsAppAPI(api_key="key", metrics=metrics)
+        print(metrics.snapshot())
+        print(metrics.prometheus())
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._routes: Dict[Tuple[str, str], _RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, hooks: Hooks) -> None:
+        """Collect metrics from a client's hooks"""
+        hooks.add("after_response", self._after_response)
+        hooks.add("on_retry", self._on_retry)
+        hooks.add("on_error", self._on_error)
+
+    def _stats(self, info: RequestInfo) -> _RouteStats:
+        key = (info.method, route(info.endpoint))
+        stats = self._routes.get(key)
+        if stats is None:
+            stats = self._routes[key] = _RouteStats(self.buckets)
+        return stats
+
+    def _after_response(self, info: RequestInfo) -> None:
+        with self._lock:
+            stats = self._stats(info)
+            stats.statuses[info.status_code] += 1
+            if info.status_code == 429:
+                stats.rate_limited += 1
+            if info.elapsed is not None:
+                stats.latency.observe(info.elapsed)
+            stats.request_bytes += info.request_bytes or 0
+            stats.response_bytes += info.response_bytes or 0
+            stats.limiter_wait += info.wait
+
+    def _on_retry(self, info: RequestInfo) -> None:
+        with self._lock:
+            stats = self._stats(info)
+            stats.retries += 1
+            stats.retry_sleep += info.delay or 0.0
+            if info.status_code is None:
+                # Connection failures never reach after_response
+                stats.limiter_wait += info.wait
+
+    def _on_error(self, info: RequestInfo) -> None:
+        with self._lock:
+            stats = self._stats(info)
+            stats.errors[type(info.error).__name__] += 1
+            if info.status_code is None:
+                stats.limiter_wait += info.wait
+
+    def percentile(self, method: str, endpoint: str, q: float) -> Optional[float]:
+        """Estimated latency quantile (0-1) of an endpoint, in seconds"""
+        with self._lock:
+            stats = self._routes.get((method, route(endpoint)))
+            return stats.latency.quantile(q) if stats else None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics keyed by ``"METHOD /route"``"""
+        with self._lock:
+            result = {}
+            for (method, path), stats in sorted(self._routes.items()):
+                latency = stats.latency
+                result[f"{method} {path}"] = {
+                    "responses": latency.count,
+                    "statuses": dict(stats.statuses),
+                    "errors": dict(stats.errors),
+                    "retries": stats.retries,
+                    "rate_limited": stats.rate_limited,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "retry_sleep": stats.retry_sleep,
+                    "limiter_wait": stats.limiter_wait,
+                    "latency": {
+                        "mean": latency.sum / latency.count if latency.count else None,
+                        "p50": latency.quantile(0.5),
+                        "p95": latency.quantile(0.95),
+                        "p99": latency.quantile(0.99),
+                    },
+                }
+            return result
+
+    def reset(self) -> None:
+        """Drop all collected metrics"""
+        with self._lock:
+            self._routes.clear()
+
+    def prometheus(self, prefix: str = "whatsapp_api") -> str:
+        """Metrics in the Prometheus text exposition format"""
+        families = [
+            ("requests_total", "counter", "Request attempts by response status"),
+            ("request_duration_seconds", "histogram", "Time from sending a request to its response"),
+            ("request_bytes_total", "counter", "Request body bytes sent"),
+            ("response_bytes_total", "counter", "Response body bytes received"),
+            ("retries_total", "counter", "Attempts retried"),
+            ("rate_limited_total", "counter", "429 responses received"),
+            ("retry_sleep_seconds_total", "counter", "Seconds slept between retries"),
+            ("rate_limit_wait_seconds_total", "counter", "Seconds requests were held by the rate limiter"),
+            ("errors_total", "counter", "Requests that failed, by exception type"),
+        ]
+        samples: Dict[str, List[str]] = {name: [] for name, _, _ in families}
+
+        with self._lock:
+            for (method, path), stats in sorted(self._routes.items()):
+                labels = {"method": method, "route": path}
+                for status, count in sorted(stats.statuses.items()):
+                    samples["requests_total"].append(f"{_labels(**labels, status=status)} {count}")
+
+                cumulative = 0
+                latency = stats.latency
+                for bound, count in zip(self.buckets + (float("inf"),), latency.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    samples["request_duration_seconds"].append(
+                        f"_bucket{_labels(**labels, le=le)} {cumulative}"
+                    )
+                samples["request_duration_seconds"].append(f"_sum{_labels(**labels)} {latency.sum}")
+                samples["request_duration_seconds"].append(f"_count{_labels(**labels)} {latency.count}")
+
+                samples["request_bytes_total"].append(f"{_labels(**labels)} {stats.request_bytes}")
+                samples["response_bytes_total"].append(f"{_labels(**labels)} {stats.response_bytes}")
+                samples["retries_total"].append(f"{_labels(**labels)} {stats.retries}")
+                samples["rate_limited_total"].append(f"{_labels(**labels)} {stats.rate_limited}")
+                samples["retry_sleep_seconds_total"].append(f"{_labels(**labels)} {stats.retry_sleep}")
+                samples["rate_limit_wait_seconds_total"].append(f"{_labels(**labels)} {stats.limiter_wait}")
+                for error, count in sorted(stats.errors.items()):
+                    samples["errors_total"].append(f"{_labels(**labels, error=error)} {count}")
+
+        lines = []
+        for name, kind, help_text in families:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for sample in samples[name]:
+                # Histogram samples carry their _bucket/_sum/_count suffix
+                lines.append(metric + sample)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,277 @@
+"""
+WhatsApp API Platform - Python SDK
+Compact result models
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+
+class Record:
+    """
+    Base class of the compact result models
+
+    A record stores its fields in ``__slots__`` instead of a per-instance
+    dict, and interns the strings of low-cardinality fields (session IDs,
+    statuses, types) so that many records share one copy. Keys the model
+    does not declare are kept in ``extra``, so ``to_dict()`` returns what
+    the server sent.
+    """
+
+    FIELDS: Tuple[str, ...] = ()
+    INTERNED: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+
+    __slots__ = ("extra",)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        """Build a record from an API object"""
+        record = cls.__new__(cls)
+        for field in cls.FIELDS:
+            setattr(record, field, _value(cls, field, data.get(field)))
+        extra = {key: value for key, value in data.items() if key not in cls._field_set}
+        record.extra = extra or None
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The API object as a plain dict"""
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {getattr(self, 'id', None)}>"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.FIELDS)
+
+
+def _value(model: Type[Record], field: str, value: Any) -> Any:
+    if type(value) is str and field in model.INTERNED:
+        return sys.intern(value)
+    return value
+
+
+_TIMESTAMPS = ("created_at", "updated_at")
+
+
+class Contact(Record):
+    """A contact from ``contacts.list``, ``iter_all`` or ``export``"""
+
+    FIELDS = (
+        "id",
+        "session_id",
+        "phone_number",
+        "name",
+        "push_name",
+        "profile_pic_url",
+        "is_business",
+        "is_enterprise",
+        "labels",
+        "notes",
+        "custom_fields",
+        "is_blocked",
+        "last_message_at",
+    ) + _TIMESTAMPS
+    INTERNED = ("session_id",)
+    __slots__ = FIELDS
+
+
+class Message(Record):
+    """A message from ``messages.list`` or ``iter_all``"""
+
+    FIELDS = (
+        "id",
+        "session_id",
+        "whatsapp_message_id",
+        "direction",
+        "from",
+        "to",
+        "type",
+        "content",
+        "media_url",
+        "media_mime_type",
+        "media_size",
+        "thumbnail_url",
+        "caption",
+        "location",
+        "contact",
+        "status",
+        "error_message",
+        "sent_at",
+        "delivered_at",
+        "read_at",
+        "metadata",
+    ) + _TIMESTAMPS
+    INTERNED = ("session_id", "direction", "from", "type", "media_mime_type", "status")
+    __slots__ = FIELDS
+
+    @property
+    def from_(self) -> Optional[str]:
+        """The ``from`` field, which is a Python keyword"""
+        return getattr(self, "from")
+
+
+class Group(Record):
+    """A group from ``groups.list`` or ``iter_all``"""
+
+    FIELDS = (
+        "id",
+        "session_id",
+        "whatsapp_group_id",
+        "name",
+        "description",
+        "profile_pic_url",
+        "owner",
+        "participants",
+        "participant_count",
+        "is_admin",
+        "settings",
+        "invite_code",
+        "created_by",
+        "created_timestamp",
+    ) + _TIMESTAMPS
+    INTERNED = ("session_id", "owner", "created_by")
+    __slots__ = FIELDS
+
+
+class Session(Record):
+    """A session from ``sessions.list`` or ``iter_all``"""
+
+    FIELDS = (
+        "id",
+        "user_id",
+        "name",
+        "phone_number",
+        "status",
+        "qr_code",
+        "qr_expires_at",
+        "connected_at",
+        "disconnected_at",
+        "last_seen",
+        "webhook_url",
+        "webhook_events",
+        "settings",
+        "is_active",
+    ) + _TIMESTAMPS
+    INTERNED = ("user_id", "status")
+    __slots__ = FIELDS
+
+
+class WebhookLog(Record):
+    """A delivery log entry from ``webhooks.iter_logs``"""
+
+    FIELDS = (
+        "id",
+        "webhook_id",
+        "event",
+        "status_code",
+        "success",
+        "attempt",
+        "duration",
+        "error",
+        "created_at",
+    )
+    INTERNED = ("webhook_id", "event")
+    __slots__ = FIELDS
+
+
+# Model of the records listed under each response key
+MODELS: Dict[str, Type[Record]] = {
+    "contacts": Contact,
+    "messages": Message,
+    "groups": Group,
+    "sessions": Session,
+    "logs": WebhookLog,
+}
+
+
+class RecordList:
+    """
+    Column-oriented list of records
+
+    Objects are absorbed into one list per field as they are added, and the
+    source dicts are released; ``Record`` objects are only built when an
+    item is accessed. ``column()`` returns a whole field at once, e.g.
+    every phone number, without building any records.
+
+    Args:
+        model: Record class of the items
+        items: API objects (dicts) or records to add
+
+    Example:
+        contacts = client.contacts.iter_all(session_id="session-id").collect()
+        phones = contacts.column("phone_number")
+        first = contacts[0].name
+    """
+
+    def __init__(self, model: Type[Record], items: Iterable[Union[Dict[str, Any], Record]] = ()):
+        self.model = model
+        self._columns: Dict[str, List[Any]] = {field: [] for field in model.FIELDS}
+        self._extra: List[Optional[Dict[str, Any]]] = []
+        self.extend(items)
+
+    def append(self, item: Union[Dict[str, Any], Record]) -> None:
+        """Add an API object or a record"""
+        if isinstance(item, Record):
+            item = item.to_dict()
+        model = self.model
+        for field, column in self._columns.items():
+            column.append(_value(model, field, item.get(field)))
+        extra = {key: value for key, value in item.items() if key not in model._field_set}
+        self._extra.append(extra or None)
+
+    def extend(self, items: Iterable[Union[Dict[str, Any], Record]]) -> None:
+        """Add many API objects or records"""
+        for item in items:
+            self.append(item)
+
+    def column(self, field: str) -> List[Any]:
+        """
+        Every value of a field, in order
+
+        The list is the container's own storage; copy it before modifying.
+        """
+        if field not in self._columns:
+            raise KeyError(f"{self.model.__name__} has no field {field!r}")
+        return self._columns[field]
+
+    def _record(self, index: int) -> Record:
+        record = self.model.__new__(self.model)
+        for field, column in self._columns.items():
+            setattr(record, field, column[index])
+        record.extra = self._extra[index]
+        return record
+
+    def __len__(self) -> int:
+        return len(self._extra)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Record, "RecordList"]:
+        if isinstance(index, slice):
+            result = RecordList(self.model)
+            for field, column in self._columns.items():
+                result._columns[field] = column[index]
+            result._extra = self._extra[index]
+            return result
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("RecordList index out of range")
+        return self._record(index)
+
+    def __iter__(self) -> Iterator[Record]:
+        for index in range(len(self)):
+            yield self._record(index)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Every record as a plain dict"""
+        return [record.to_dict() for record in self]
+
+    def __repr__(self) -> str:
+        return f"<RecordList {self.model.__name__} x{len(self)}>"
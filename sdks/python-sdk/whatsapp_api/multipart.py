@@ -0,0 +1,209 @@
+"""
+WhatsApp API Platform - Python SDK
+Streaming multipart encoding
+"""
+
+import mimetypes
+import mmap
+import os
+import threading
+import uuid
+from typing import Any, Callable, Dict, Iterator, Optional
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Media:
+    """
+    Media content to upload, read in chunks rather than loaded into memory
+
+    Paths are memory-mapped and sent as zero-copy slices; bytes and
+    memoryviews are sliced in place; file objects are read chunk by chunk
+    (and rewound between uploads when seekable). A ``Media`` can be passed
+    to many sends, e.g. a broadcast, so a file is opened and mapped once
+    instead of once per recipient. Close it (or use it as a context
+    manager) when done.
+
+    Args:
+        source: File path, binary file object, bytes, bytearray or memoryview
+        filename: Filename sent to the server (default: taken from the source)
+        content_type: MIME type (default: guessed from the filename)
+    """
+
+    def __init__(self, source: Any, filename: Optional[str] = None, content_type: Optional[str] = None):
+        self._path = None
+        self._file = None
+        self._buffer = None
+        self._mmap = None
+        self._start = None
+        self._lock = threading.Lock()
+
+        if isinstance(source, (str, os.PathLike)):
+            self._path = os.fspath(source)
+            self.length = os.path.getsize(self._path)
+            filename = filename or os.path.basename(self._path)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self._buffer = memoryview(source).cast("B")
+            self.length = self._buffer.nbytes
+        elif hasattr(source, "read"):
+            self._file = source
+            self.length = None
+            if getattr(source, "seekable", lambda: False)():
+                self._start = source.tell()
+                self.length = source.seek(0, os.SEEK_END) - self._start
+                source.seek(self._start)
+            name = getattr(source, "name", None)
+            if not filename and isinstance(name, str):
+                filename = os.path.basename(name)
+        else:
+            raise TypeError(f"Unsupported media source: {type(source).__name__}")
+
+        self.filename = filename or "file"
+        self.content_type = (
+            content_type
+            or mimetypes.guess_type(self.filename)[0]
+            or "application/octet-stream"
+        )
+
+    def _map(self) -> None:
+        """Memory-map a path source on first use"""
+        with self._lock:
+            if self._buffer is not None:
+                return
+            with open(self._path, "rb") as f:
+                if self.length:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._buffer = memoryview(self._mmap)
+                else:
+                    self._buffer = memoryview(b"")
+
+    def chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+        """Yield the content in chunks of at most ``chunk_size`` bytes"""
+        if self._path is not None and self._buffer is None:
+            self._map()
+
+        if self._buffer is not None:
+            for offset in range(0, self._buffer.nbytes, chunk_size):
+                yield self._buffer[offset:offset + chunk_size]
+            return
+
+        if self._start is not None:
+            self._file.seek(self._start)
+        while True:
+            chunk = self._file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def close(self) -> None:
+        """Release the memory map of a path source"""
+        with self._lock:
+            if self._mmap is None:
+                return
+            self._buffer.release()
+            self._buffer = None
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A chunk is still referenced; the map is freed with it
+                pass
+            self._mmap = None
+
+    def __enter__(self) -> "Media":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class MultipartEncoder:
+    """
+    Streaming ``multipart/form-data`` body
+
+    The body is produced chunk by chunk on iteration (``for`` or
+    ``async for``), so uploads never hold a whole file in memory. Iterating
+    again restarts the body, which lets failed uploads be retried. ``len``
+    is the body size in bytes, or None when a file object cannot report it
+    (the body is then sent with chunked transfer encoding).
+
+    Args:
+        fields: Form fields sent before the files
+        files: Mapping of field name to a ``Media`` or any ``Media`` source
+        chunk_size: Bytes per chunk read from each file (default: 64KB)
+        progress: Called with ``(bytes_sent, total_bytes)`` after each chunk
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        chunk_size: int = CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+        self._parts = []
+        self._owned = []
+        for name, value in (fields or {}).items():
+            if value is None:
+                continue
+            header = (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            ).encode()
+            self._parts.append((header, Media(str(value).encode())))
+
+        for name, value in (files or {}).items():
+            if not isinstance(value, Media):
+                value = Media(value)
+                self._owned.append(value)
+            header = (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"; filename="{value.filename}"\r\n'
+                f"Content-Type: {value.content_type}\r\n\r\n"
+            ).encode()
+            self._parts.append((header, value))
+
+        self._closing = f"--{self.boundary}--\r\n".encode()
+        self.len = len(self._closing)
+        for header, media in self._parts:
+            if media.length is None:
+                self.len = None
+                break
+            self.len += len(header) + media.length + 2
+
+    def _chunks(self) -> Iterator[Any]:
+        try:
+            for header, media in self._parts:
+                yield header
+                yield from media.chunks(self.chunk_size)
+                yield b"\r\n"
+            yield self._closing
+        finally:
+            for media in self._owned:
+                media.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        sent = 0
+        for chunk in self._chunks():
+            yield chunk
+            sent += len(chunk)
+            if self.progress:
+                self.progress(sent, self.len)
+
+    async def __aiter__(self):
+        for chunk in self:
+            yield chunk
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers describing the body"""
+        headers = {"Content-Type": self.content_type}
+        if self.len is not None:
+            headers["Content-Length"] = str(self.len)
+        return headers
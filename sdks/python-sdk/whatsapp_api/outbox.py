@@ -0,0 +1,395 @@
+"""
+WhatsApp API Platform - Python SDK
+Durable message outbox
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .bulk import BulkResult, BulkSend, BulkStats
+from .exceptions import CircuitOpenError, RateLimitError, ServerError, WhatsAppAPIError
+from .idempotency import new_key
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    claimed_at REAL,
+    message_id TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_state ON outbox (state, next_attempt_at, id);
+"""
+
+Row = Tuple[int, str, str, int]
+
+
+def _retryable(error: Exception) -> bool:
+    """Whether a failed send may succeed if tried again"""
+    if isinstance(error, (RateLimitError, ServerError, CircuitOpenError)):
+        return True
+    # Connection errors carry no status code
+    return type(error) is WhatsAppAPIError and error.status_code is None
+
+
+class Outbox:
+    """
+    Persistent SQLite queue of message sends with at-least-once delivery
+
+    ``enqueue`` buffers sends in memory and writes them in batched
+    transactions, so callers are not held up by the API; ``drain``
+    dispatches them with bounded concurrency and records each server
+    message ID. Rows are claimed a few at a time, as workers free up, with
+    a lease, so sends claimed by a worker
+    that crashed are picked up again once the lease expires, by the next
+    ``drain`` in any process. Every attempt of a send carries the
+    idempotency key assigned when it was queued, so the server can discard
+    a repeat of a send that succeeded just before a crash.
+
+    Failed sends are retried with exponential backoff when the error is
+    transient (429, 5xx, connection errors, an open circuit) and marked
+    failed otherwise or after ``max_attempts``.
+
+    Items are the recipients accepted by ``Messages.send_bulk``: a phone
+    number, or a dict of send_text, send_media (with a ``file_path`` path or
+    ``media_url``) or send_location arguments. They must be JSON-serializable.
+
+    Args:
+        client: WhatsAppAPI client used to send
+        path: SQLite database file
+        batch_size: Sends buffered, and results recorded, per commit (default: 500)
+        concurrency: Sends in flight while draining (default: 10)
+        max_attempts: Attempts before a send is marked failed (default: 5)
+        retry_delay: Backoff before the first retry in seconds, doubled per attempt (default: 5)
+        max_retry_delay: Longest backoff in seconds (default: 300)
+        lease: Seconds a claimed send is reserved for its worker (default: 300)
+
+    Example:
+        with Outbox(client, "outbox.db") as outbox:
+            for phone in phones:
+                outbox.enqueue("session-id", phone, "Hello!")
+            stats = outbox.drain()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: str,
+        batch_size: int = 500,
+        concurrency: int = 10,
+        max_attempts: int = 5,
+        retry_delay: float = 5,
+        max_retry_delay: float = 300,
+        lease: float = 300,
+    ):
+        self.client = client
+        self.path = path
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.lease = lease
+
+        self._buffer: List[Tuple[str, str]] = []
+        self._lock = threading.RLock()
+        self._stopped = threading.Event()
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def _transaction(self, statements: Iterable[Tuple[str, Iterable[Any]]]) -> None:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, rows in statements:
+                    self._db.executemany(sql, rows)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def enqueue(self, session_id: str, item: Any, message: Optional[str] = None) -> None:
+        """
+        Queue one send
+
+        The send is durable once ``flush`` runs, which happens automatically
+        every ``batch_size`` sends and before draining or closing.
+
+        Args:
+            session_id: Session ID
+            item: Phone number or dict of send arguments, as for send_bulk
+            message: Text for a phone-number item
+        """
+        payload = json.dumps({"item": item, "message": message, "idempotency_key": new_key()})
+        with self._lock:
+            self._buffer.append((session_id, payload))
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+
+    def enqueue_many(self, session_id: str, items: Iterable[Any], message: Optional[str] = None) -> None:
+        """Queue many sends and make them durable"""
+        for item in items:
+            self.enqueue(session_id, item, message)
+        self.flush()
+
+    def flush(self) -> None:
+        """Write buffered sends to the database"""
+        with self._lock:
+            if not self._buffer:
+                return
+            buffer, self._buffer = self._buffer, []
+            now = time.time()
+            self._transaction([(
+                "INSERT INTO outbox (session_id, payload, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                [(session_id, payload, now, now) for session_id, payload in buffer],
+            )])
+
+    def _claim(self, limit: int) -> List[Row]:
+        """Reserve up to ``limit`` due sends for this worker"""
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute(
+                    "SELECT id, session_id, payload, attempts FROM outbox "
+                    "WHERE (state = ? AND next_attempt_at <= ?) OR (state = ? AND claimed_at < ?) "
+                    "ORDER BY id LIMIT ?",
+                    (PENDING, now, SENDING, now - self.lease, limit),
+                ).fetchall()
+                self._db.executemany(
+                    "UPDATE outbox SET state = ?, claimed_at = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    [(SENDING, now, now, row[0]) for row in rows],
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+        return [(row_id, session_id, payload, attempts + 1) for row_id, session_id, payload, attempts in rows]
+
+    def _claimed(self, limit: int) -> Iterator[Row]:
+        """
+        Claim sends as they are drawn
+
+        Only as many rows as the sender keeps in flight are claimed at once,
+        so none waits locally long enough for its lease to expire. Rows
+        claimed but not drawn, after a stop, are released unattempted.
+        """
+        rows: List[Row] = []
+        try:
+            while not self._stopped.is_set():
+                rows = self._claim(limit)
+                if not rows:
+                    return
+                while rows and not self._stopped.is_set():
+                    yield rows.pop(0)
+        finally:
+            self._release(rows)
+
+    def _release(self, rows: List[Row]) -> None:
+        """Return claimed sends that were not attempted to the queue"""
+        if rows:
+            now = time.time()
+            self._transaction([(
+                "UPDATE outbox SET state = ?, attempts = attempts - 1, claimed_at = NULL, updated_at = ? "
+                "WHERE id = ? AND state = ?",
+                [(PENDING, now, row[0], SENDING) for row in rows],
+            )])
+
+    def _send(self, row: Row) -> Dict[str, Any]:
+        _, session_id, payload, _ = row
+        data = json.loads(payload)
+        return self.client.messages._send_one(
+            session_id, data["item"], data["message"], idempotency_key=data.get("idempotency_key")
+        )
+
+    def _outcome(self, result: BulkResult) -> Tuple[Any, ...]:
+        """Parameters of the update recording a send's result"""
+        row_id, _, _, attempts = result.item
+        now = time.time()
+        if result.ok:
+            message_id = ((result.response or {}).get("data") or {}).get("id")
+            return (SENT, message_id, None, now, now, row_id)
+
+        error = f"{type(result.error).__name__}: {result.error}"
+        if _retryable(result.error) and attempts < self.max_attempts:
+            delay = min(self.retry_delay * 2 ** (attempts - 1), self.max_retry_delay)
+            return (PENDING, None, error, now + delay, now, row_id)
+        return (FAILED, None, error, 0, now, row_id)
+
+    def _record(self, updates: List[Tuple[Any, ...]]) -> None:
+        if updates:
+            self._transaction([(
+                "UPDATE outbox SET state = ?, message_id = ?, error = ?, next_attempt_at = ?, "
+                "claimed_at = NULL, updated_at = ? WHERE id = ?",
+                updates,
+            )])
+
+    def _next_retry(self) -> Optional[float]:
+        """Seconds until the earliest scheduled retry, or None if none is pending"""
+        with self._lock:
+            (due,) = self._db.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE state = ?", (PENDING,)
+            ).fetchone()
+        return None if due is None else max(0.0, due - time.time())
+
+    def drain(self, wait: bool = True, commit_interval: float = 1.0) -> BulkStats:
+        """
+        Send every queued message
+
+        Results are committed in batches of ``batch_size``, or every
+        ``commit_interval`` seconds, whichever comes first.
+
+        Args:
+            wait: Also wait out the backoff of sends scheduled for retry
+            commit_interval: Longest delay before a result is committed
+
+        Returns:
+            Stats of the attempts made; sends that will be retried count as
+            failed attempts
+        """
+        self._stopped.clear()
+        return self._drain(wait, commit_interval)
+
+    def _drain(self, wait: bool = True, commit_interval: float = 1.0) -> BulkStats:
+        """Send every queued message until done or stopped; see ``drain``"""
+        self.flush()
+        stats = BulkStats()
+        stats.start()
+        in_flight = self.concurrency * 2
+
+        while not self._stopped.is_set():
+            updates: List[Tuple[Any, ...]] = []
+            committed_at = time.monotonic()
+            try:
+                bulk = BulkSend(
+                    self._send,
+                    self._claimed(in_flight),
+                    concurrency=self.concurrency,
+                    max_pending=in_flight,
+                )
+                for result in bulk:
+                    stats.record(result)
+                    updates.append(self._outcome(result))
+                    if len(updates) >= self.batch_size or time.monotonic() - committed_at >= commit_interval:
+                        self._record(updates)
+                        updates = []
+                        committed_at = time.monotonic()
+            finally:
+                self._record(updates)
+
+            delay = self._next_retry() if wait else None
+            if delay is None:
+                break
+            self._stopped.wait(delay)
+
+        stats.finish()
+        return stats
+
+    def run(self, poll_interval: float = 1.0) -> None:
+        """Drain continuously, picking up new sends, until ``stop`` is called"""
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            # Not drain(), which would clear a stop requested meanwhile
+            self._drain(wait=False)
+            delay = self._next_retry()
+            self._stopped.wait(poll_interval if delay is None else min(delay, poll_interval))
+
+    def stop(self) -> None:
+        """Stop ``drain``/``run`` after the sends in flight complete"""
+        self._stopped.set()
+
+    def counts(self) -> Dict[str, int]:
+        """Number of sends in each state"""
+        with self._lock:
+            rows = self._db.execute("SELECT state, COUNT(*) FROM outbox GROUP BY state").fetchall()
+        counts = {PENDING: 0, SENDING: 0, SENT: 0, FAILED: 0}
+        counts.update(rows)
+        counts[PENDING] += len(self._buffer)
+        return counts
+
+    def entries(self, state: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Queued sends and their outcome
+
+        Args:
+            state: Only sends in this state (pending, sending, sent, failed)
+            limit: Maximum entries returned
+
+        Returns:
+            Entries with id, session_id, item, message, idempotency_key,
+            state, attempts, message_id and error
+        """
+        sql = "SELECT id, session_id, payload, state, attempts, message_id, error FROM outbox"
+        params: List[Any] = []
+        if state:
+            sql += " WHERE state = ?"
+            params.append(state)
+        sql += " ORDER BY id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+
+        entries = []
+        for row_id, session_id, payload, row_state, attempts, message_id, error in rows:
+            data = json.loads(payload)
+            entries.append({
+                "id": row_id,
+                "session_id": session_id,
+                "item": data["item"],
+                "message": data["message"],
+                "idempotency_key": data.get("idempotency_key"),
+                "state": row_state,
+                "attempts": attempts,
+                "message_id": message_id,
+                "error": error,
+            })
+        return entries
+
+    def retry_failed(self) -> int:
+        """Queue failed sends again; returns how many"""
+        now = time.time()
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE outbox SET state = ?, attempts = 0, next_attempt_at = 0, updated_at = ? WHERE state = ?",
+                (PENDING, now, FAILED),
+            )
+        return cursor.rowcount
+
+    def purge(self, older_than: float = 0) -> int:
+        """Delete sent entries last updated more than ``older_than`` seconds ago; returns how many"""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM outbox WHERE state = ? AND updated_at <= ?",
+                (SENT, time.time() - older_than),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Flush buffered sends and close the database"""
+        self.flush()
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "Outbox":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,178 @@
+"""
+WhatsApp API Platform - Python SDK
+Auto-pagination helpers
+"""
+
+import asyncio
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from .models import MODELS, Record, RecordList
+
+
+class Paginator:
+    """
+    Lazily iterate over every record of a paginated list endpoint
+
+    Records are yielded one at a time. While the caller works through a
+    page, the next one is fetched in the background; once the first
+    response reports ``pagination.totalPages``, up to ``concurrency`` pages
+    are fetched in parallel. Pages are always yielded in order.
+
+    Use ``for`` with ``WhatsAppAPI`` and ``async for`` with
+    ``AsyncWhatsAppAPI``.
+
+    Args:
+        fetch: Callable taking a page number and returning the list response
+        key: Name of the record list inside ``data`` (e.g. ``"messages"``)
+        limit: Page size, used to detect the last page when no total is sent
+        start_page: First page to fetch (default: 1)
+        prefetch: Fetch the next page while the current one is consumed (default: True)
+        concurrency: Pages in flight once the total is known (default: 1)
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Any],
+        key: str,
+        limit: int,
+        start_page: int = 1,
+        prefetch: bool = True,
+        concurrency: int = 1,
+    ):
+        self._fetch = fetch
+        self.key = key
+        self.limit = limit
+        self.start_page = start_page
+        self.prefetch = prefetch
+        self.concurrency = max(1, concurrency)
+        self.total: Optional[int] = None
+
+    def _parse(self, response: Dict[str, Any]) -> Tuple[List[Any], Optional[int]]:
+        """Extract records and the total page count from a list response"""
+        data = response.get("data") or {}
+        items = data.get(self.key) or []
+        pagination = data.get("pagination") or {}
+
+        total_pages = pagination.get("totalPages")
+        if total_pages is None and pagination.get("total") is not None:
+            total_pages = math.ceil(pagination["total"] / self.limit)
+        if pagination.get("total") is not None:
+            self.total = pagination["total"]
+        return items, total_pages
+
+    def _window(self, total_pages: Optional[int]) -> int:
+        """Number of pages to keep in flight ahead of the consumer"""
+        ahead = 1 if self.prefetch else 0
+        if total_pages is None:
+            return ahead
+        return max(ahead, self.concurrency)
+
+    def _is_last(self, page: int, items: List[Any], total_pages: Optional[int]) -> bool:
+        if not items:
+            return True
+        if total_pages is not None:
+            return page >= total_pages
+        return len(items) < self.limit
+
+    def pages(self):
+        """Iterate over pages, yielding each page's list of records"""
+        page = self.start_page
+        next_page = page + 1
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            try:
+                response = self._fetch(page)
+                while True:
+                    items, total_pages = self._parse(response)
+
+                    while len(pending) < self._window(total_pages) and (
+                        total_pages is None or next_page <= total_pages
+                    ):
+                        pending.append(executor.submit(self._fetch, next_page))
+                        next_page += 1
+
+                    yield items
+                    if self._is_last(page, items, total_pages):
+                        break
+
+                    page += 1
+                    if pending:
+                        response = pending.popleft().result()
+                    else:
+                        response = self._fetch(page)
+                        next_page = page + 1
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def __iter__(self):
+        for items in self.pages():
+            yield from items
+
+    async def apages(self):
+        """Iterate over pages with ``async for``"""
+        page = self.start_page
+        next_page = page + 1
+        pending = deque()
+
+        try:
+            response = await self._fetch(page)
+            while True:
+                items, total_pages = self._parse(response)
+
+                while len(pending) < self._window(total_pages) and (
+                    total_pages is None or next_page <= total_pages
+                ):
+                    pending.append(asyncio.ensure_future(self._fetch(next_page)))
+                    next_page += 1
+
+                yield items
+                if self._is_last(page, items, total_pages):
+                    break
+
+                page += 1
+                if pending:
+                    response = await pending.popleft()
+                else:
+                    response = await self._fetch(page)
+                    next_page = page + 1
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def __aiter__(self):
+        async for items in self.apages():
+            for item in items:
+                yield item
+
+    def _record_list(self, model: Optional[Type[Record]]) -> RecordList:
+        model = model or MODELS.get(self.key)
+        if model is None:
+            raise ValueError(f"No record model for {self.key!r}; pass one")
+        return RecordList(model)
+
+    def collect(self, model: Optional[Type[Record]] = None) -> RecordList:
+        """
+        Fetch every record into a compact column-oriented RecordList
+
+        Each page is absorbed as it arrives, so the page dicts never
+        accumulate in memory.
+
+        Args:
+            model: Record class (default: chosen from the list key)
+        """
+        records = self._record_list(model)
+        for items in self.pages():
+            records.extend(items)
+        return records
+
+    async def acollect(self, model: Optional[Type[Record]] = None) -> RecordList:
+        """Async counterpart of ``collect``"""
+        records = self._record_list(model)
+        async for items in self.apages():
+            records.extend(items)
+        return records
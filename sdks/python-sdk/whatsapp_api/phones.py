@@ -0,0 +1,150 @@
+"""
+WhatsApp API Platform - Python SDK
+Phone number normalization
+"""
+
+import re
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Shortest and longest numbers, country code included (E.164 allows 15 digits)
+MIN_DIGITS = 7
+MAX_DIGITS = 15
+
+# Characters people write inside phone numbers; newlines are kept, since
+# ``normalize_phones`` joins a whole column with them
+_SEPARATORS = str.maketrans("", "", " \t\r-.()/\u00a0")
+_NUMBER = re.compile(r"(\+|00)?([0-9]+)")
+# Every line of a column: (prefix, digits) for a number, ("", "") otherwise
+_COLUMN = re.compile(r"^(?:(\+|00)?([0-9]+)|.*)$", re.MULTILINE)
+
+CountryCode = Union[str, int, None]
+
+
+def _country_code(code: CountryCode) -> Optional[str]:
+    return str(code).lstrip("+") if code else None
+
+
+def _resolve(prefix: Optional[str], digits: str, country_code: Optional[str]) -> Optional[str]:
+    """Country code and number from a matched number, or None"""
+    if not digits:
+        return None
+    if not prefix and country_code:
+        if digits.startswith("0"):
+            # Trunk prefix of a national number
+            digits = country_code + digits[1:]
+        elif not (digits.startswith(country_code) and len(digits) >= 11):
+            digits = country_code + digits
+    if digits.startswith("0") or not MIN_DIGITS <= len(digits) <= MAX_DIGITS:
+        return None
+    return digits
+
+
+def _digits(text: str, country_code: Optional[str]) -> Optional[str]:
+    """Country code and number of a phone number without separators, or None"""
+    match = _NUMBER.fullmatch(text)
+    return _resolve(match.group(1), match.group(2), country_code) if match else None
+
+
+def normalize_phone(phone: Any, default_country_code: CountryCode = None) -> Optional[str]:
+    """
+    Normalize a phone number to E.164 digits (country code and number, no ``+``)
+
+    Spaces, dashes, dots, slashes and parentheses are ignored. A number
+    starting with ``+`` or ``00`` is international. Otherwise, with a
+    ``default_country_code``, a leading ``0`` is taken as the trunk prefix
+    and replaced by the country code, which is also prepended to any other
+    number unless it already starts with it and has at least 11 digits;
+    without one, the number must already include its country code.
+    Chat IDs such as ``123@g.us`` are returned unchanged.
+
+    Args:
+        phone: Phone number, as a string or int
+        default_country_code: Country code of national numbers, e.g. ``"31"``
+
+    Returns:
+        The normalized number, or None if it is not a valid phone number
+    """
+    if phone is None:
+        return None
+    text = str(phone).strip()
+    if "@" in text:
+        return text
+    return _digits(text.translate(_SEPARATORS), _country_code(default_country_code))
+
+
+class NormalizedPhones:
+    """
+    Result of ``normalize_phones``
+
+    Attributes:
+        numbers: Valid numbers in E.164 digits, each once, in input order
+        positions: Input position of each entry of ``numbers``
+        invalid: ``(position, value)`` of the values that are not valid numbers
+        duplicates: ``(position, number)`` of the values repeating an earlier number
+    """
+
+    __slots__ = ("numbers", "positions", "invalid", "duplicates")
+
+    def __init__(self):
+        self.numbers: List[str] = []
+        self.positions: List[int] = []
+        self.invalid: List[Tuple[int, Any]] = []
+        self.duplicates: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.numbers)
+
+    def __repr__(self) -> str:
+        return (
+            f"<NormalizedPhones numbers={len(self.numbers)} invalid={len(self.invalid)} "
+            f"duplicates={len(self.duplicates)}>"
+        )
+
+
+def normalize_phones(phones: Iterable[Any], default_country_code: CountryCode = None) -> NormalizedPhones:
+    """
+    Normalize a column of phone numbers, dropping repeats and flagging invalid values
+
+    Numbers are normalized as by ``normalize_phone``. The column is joined
+    into one string, stripped of separators by one ``str.translate`` call
+    and split into numbers by one regular expression scan, so only the
+    country code and duplicate checks run per number in Python.
+
+    Args:
+        phones: Phone numbers, as strings or ints; None counts as invalid
+        default_country_code: Country code of national numbers, e.g. ``"31"``
+
+    Returns:
+        NormalizedPhones with the unique valid numbers and the positions of
+        invalid and repeated values
+    """
+    values = list(phones)
+    texts = ["" if value is None else str(value).strip() for value in values]
+    joined = "\n".join(texts)
+    matches = _COLUMN.findall(joined.translate(_SEPARATORS))
+    if len(matches) != len(texts):
+        # A value contained a newline
+        matches = [_NUMBER.fullmatch(text.translate(_SEPARATORS)) for text in texts]
+        matches = [match.groups() if match else ("", "") for match in matches]
+    chat_ids = "@" in joined
+
+    country_code = _country_code(default_country_code)
+    result = NormalizedPhones()
+    seen = set()
+    for position, (prefix, digits) in enumerate(matches):
+        if chat_ids and "@" in texts[position]:
+            number = texts[position]
+        else:
+            number = _resolve(prefix, digits, country_code)
+        if number is None:
+            result.invalid.append((position, values[position]))
+        elif number in seen:
+            result.duplicates.append((position, number))
+        else:
+            seen.add(number)
+            result.numbers.append(number)
+            result.positions.append(position)
+    return result
@@ -0,0 +1,519 @@
+"""
+WhatsApp API Platform - Python SDK
+Session pool
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .bulk import AsyncBulkSend, BulkSend, BulkStats
+from .exceptions import NotFoundError, ValidationError, WhatsAppAPIError
+
+STRATEGIES = ("least_in_flight", "round_robin")
+
+
+def _session_down(error: Exception) -> bool:
+    """Whether a send failed because its session is gone or disconnected"""
+    if isinstance(error, NotFoundError):
+        return True
+    return isinstance(error, ValidationError) and "not connected" in str(error).lower()
+
+
+def _recipient(item: Any) -> Optional[str]:
+    return item if isinstance(item, str) else item.get("to")
+
+
+class _Member:
+    """Routing state of one session"""
+
+    __slots__ = ("session_id", "weight", "active", "in_flight", "sent", "failed", "tokens", "updated", "current")
+
+    def __init__(self, session_id: str, weight: float, burst: float):
+        self.session_id = session_id
+        self.weight = weight
+        self.active = True
+        self.in_flight = 0
+        self.sent = 0
+        self.failed = 0
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.current = 0.0
+
+
+class _BaseSessionPool:
+    """Session selection shared by the blocking and asyncio pools"""
+
+    def __init__(
+        self,
+        client: Any,
+        session_ids: Optional[Iterable[str]] = None,
+        strategy: str = "least_in_flight",
+        weights: Optional[Dict[str, float]] = None,
+        rate: Optional[float] = None,
+        burst: float = 1,
+        max_in_flight: Optional[int] = None,
+        sticky: bool = True,
+        sticky_size: int = 100000,
+        refresh_interval: Optional[float] = 60,
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}; expected one of {', '.join(STRATEGIES)}")
+        self.client = client
+        self.session_ids = set(session_ids) if session_ids is not None else None
+        self.strategy = strategy
+        self.weights = dict(weights or {})
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.sticky = sticky
+        self.sticky_size = sticky_size
+        self.refresh_interval = refresh_interval
+
+        self._members: Dict[str, _Member] = {}
+        self._routes: "OrderedDict[str, str]" = OrderedDict()
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    @property
+    def sessions(self) -> List[str]:
+        """IDs of the sessions in rotation"""
+        with self._lock:
+            return [member.session_id for member in self._members.values() if member.active]
+
+    def _stale(self) -> bool:
+        if self._refreshed_at is None:
+            return True
+        return self.refresh_interval is not None and time.monotonic() - self._refreshed_at >= self.refresh_interval
+
+    def _update(self, sessions: Iterable[Dict[str, Any]]) -> None:
+        """Put the connected sessions in rotation and take the rest out"""
+        connected = [session["id"] for session in sessions if session.get("status", "connected") == "connected"]
+        if self.session_ids is not None:
+            connected = [session_id for session_id in connected if session_id in self.session_ids]
+        with self._lock:
+            for member in self._members.values():
+                member.active = False
+            for session_id in connected:
+                self._activate(session_id)
+            self._refreshed_at = time.monotonic()
+        self._notify()
+
+    def _activate(self, session_id: str) -> None:
+        member = self._members.get(session_id)
+        if member is None:
+            weight = self.weights.get(session_id, 1)
+            member = self._members[session_id] = _Member(session_id, weight, self.burst)
+        member.active = True
+
+    def add(self, session_id: str, weight: Optional[float] = None) -> None:
+        """Put a session in rotation"""
+        with self._lock:
+            if weight is not None:
+                self.weights[session_id] = weight
+                if session_id in self._members:
+                    self._members[session_id].weight = weight
+            self._activate(session_id)
+        self._notify()
+
+    def remove(self, session_id: str) -> None:
+        """Take a session out of rotation until it is added or seen connected again"""
+        with self._lock:
+            member = self._members.get(session_id)
+            if member is not None:
+                member.active = False
+
+    def watch(self, stream: Any) -> None:
+        """
+        Follow ``session:status`` events of an event stream
+
+        Sessions leave rotation as soon as they disconnect and rejoin when
+        they reconnect, without waiting for the next refresh.
+        """
+        stream.on("session:status")(self._on_status)
+
+    def _on_status(self, event: Any) -> None:
+        session_id = event.session_id
+        if not session_id or (self.session_ids is not None and session_id not in self.session_ids):
+            return
+        if event.data.get("status") == "connected":
+            self.add(session_id)
+        else:
+            self.remove(session_id)
+
+    def _refill(self, member: _Member, now: float) -> None:
+        if self.rate is not None and now > member.updated:
+            member.tokens = min(self.burst, member.tokens + (now - member.updated) * self.rate)
+            member.updated = now
+
+    def _ready_in(self, member: _Member, now: float) -> float:
+        """Seconds until the session may take another send (inf: when one completes)"""
+        if self.max_in_flight is not None and member.in_flight >= self.max_in_flight:
+            return float("inf")
+        if self.rate is not None and member.tokens < 1:
+            return (1 - member.tokens) / self.rate
+        return 0.0
+
+    def _choose(self, ready: List[_Member]) -> _Member:
+        if self.strategy == "round_robin":
+            # Smooth weighted round-robin: interleaves sessions in proportion
+            # to their weights instead of sending bursts to each in turn
+            total = 0.0
+            for member in ready:
+                member.current += member.weight
+                total += member.weight
+            chosen = max(ready, key=lambda member: member.current)
+            chosen.current -= total
+            return chosen
+        return min(ready, key=lambda member: ((member.in_flight + 1) / member.weight, member.sent / member.weight))
+
+    def _reserve(self, to: Optional[str]) -> Tuple[Optional[str], float]:
+        """
+        Pick a session for a send and count it in flight
+
+        Returns:
+            The session ID and 0, or None and the seconds to wait before
+            trying again (-1 when no session is in rotation)
+        """
+        with self._lock:
+            candidates = [member for member in self._members.values() if member.active]
+            if not candidates:
+                return None, -1.0
+
+            if self.sticky and to is not None:
+                member = self._members.get(self._routes.get(to, ""))
+                if member is not None and member.active:
+                    candidates = [member]
+
+            now = time.monotonic()
+            ready = []
+            wait = float("inf")
+            for member in candidates:
+                self._refill(member, now)
+                ready_in = self._ready_in(member, now)
+                if ready_in == 0:
+                    ready.append(member)
+                wait = min(wait, ready_in)
+            if not ready:
+                return None, wait
+
+            member = self._choose(ready)
+            member.in_flight += 1
+            if self.rate is not None:
+                member.tokens -= 1
+            if self.sticky and to is not None:
+                self._routes[to] = member.session_id
+                self._routes.move_to_end(to)
+                if len(self._routes) > self.sticky_size:
+                    self._routes.popitem(last=False)
+            return member.session_id, 0.0
+
+    def release(self, session_id: str, error: Optional[Exception] = None) -> None:
+        """
+        Report a send reserved with ``acquire`` as complete
+
+        A send that failed because the session is disconnected or gone
+        takes the session out of rotation.
+        """
+        with self._lock:
+            member = self._members[session_id]
+            member.in_flight -= 1
+            if error is None:
+                member.sent += 1
+            else:
+                member.failed += 1
+                if _session_down(error):
+                    member.active = False
+        self._notify()
+
+    def _notify(self) -> None:
+        pass
+
+    def _failover(self, session_id: str, error: Exception, tried: set) -> bool:
+        """Whether a failed send should be retried on another session"""
+        tried.add(session_id)
+        if not _session_down(error):
+            return False
+        with self._lock:
+            return any(member.active and member.session_id not in tried for member in self._members.values())
+
+    @staticmethod
+    def _session_kwargs(session_id: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # A send moved to another session is a new send; a caller's key is
+        # made per session so the retry is not answered with the first
+        # session's stored error
+        if kwargs.get("idempotency_key"):
+            kwargs = dict(kwargs, idempotency_key=f"{kwargs['idempotency_key']}:{session_id}")
+        return kwargs
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-session routing state and send counters"""
+        with self._lock:
+            return {
+                member.session_id: {
+                    "active": member.active,
+                    "weight": member.weight,
+                    "in_flight": member.in_flight,
+                    "sent": member.sent,
+                    "failed": member.failed,
+                }
+                for member in self._members.values()
+            }
+
+
+class SessionPool(_BaseSessionPool):
+    """
+    Distributes sends across connected sessions
+
+    Sessions are loaded with ``sessions.iter_all(status="connected")`` and
+    refreshed every ``refresh_interval`` seconds. Each send goes to the
+    session chosen by ``strategy``: ``least_in_flight`` (fewest sends in
+    progress relative to weight) or ``round_robin`` (smooth weighted
+    round-robin). With ``sticky``, a recipient keeps the session it was
+    first sent from while that session stays in rotation.
+
+    A send that fails because its session is disconnected or gone takes
+    the session out of rotation and is retried on another one.
+
+    Args:
+        client: WhatsAppAPI client
+        session_ids: Only use these sessions (default: every connected session)
+        strategy: ``least_in_flight`` or ``round_robin`` (default: least_in_flight)
+        weights: Relative share of sends per session ID (default: 1 each)
+        rate: Maximum sends per second per session (default: unlimited)
+        burst: Sends a session may make back-to-back under ``rate`` (default: 1)
+        max_in_flight: Maximum concurrent sends per session (default: unlimited)
+        sticky: Keep each recipient on one session (default: True)
+        sticky_size: Recipients remembered for sticky routing (default: 100000)
+        refresh_interval: Seconds between session list refreshes, or None
+            to load it once (default: 60)
+
+    Example:
+        pool = SessionPool(client, rate=1, max_in_flight=4)
+        pool.send_text("1234567890", "Hello!")
+        stats = pool.broadcast(phones, "Hello!", concurrency=32)
+    """
+
+    def __init__(self, client: Any, **kwargs: Any):
+        super().__init__(client, **kwargs)
+        self._changed = threading.Condition(self._lock)
+
+    def refresh(self) -> None:
+        """Reload the connected sessions"""
+        self._update(self.client.sessions.iter_all(status="connected"))
+
+    def _notify(self) -> None:
+        with self._changed:
+            self._changed.notify_all()
+
+    def acquire(self, to: Optional[str] = None, timeout: Optional[float] = None) -> str:
+        """
+        Reserve a session for one send, waiting for rate and in-flight caps
+
+        Pair every call with ``release``, or use the ``send_*`` methods.
+
+        Args:
+            to: Recipient, for sticky routing
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Session ID
+        """
+        if self._stale():
+            self.refresh()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        refreshed = False
+
+        while True:
+            # Reserve and wait under one lock so no release is missed
+            with self._changed:
+                session_id, wait = self._reserve(to)
+                if session_id is not None:
+                    return session_id
+                if wait >= 0:
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise WhatsAppAPIError("Timed out waiting for a session in the pool")
+                        wait = min(wait, remaining)
+                    self._changed.wait(None if wait == float("inf") else wait)
+                    continue
+
+            if refreshed:
+                raise WhatsAppAPIError("No connected session available in the pool")
+            self.refresh()
+            refreshed = True
+
+    def _send(self, to: Optional[str], send: Callable[[str, Dict[str, Any]], Any], kwargs: Dict[str, Any]) -> Any:
+        tried = set()
+        while True:
+            session_id = self.acquire(to)
+            try:
+                result = send(session_id, self._session_kwargs(session_id, kwargs))
+            except Exception as e:
+                self.release(session_id, e)
+                if not self._failover(session_id, e, tried):
+                    raise
+                continue
+            self.release(session_id)
+            return result
+
+    def send_text(self, to: str, message: str, **kwargs: Any) -> Dict[str, Any]:
+        """Send a text message from a pooled session (see ``Messages.send_text``)"""
+        messages = self.client.messages
+        return self._send(to, lambda session_id, kw: messages.send_text(session_id, to, message, **kw), kwargs)
+
+    def send_media(self, to: str, **kwargs: Any) -> Dict[str, Any]:
+        """Send a media message from a pooled session (see ``Messages.send_media``)"""
+        messages = self.client.messages
+        return self._send(to, lambda session_id, kw: messages.send_media(session_id, to, **kw), kwargs)
+
+    def send_location(self, to: str, latitude: float, longitude: float, **kwargs: Any) -> Dict[str, Any]:
+        """Send a location from a pooled session (see ``Messages.send_location``)"""
+        messages = self.client.messages
+        return self._send(
+            to,
+            lambda session_id, kw: messages.send_location(session_id, to, latitude, longitude, **kw),
+            kwargs,
+        )
+
+    def send_bulk(self, recipients: Iterable[Any], message: Optional[str] = None, concurrency: int = 10) -> BulkSend:
+        """
+        Send to many recipients concurrently across the pool
+
+        Args:
+            recipients: Iterable of recipients, as for ``Messages.send_bulk``
+            message: Default text for recipients without their own message
+            concurrency: Maximum sends in flight across all sessions
+
+        Returns:
+            BulkSend yielding a BulkResult per recipient as it completes
+        """
+        messages = self.client.messages
+        return BulkSend(
+            lambda item: self._send(
+                _recipient(item),
+                lambda session_id, kw: messages._send_one(session_id, item, message, **kw),
+                {},
+            ),
+            recipients,
+            concurrency=concurrency,
+        )
+
+    def broadcast(self, recipients: Iterable[Any], message: Optional[str] = None, concurrency: int = 10) -> BulkStats:
+        """Send to many recipients across the pool and wait for all of them"""
+        return self.send_bulk(recipients, message, concurrency).run()
+
+
+class AsyncSessionPool(_BaseSessionPool):
+    """
+    Asyncio version of ``SessionPool``, for an AsyncWhatsAppAPI client
+
+    Takes the same arguments; ``refresh``, ``acquire``, the ``send_*``
+    methods and ``broadcast`` are coroutines.
+    """
+
+    def __init__(self, client: Any, **kwargs: Any):
+        super().__init__(client, **kwargs)
+        self._changed: Optional[asyncio.Event] = None
+
+    async def refresh(self) -> None:
+        """Reload the connected sessions"""
+        self._update([session async for session in self.client.sessions.iter_all(status="connected")])
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+
+    async def acquire(self, to: Optional[str] = None, timeout: Optional[float] = None) -> str:
+        """Reserve a session for one send (see ``SessionPool.acquire``)"""
+        if self._stale():
+            await self.refresh()
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        refreshed = False
+
+        while True:
+            session_id, wait = self._reserve(to)
+            if session_id is not None:
+                return session_id
+            if wait < 0:
+                if refreshed:
+                    raise WhatsAppAPIError("No connected session available in the pool")
+                await self.refresh()
+                refreshed = True
+                continue
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise WhatsAppAPIError("Timed out waiting for a session in the pool")
+                wait = min(wait, remaining)
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), None if wait == float("inf") else wait)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _send(self, to: Optional[str], send: Callable[[str, Dict[str, Any]], Any], kwargs: Dict[str, Any]) -> Any:
+        tried = set()
+        while True:
+            session_id = await self.acquire(to)
+            try:
+                result = await send(session_id, self._session_kwargs(session_id, kwargs))
+            except Exception as e:
+                self.release(session_id, e)
+                if not self._failover(session_id, e, tried):
+                    raise
+                continue
+            self.release(session_id)
+            return result
+
+    async def send_text(self, to: str, message: str, **kwargs: Any) -> Dict[str, Any]:
+        """Send a text message from a pooled session"""
+        messages = self.client.messages
+        return await self._send(to, lambda session_id, kw: messages.send_text(session_id, to, message, **kw), kwargs)
+
+    async def send_media(self, to: str, **kwargs: Any) -> Dict[str, Any]:
+        """Send a media message from a pooled session"""
+        messages = self.client.messages
+        return await self._send(to, lambda session_id, kw: messages.send_media(session_id, to, **kw), kwargs)
+
+    async def send_location(self, to: str, latitude: float, longitude: float, **kwargs: Any) -> Dict[str, Any]:
+        """Send a location from a pooled session"""
+        messages = self.client.messages
+        return await self._send(
+            to,
+            lambda session_id, kw: messages.send_location(session_id, to, latitude, longitude, **kw),
+            kwargs,
+        )
+
+    def send_bulk(
+        self,
+        recipients: Iterable[Any],
+        message: Optional[str] = None,
+        concurrency: int = 10,
+    ) -> AsyncBulkSend:
+        """Send to many recipients concurrently across the pool (see ``SessionPool.send_bulk``)"""
+        messages = self.client.messages
+        return AsyncBulkSend(
+            lambda item: self._send(
+                _recipient(item),
+                lambda session_id, kw: messages._send_one(session_id, item, message, **kw),
+                {},
+            ),
+            recipients,
+            concurrency=concurrency,
+        )
+
+    async def broadcast(
+        self,
+        recipients: Iterable[Any],
+        message: Optional[str] = None,
+        concurrency: int = 10,
+    ) -> BulkStats:
+        """Send to many recipients across the pool and wait for all of them"""
+        return await self.send_bulk(recipients, message, concurrency).run()
@@ -0,0 +1,194 @@
+"""
+WhatsApp API Platform - Python SDK
+Client-side rate limiting
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate limit reset header into seconds from now
+
+    ``RateLimit-Reset`` carries delta seconds, while the server's per-key
+    ``X-RateLimit-Reset`` carries an epoch timestamp in milliseconds.
+    """
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset > 1e12:
+        reset = reset / 1000 - time.time()
+    elif reset > 1e9:
+        reset = reset - time.time()
+    return max(0.0, reset)
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    """Parse a non-negative integer header"""
+    if not value:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return None
+
+
+def _parse_window(value: Optional[str]) -> Optional[float]:
+    """Parse the window length from a RateLimit-Policy header (``100;w=60``)"""
+    if not value:
+        return None
+    for param in value.split(",", 1)[0].split(";")[1:]:
+        key, _, window = param.strip().partition("=")
+        if key == "w":
+            try:
+                return float(window)
+            except ValueError:
+                return None
+    return None
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    return headers.get(name) or headers.get(f"X-{name}")
+
+
+class _Bucket:
+    """Token bucket state for one rate limit scope"""
+
+    __slots__ = ("rate", "window", "tokens", "updated", "blocked_until")
+
+    def __init__(self, burst: float):
+        self.rate: Optional[float] = None
+        self.window = 0.0
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def block(self, now: float, delay: float) -> None:
+        """Hold the scope until ``delay`` seconds from now"""
+        self.blocked_until = max(self.blocked_until, now + delay)
+        # No tokens accrue while blocked; the fresh window starts with one
+        self.updated = max(self.updated, self.blocked_until)
+        self.tokens = min(self.tokens, 1)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket paced by the server's rate limit headers
+
+    Each API resource (the first path segment, e.g. ``messages``) gets its own
+    bucket, matching the per-route limiters on the server. Until a response
+    reports ``RateLimit-Limit``/``RateLimit-Reset`` the bucket does not pace;
+    afterwards requests are spaced at the server's limit per window. When
+    ``RateLimit-Remaining`` reaches zero, or a 429 arrives, the scope is held
+    until the reset (or ``Retry-After``) has elapsed.
+
+    One limiter may be shared by several clients using the same API key.
+
+    Args:
+        burst: Requests allowed back-to-back before pacing applies (default: 10)
+    """
+
+    def __init__(self, burst: float = 10):
+        self.burst = burst
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _scope(endpoint: str) -> str:
+        return endpoint.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+
+    def _bucket(self, endpoint: str) -> _Bucket:
+        scope = self._scope(endpoint)
+        bucket = self._buckets.get(scope)
+        if bucket is None:
+            bucket = self._buckets[scope] = _Bucket(self.burst)
+        return bucket
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Reserve a request slot without blocking
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        with self._lock:
+            bucket = self._bucket(endpoint)
+            now = time.monotonic()
+            wait = max(0.0, bucket.blocked_until - now)
+
+            if bucket.rate is None:
+                return wait
+
+            if now > bucket.updated:
+                bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+                bucket.updated = now
+            bucket.tokens -= 1
+            if bucket.tokens < 0:
+                wait = max(wait, bucket.updated - now - bucket.tokens / bucket.rate)
+            return wait
+
+    def acquire(self, endpoint: str) -> float:
+        """Block until a request to the endpoint may be sent; returns seconds waited"""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def update(self, endpoint: str, status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Update pacing from a response
+
+        Returns:
+            For a 429 response, seconds until the server accepts requests
+            again, or None if the response did not say
+        """
+        limit = _parse_int(_header(headers, "RateLimit-Limit"))
+        remaining = _parse_int(_header(headers, "RateLimit-Remaining"))
+        reset = _parse_reset(_header(headers, "RateLimit-Reset"))
+        window = _parse_window(headers.get("RateLimit-Policy"))
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+
+        with self._lock:
+            bucket = self._bucket(endpoint)
+            now = time.monotonic()
+
+            if reset is not None:
+                # Without a policy header, the longest reset seen is the
+                # best estimate of the window length
+                bucket.window = window or max(bucket.window, reset)
+                if limit and bucket.window > 0:
+                    bucket.rate = limit / bucket.window
+
+            if remaining is not None:
+                bucket.tokens = min(bucket.tokens, remaining)
+                if remaining == 0 and reset is not None:
+                    bucket.block(now, reset)
+
+            if status_code != 429:
+                return None
+
+            delay = retry_after if retry_after is not None else reset
+            if delay is None:
+                return None
+            bucket.block(now, delay)
+            return delay
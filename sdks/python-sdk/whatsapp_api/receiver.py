@@ -0,0 +1,310 @@
+"""
+WhatsApp API Platform - Python SDK
+Webhook receiver
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import queue
+import threading
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[["WebhookEvent"], Any]
+
+
+def verify_signature(body: bytes, signature: Optional[str], secret: Union[str, bytes]) -> bool:
+    """
+    Verify an ``X-Webhook-Signature`` header in constant time
+
+    The server signs the JSON body it sends with HMAC-SHA256 and hex-encodes
+    the digest.
+
+    Args:
+        body: Raw request body
+        signature: Value of the X-Webhook-Signature header
+        secret: Webhook secret
+    """
+    if not signature:
+        return False
+    if isinstance(secret, str):
+        secret = secret.encode()
+    expected = hmac.new(secret, body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.strip().lower())
+
+
+class WebhookEvent:
+    """
+    A verified webhook delivery
+
+    Attributes:
+        event: Event name (X-Webhook-Event, or ``event`` in the payload)
+        data: Event data
+        timestamp: ISO timestamp set by the server
+        webhook_id: ID of the delivering webhook (X-Webhook-ID)
+        payload: The full decoded body
+    """
+
+    __slots__ = ("event", "data", "timestamp", "webhook_id", "payload")
+
+    def __init__(self, payload: Dict[str, Any], headers: Mapping[str, str]):
+        self.payload = payload
+        self.event = headers.get("x-webhook-event") or payload.get("event")
+        self.data = payload.get("data")
+        self.timestamp = payload.get("timestamp")
+        self.webhook_id = headers.get("x-webhook-id")
+
+    def __repr__(self) -> str:
+        return f"<WebhookEvent {self.event} webhook={self.webhook_id}>"
+
+
+class WebhookReceiver:
+    """
+    Receive, verify and dispatch webhook deliveries
+
+    Deliveries are verified and queued, then acknowledged immediately;
+    registered handlers run on a pool of worker threads, so slow handlers
+    never push a delivery past the server's timeout. When the queue is full
+    the receiver answers 503, and the server retries the delivery later.
+
+    Handlers may be plain functions or coroutine functions. Each worker
+    thread runs coroutine handlers on one event loop it keeps for its
+    lifetime, so handlers of a thread may share loop-bound objects such as
+    an aiohttp session. Mount
+    ``wsgi_app`` in any WSGI server (gunicorn, Flask, Django) or
+    ``asgi_app`` in any ASGI server (uvicorn, Starlette, FastAPI).
+
+    Args:
+        secret: Webhook secret used to verify signatures
+        workers: Number of handler threads (default: 8)
+        queue_size: Deliveries buffered before answering 503 (default: 1000)
+        max_body_size: Largest accepted body in bytes (default: 1MB)
+
+    Example:
+        receiver = WebhookReceiver(secret="whsec")
+
+        @receiver.on("message:received")
+        def handle(event):
+            print(event.data)
+    """
+
+    def __init__(
+        self,
+        secret: Union[str, bytes],
+        workers: int = 8,
+        queue_size: int = 1000,
+        max_body_size: int = 1024 * 1024,
+    ):
+        self.secret = secret
+        self.workers = workers
+        self.max_body_size = max_body_size
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._queue: "queue.Queue[Optional[WebhookEvent]]" = queue.Queue(maxsize=queue_size)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        # Event loop of each thread running coroutine handlers
+        self._local = threading.local()
+
+    def on(self, event: str = "*") -> Callable[[Handler], Handler]:
+        """Register a handler for an event name, or ``"*"`` for every event"""
+        def decorator(handler: Handler) -> Handler:
+            self.add_handler(event, handler)
+            return handler
+        return decorator
+
+    def add_handler(self, event: str, handler: Handler) -> None:
+        """Register a handler for an event name, or ``"*"`` for every event"""
+        self._handlers.setdefault(event, []).append(handler)
+
+    def dispatch(self, event: WebhookEvent) -> None:
+        """Run the handlers registered for an event in the calling thread"""
+        for handler in self._handlers.get(event.event, []) + self._handlers.get("*", []):
+            try:
+                result = handler(event)
+                if asyncio.iscoroutine(result):
+                    self._loop().run_until_complete(result)
+            except Exception:
+                logger.exception("Webhook handler failed for %r", event)
+
+    def _loop(self) -> asyncio.AbstractEventLoop:
+        """The calling thread's event loop for coroutine handlers"""
+        loop = getattr(self._local, "loop", None)
+        if loop is None:
+            loop = self._local.loop = asyncio.new_event_loop()
+        return loop
+
+    def _close_loop(self) -> None:
+        loop = getattr(self._local, "loop", None)
+        if loop is not None:
+            self._local.loop = None
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def start(self) -> None:
+        """Start the worker threads (done automatically on first delivery)"""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"webhook-worker-{i}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Process queued deliveries, then stop the worker threads"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    def _work(self) -> None:
+        try:
+            while True:
+                event = self._queue.get()
+                try:
+                    if event is None:
+                        return
+                    self.dispatch(event)
+                finally:
+                    self._queue.task_done()
+        finally:
+            self._close_loop()
+
+    def handle(self, body: bytes, headers: Mapping[str, str]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Verify and enqueue one delivery
+
+        Args:
+            body: Raw request body
+            headers: Request headers with lower-case names
+
+        Returns:
+            HTTP status code and JSON response body
+        """
+        if not verify_signature(body, headers.get("x-webhook-signature"), self.secret):
+            return 401, {"error": "Invalid signature"}
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400, {"error": "Invalid JSON"}
+        if not isinstance(payload, dict):
+            return 400, {"error": "Invalid payload"}
+
+        self.start()
+        try:
+            self._queue.put_nowait(WebhookEvent(payload, headers))
+        except queue.Full:
+            return 503, {"error": "Receiver busy"}
+        return 200, {"received": True}
+
+    def _wsgi_body(self, environ: Dict[str, Any]) -> Tuple[bytes, Optional[Tuple[int, Dict[str, Any]]]]:
+        """
+        Read a WSGI request body; returns it and the error response, if any
+
+        Without a Content-Length (a chunked delivery), the body is read to
+        the end only if the server marks ``wsgi.input`` as terminated;
+        otherwise reading past the request is not safe and the delivery is
+        answered 411.
+        """
+        stream = environ["wsgi.input"]
+        length = environ.get("CONTENT_LENGTH")
+        if not length:
+            if not environ.get("wsgi.input_terminated"):
+                return b"", (411, {"error": "Content-Length required"})
+            body = stream.read(self.max_body_size + 1)
+        else:
+            try:
+                size = int(length)
+            except ValueError:
+                return b"", (400, {"error": "Invalid Content-Length"})
+            if size > self.max_body_size:
+                return b"", (413, {"error": "Payload too large"})
+            body = stream.read(size) if size > 0 else b""
+
+        if len(body) > self.max_body_size:
+            return b"", (413, {"error": "Payload too large"})
+        return body, None
+
+    def wsgi_app(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        """WSGI application accepting webhook deliveries"""
+        if environ.get("REQUEST_METHOD") != "POST":
+            status, data = 405, {"error": "Method not allowed"}
+        else:
+            body, error = self._wsgi_body(environ)
+            if error is not None:
+                status, data = error
+            else:
+                headers = {
+                    key[5:].replace("_", "-").lower(): value
+                    for key, value in environ.items()
+                    if key.startswith("HTTP_")
+                }
+                status, data = self.handle(body, headers)
+
+        response = json.dumps(data).encode()
+        start_response(
+            f"{status} {HTTPStatus(status).phrase}",
+            [("Content-Type", "application/json"), ("Content-Length", str(len(response)))],
+        )
+        return [response]
+
+    async def asgi_app(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        """ASGI application accepting webhook deliveries"""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    self.start()
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await asyncio.get_running_loop().run_in_executor(None, self.stop)
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            status, data = 405, {"error": "Method not allowed"}
+        else:
+            chunks = []
+            size = 0
+            more_body = True
+            while more_body:
+                message = await receive()
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if size > self.max_body_size:
+                    break
+                chunks.append(chunk)
+                more_body = message.get("more_body", False)
+
+            if size > self.max_body_size:
+                status, data = 413, {"error": "Payload too large"}
+            else:
+                headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope["headers"]}
+                status, data = self.handle(b"".join(chunks), headers)
+
+        response = json.dumps(data).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(response)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": response})
+
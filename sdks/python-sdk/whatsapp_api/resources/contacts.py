@@ -3,7 +3,131 @@ WhatsApp API Platform - Python SDK
 Contacts resource
 """
 
-from typing import Dict, List, Optional, Any
+import csv
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Union
+from ..bulk import BulkSend, AsyncBulkSend
+from ..pagination import Paginator
+from ..phones import CountryCode, normalize_phone
+from ..streaming import iter_json_array, aiter_json_array
+
+ContactRows = Union[str, "os.PathLike", Iterable[Dict[str, Any]]]
+
+# The server accepts JSON bodies up to 10mb; leave headroom for the envelope
+MAX_IMPORT_BYTES = 8 * 1024 * 1024
+
+
+def _read_csv(path) -> Iterator[Dict[str, str]]:
+    """Yield CSV rows as dicts without loading the whole file"""
+    with open(path, "r", newline="", encoding="utf-8-sig") as f:
+        yield from csv.DictReader(f)
+
+
+def _import_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a source row to the fields accepted by /contacts/import"""
+    contact = {
+        "phone_number": row.get("phone_number") or row.get("phone"),
+        "name": row.get("name"),
+    }
+    for field in ("email", "labels", "custom_fields"):
+        if row.get(field):
+            contact[field] = row[field]
+    return contact
+
+
+def _import_chunks(
+    rows: Iterable[Dict[str, Any]],
+    chunk_size: int,
+    invalid: List[Dict[str, Any]],
+    normalize: bool = False,
+    default_country_code: CountryCode = None,
+):
+    """
+    Group rows into import chunks bounded by row count and payload size
+
+    Rows missing a phone number or name would fail server validation for the
+    whole chunk, so they are reported in ``invalid`` instead of being sent.
+    With ``normalize``, so are invalid phone numbers and repeats of an
+    earlier row's number.
+    """
+    chunk = []
+    chunk_bytes = 0
+    seen = set()
+    for row in rows:
+        contact = _import_row(row)
+        if not contact["phone_number"] or not contact["name"]:
+            invalid.append({
+                "phone_number": contact["phone_number"],
+                "error": "Phone number and name are required",
+            })
+            continue
+        if normalize:
+            number = normalize_phone(contact["phone_number"], default_country_code)
+            error = "Invalid phone number" if number is None else (
+                "Duplicate phone number" if number in seen else None
+            )
+            if error:
+                invalid.append({"phone_number": contact["phone_number"], "error": error})
+                continue
+            seen.add(number)
+            contact["phone_number"] = number
+
+        size = len(json.dumps(contact))
+        if chunk and (len(chunk) >= chunk_size or chunk_bytes + size > MAX_IMPORT_BYTES):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(contact)
+        chunk_bytes += size + 1
+    if chunk:
+        yield chunk
+
+
+def _fold_import_result(summary: Dict[str, Any], result) -> None:
+    """Add one chunk's import result to a running summary"""
+    if result.ok:
+        data = result.response.get("data", {})
+        summary["imported"] += data.get("imported", 0)
+        summary["errors"] += data.get("errors", 0)
+        summary["details"].extend(data.get("details", []))
+    else:
+        summary["errors"] += len(result.item)
+        summary["details"].extend(
+            {"phone_number": contact["phone_number"], "error": str(result.error)}
+            for contact in result.item
+        )
+
+
+def _finish_import_summary(summary: Dict[str, Any], invalid: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Add the rows rejected before sending, known once all chunks are read"""
+    summary["errors"] += len(invalid)
+    summary["details"][:0] = invalid
+    return summary
+
+
+def _import_summary(results, invalid: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fold per-chunk import results into one summary"""
+    summary = {"imported": 0, "errors": 0, "details": []}
+    for result in results:
+        _fold_import_result(summary, result)
+    return _finish_import_summary(summary, invalid)
+
+
+def _copy_chunks(chunks: Iterable[bytes], f) -> int:
+    written = 0
+    for chunk in chunks:
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+async def _acopy_chunks(chunks, f) -> int:
+    written = 0
+    async for chunk in chunks:
+        f.write(chunk)
+        written += len(chunk)
+    return written
 
 
 class Contacts:
@@ -18,15 +142,57 @@ class Contacts:
         search: Optional[str] = None,
         page: int = 1,
         limit: int = 50,
+        updated_since: Optional[str] = None,
+        after_id: Optional[str] = None,
+        cache: bool = True,
     ) -> Dict[str, Any]:
-        """List contacts"""
+        """
+        List contacts
+        
+        Args:
+            session_id: Session ID
+            search: Filter by name or phone number
+            page: Page number
+            limit: Items per page
+            updated_since: Only contacts updated at or after this ISO 8601
+                time, oldest change first
+            after_id: With ``updated_since``, skip contacts updated exactly
+                then whose ID is not after this one (to continue from the
+                last contact received)
+            cache: Serve the page from the client's response cache, if
+                it has one (default: True)
+            
+        Returns:
+            List of contacts with pagination
+        """
         params = {"page": page, "limit": limit}
         if session_id:
-            params["sessionId"] = session_id
+            params["session_id"] = session_id
         if search:
             params["search"] = search
+        if updated_since:
+            params["updated_since"] = updated_since
+        if after_id:
+            params["after_id"] = after_id
 
-        return self.client.get("/contacts", params=params)
+        return self.client.get("/contacts", params=params, cache=cache)
+
+    def iter_all(
+        self,
+        session_id: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 100,
+        prefetch: bool = True,
+        concurrency: int = 1,
+    ) -> Paginator:
+        """Iterate over all contacts, fetching pages as needed"""
+        return Paginator(
+            lambda page: self.list(session_id, search, page=page, limit=limit),
+            "contacts",
+            limit,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
 
     def create(
         self,
@@ -37,8 +203,8 @@ class Contacts:
     ) -> Dict[str, Any]:
         """Create contact"""
         data = {
-            "sessionId": session_id,
-            "phone": phone,
+            "session_id": session_id,
+            "phone_number": phone,
             "name": name,
         }
         if email:
@@ -71,5 +237,126 @@ class Contacts:
 
     def sync(self, session_id: str) -> Dict[str, Any]:
         """Sync contacts from WhatsApp"""
-        return self.client.post("/contacts/sync", data={"sessionId": session_id})
+        return self.client.post("/contacts/sync", data={"session_id": session_id})
+
+    def bulk_import(
+        self,
+        session_id: str,
+        contacts: ContactRows,
+        chunk_size: int = 500,
+        concurrency: int = 4,
+        normalize: bool = False,
+        default_country_code: CountryCode = None,
+    ) -> Dict[str, Any]:
+        """
+        Import many contacts in chunked, concurrent requests
+        
+        Args:
+            session_id: Session ID
+            contacts: Path to a CSV file with ``phone_number`` (or ``phone``)
+                and ``name`` columns, or an iterable of dicts with those keys
+            chunk_size: Maximum contacts per import request
+            concurrency: Import requests in flight
+            normalize: Normalize phone numbers before importing; invalid
+                and repeated numbers are reported in ``details`` unsent
+            default_country_code: Country code of national numbers when
+                normalizing, e.g. ``"31"``
+            
+        Returns:
+            Summary with ``imported``, ``errors`` and per-contact ``details``
+        """
+        if isinstance(contacts, (str, os.PathLike)):
+            contacts = _read_csv(contacts)
+
+        invalid = []
+        bulk = BulkSend(
+            lambda chunk: self.client.post(
+                "/contacts/import",
+                data={"session_id": session_id, "contacts": chunk},
+            ),
+            _import_chunks(contacts, chunk_size, invalid, normalize, default_country_code),
+            concurrency=concurrency,
+        )
+        return _import_summary(bulk, invalid)
+
+    def export(self, session_id: str, chunk_size: int = 65536) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all contacts of a session
+        
+        Args:
+            session_id: Session ID
+            chunk_size: Bytes read from the response at a time
+            
+        Returns:
+            Iterator yielding contacts as they are read
+        """
+        response = self.client.stream("/contacts/export", params={"session_id": session_id})
+        with response:
+            yield from iter_json_array(response.iter_content(chunk_size))
+
+    def export_to_file(self, session_id: str, file, chunk_size: int = 65536) -> int:
+        """
+        Stream a contacts export to a file
+        
+        Args:
+            session_id: Session ID
+            file: Path or binary file object to write the JSON export to
+            chunk_size: Bytes read from the response at a time
+            
+        Returns:
+            Number of bytes written
+        """
+        response = self.client.stream("/contacts/export", params={"session_id": session_id})
+        with response:
+            if isinstance(file, (str, os.PathLike)):
+                with open(file, "wb") as f:
+                    return _copy_chunks(response.iter_content(chunk_size), f)
+            return _copy_chunks(response.iter_content(chunk_size), file)
+
+
+class AsyncContacts(Contacts):
+    """Contacts resource bound to ``AsyncWhatsAppAPI``"""
+
+    async def bulk_import(
+        self,
+        session_id: str,
+        contacts: ContactRows,
+        chunk_size: int = 500,
+        concurrency: int = 4,
+        normalize: bool = False,
+        default_country_code: CountryCode = None,
+    ) -> Dict[str, Any]:
+        """Import many contacts in chunked, concurrent requests"""
+        if isinstance(contacts, (str, os.PathLike)):
+            contacts = _read_csv(contacts)
+
+        invalid = []
+        bulk = AsyncBulkSend(
+            lambda chunk: self.client.post(
+                "/contacts/import",
+                data={"session_id": session_id, "contacts": chunk},
+            ),
+            _import_chunks(contacts, chunk_size, invalid, normalize, default_country_code),
+            concurrency=concurrency,
+        )
+        summary = {"imported": 0, "errors": 0, "details": []}
+        async for result in bulk:
+            _fold_import_result(summary, result)
+        return _finish_import_summary(summary, invalid)
+
+    async def export(self, session_id: str, chunk_size: int = 65536):
+        """Stream all contacts of a session with ``async for``"""
+        response = await self.client.stream("/contacts/export", params={"session_id": session_id})
+        async with response:
+            async for contact in aiter_json_array(response.content.iter_chunked(chunk_size)):
+                yield contact
+
+    async def export_to_file(self, session_id: str, file, chunk_size: int = 65536) -> int:
+        """Stream a contacts export to a file"""
+        response = await self.client.stream("/contacts/export", params={"session_id": session_id})
+        async with response:
+            if isinstance(file, (str, os.PathLike)):
+                with open(file, "wb") as f:
+                    return await _acopy_chunks(response.content.iter_chunked(chunk_size), f)
+            return await _acopy_chunks(response.content.iter_chunked(chunk_size), file)
 
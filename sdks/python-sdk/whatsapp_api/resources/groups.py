@@ -4,6 +4,7 @@ Groups resource
 """
 
 from typing import Dict, List, Optional, Any
+from ..pagination import Paginator
 
 
 class Groups:
@@ -21,10 +22,26 @@ class Groups:
         """List groups"""
         params = {"page": page, "limit": limit}
         if session_id:
-            params["sessionId"] = session_id
+            params["session_id"] = session_id
 
         return self.client.get("/groups", params=params)
 
+    def iter_all(
+        self,
+        session_id: Optional[str] = None,
+        limit: int = 100,
+        prefetch: bool = True,
+        concurrency: int = 1,
+    ) -> Paginator:
+        """Iterate over all groups, fetching pages as needed"""
+        return Paginator(
+            lambda page: self.list(session_id, page=page, limit=limit),
+            "groups",
+            limit,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
+
     def create(
         self,
         session_id: str,
@@ -33,7 +50,7 @@ class Groups:
     ) -> Dict[str, Any]:
         """Create group"""
         data = {
-            "sessionId": session_id,
+            "session_id": session_id,
             "name": name,
             "participants": participants,
         }
@@ -49,7 +66,7 @@ class Groups:
 
     def sync(self, session_id: str) -> Dict[str, Any]:
         """Sync groups from WhatsApp"""
-        return self.client.post("/groups/sync", data={"sessionId": session_id})
+        return self.client.post("/groups/sync", data={"session_id": session_id})
 
     def add_participants(
         self,
@@ -3,7 +3,44 @@ WhatsApp API Platform - Python SDK
 Messages resource
 """
 
-from typing import Dict, Optional, Any
+import os
+from typing import BinaryIO, Dict, Iterable, Optional, Any, Union
+from ..bulk import SKIP, BulkSend, AsyncBulkSend, BulkStats
+from ..exceptions import ValidationError, WhatsAppAPIError
+from ..multipart import Media, MultipartEncoder, ProgressCallback
+from ..pagination import Paginator
+from ..phones import CountryCode, normalize_phone
+from ..status import StatusTracker, AsyncStatusTracker
+
+MediaSource = Union[str, "os.PathLike", bytes, memoryview, BinaryIO, Media]
+Recipient = Union[str, Dict[str, Any]]
+
+
+def _recipient_filter(default_country_code: CountryCode = None):
+    """
+    Bulk ``prepare`` function normalizing recipients' phone numbers
+
+    An invalid number fails its item with ``ValidationError`` before any
+    request is made; a plain phone number repeating an earlier one is
+    skipped. Dict recipients carry their own payload, so they are only
+    normalized.
+    """
+    seen = set()
+
+    def prepare(item: Recipient) -> Any:
+        plain = not isinstance(item, dict)
+        to = item if plain else item.get("to")
+        number = normalize_phone(to, default_country_code)
+        if number is None:
+            raise ValidationError(f"Invalid phone number: {to!r}")
+        if not plain:
+            return {**item, "to": number}
+        if number in seen:
+            return SKIP
+        seen.add(number)
+        return number
+
+    return prepare
 
 
 class Messages:
@@ -17,6 +54,8 @@ class Messages:
         session_id: str,
         to: str,
         message: str,
+        idempotency_key: Optional[str] = None,
+        hedge_after: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Send text message
@@ -25,24 +64,33 @@ class Messages:
             session_id: Session ID
             to: Recipient phone number
             message: Message text
+            idempotency_key: Key identifying this send across retries
+                (default: generated)
+            hedge_after: Send a second copy of the request, with the same
+                key, if no response arrives within this many seconds
             
         Returns:
-            Sent message data
+            Sent message data, including its ``idempotency_key``
         """
         data = {
-            "sessionId": session_id,
+            "session_id": session_id,
             "to": to,
-            "message": message,
+            "content": message,
         }
-        return self.client.post("/messages/send", data=data)
+        return self.client.post(
+            "/messages/send", data=data, idempotency_key=idempotency_key, hedge_after=hedge_after
+        )
 
     def send_media(
         self,
         session_id: str,
         to: str,
-        file_path: str,
+        file_path: Optional[MediaSource] = None,
         caption: Optional[str] = None,
         media_type: Optional[str] = None,
+        media_url: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Send media message
@@ -50,27 +98,37 @@ class Messages:
         Args:
             session_id: Session ID
             to: Recipient phone number
-            file_path: Path to media file
+            file_path: Media to upload: a path, binary file object, bytes,
+                memoryview, or a Media prepared once for many sends
             caption: Optional caption
             media_type: Media type (image, video, audio, document)
+            media_url: URL of media already hosted elsewhere, sent instead
+                of uploading a file
+            progress: Called with ``(bytes_sent, total_bytes)`` during upload
+            idempotency_key: Key identifying this send across retries
+                (default: generated)
             
         Returns:
-            Sent message data
-        """
-        with open(file_path, "rb") as f:
-            files = {"file": f}
-            data = {
-                "sessionId": session_id,
-                "to": to,
-            }
-            if caption:
-                data["caption"] = caption
-            if media_type:
-                data["type"] = media_type
-
-            # Note: For file uploads, we need to send as form data
-            # This is a simplified version - actual implementation may vary
-            return self.client.post("/messages/media", files=files)
+            Sent message data, including its ``idempotency_key``
+        """
+        data = {
+            "session_id": session_id,
+            "to": to,
+        }
+        if caption:
+            data["caption"] = caption
+        if media_type:
+            data["type"] = media_type
+
+        if media_url:
+            data["media_url"] = media_url
+            return self.client.post("/messages/media", data=data, idempotency_key=idempotency_key)
+
+        if file_path is None:
+            raise ValueError("Either file_path or media_url is required")
+
+        body = MultipartEncoder(data, {"file": file_path}, progress=progress)
+        return self.client.post("/messages/media", files=body, idempotency_key=idempotency_key)
 
     def send_location(
         self,
@@ -80,6 +138,8 @@ class Messages:
         longitude: float,
         name: Optional[str] = None,
         address: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        hedge_after: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Send location message
@@ -91,22 +151,113 @@ class Messages:
             longitude: Location longitude
             name: Location name
             address: Location address
+            idempotency_key: Key identifying this send across retries
+                (default: generated)
+            hedge_after: Send a second copy of the request, with the same
+                key, if no response arrives within this many seconds
             
         Returns:
-            Sent message data
+            Sent message data, including its ``idempotency_key``
         """
+        location = {"latitude": latitude, "longitude": longitude}
+        if name:
+            location["name"] = name
+        if address:
+            location["address"] = address
         data = {
-            "sessionId": session_id,
+            "session_id": session_id,
             "to": to,
-            "latitude": latitude,
-            "longitude": longitude,
+            "location": location,
         }
-        if name:
-            data["name"] = name
-        if address:
-            data["address"] = address
 
-        return self.client.post("/messages/location", data=data)
+        return self.client.post(
+            "/messages/location", data=data, idempotency_key=idempotency_key, hedge_after=hedge_after
+        )
+
+    def _send_one(
+        self,
+        session_id: str,
+        item: Recipient,
+        message: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ):
+        """Dispatch one bulk item to the matching send method"""
+        if isinstance(item, str):
+            return self.send_text(session_id, item, message, idempotency_key=idempotency_key)
+
+        payload = dict(item)
+        if idempotency_key:
+            payload.setdefault("idempotency_key", idempotency_key)
+        session_id = payload.pop("session_id", session_id)
+        if "file_path" in payload or "media_url" in payload:
+            return self.send_media(session_id, **payload)
+        if "latitude" in payload:
+            return self.send_location(session_id, **payload)
+        payload.setdefault("message", message)
+        return self.send_text(session_id, **payload)
+
+    def send_bulk(
+        self,
+        session_id: str,
+        recipients: Iterable[Recipient],
+        message: Optional[str] = None,
+        concurrency: int = 10,
+        normalize: bool = False,
+        default_country_code: CountryCode = None,
+    ) -> BulkSend:
+        """
+        Send messages to many recipients concurrently
+        
+        Args:
+            session_id: Session ID
+            recipients: Iterable of phone numbers, or of dicts with the
+                keyword arguments of send_text, send_media (``file_path``)
+                or send_location (``latitude``/``longitude``)
+            message: Default text for recipients without their own message
+            concurrency: Maximum sends in flight
+            normalize: Normalize phone numbers before sending; invalid ones
+                fail without a request and repeated ones are skipped
+            default_country_code: Country code of national numbers when
+                normalizing, e.g. ``"31"``
+            
+        Returns:
+            BulkSend yielding a BulkResult per recipient as it completes;
+            aggregate counters are available on its ``stats``
+        """
+        return BulkSend(
+            lambda item: self._send_one(session_id, item, message),
+            recipients,
+            concurrency=concurrency,
+            prepare=_recipient_filter(default_country_code) if normalize else None,
+        )
+
+    def broadcast(
+        self,
+        session_id: str,
+        recipients: Iterable[Recipient],
+        message: Optional[str] = None,
+        concurrency: int = 10,
+        normalize: bool = False,
+        default_country_code: CountryCode = None,
+    ) -> BulkStats:
+        """
+        Send messages to many recipients and wait for all of them
+        
+        Args:
+            session_id: Session ID
+            recipients: Iterable of recipients, as for send_bulk
+            message: Default text for recipients without their own message
+            concurrency: Maximum sends in flight
+            normalize: Normalize phone numbers, as for send_bulk
+            default_country_code: Country code of national numbers when
+                normalizing
+            
+        Returns:
+            Aggregate stats, including failed results
+        """
+        return self.send_bulk(
+            session_id, recipients, message, concurrency, normalize, default_country_code
+        ).run()
 
     def list(
         self,
@@ -129,12 +280,41 @@ class Messages:
         """
         params = {"page": page, "limit": limit}
         if session_id:
-            params["sessionId"] = session_id
+            params["session_id"] = session_id
         if phone:
             params["phone"] = phone
 
         return self.client.get("/messages", params=params)
 
+    def iter_all(
+        self,
+        session_id: Optional[str] = None,
+        phone: Optional[str] = None,
+        limit: int = 100,
+        prefetch: bool = True,
+        concurrency: int = 1,
+    ) -> Paginator:
+        """
+        Iterate over all messages, fetching pages as needed
+        
+        Args:
+            session_id: Filter by session ID
+            phone: Filter by phone number
+            limit: Items per page
+            prefetch: Fetch the next page in the background
+            concurrency: Pages fetched in parallel once the total is known
+            
+        Returns:
+            Paginator yielding individual messages
+        """
+        return Paginator(
+            lambda page: self.list(session_id, phone, page=page, limit=limit),
+            "messages",
+            limit,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
+
     def get(self, message_id: str) -> Dict[str, Any]:
         """
         Get message by ID
@@ -159,3 +339,203 @@ class Messages:
         """
         return self.client.get(f"/messages/{message_id}/status")
 
+    def track(
+        self,
+        message_ids: Iterable[str],
+        target: str = "delivered",
+        session_id: Optional[str] = None,
+        concurrency: int = 8,
+        **kwargs,
+    ) -> StatusTracker:
+        """
+        Track the status of many messages with adaptive polling
+        
+        Args:
+            message_ids: IDs of the messages to track
+            target: Status to wait for: sent, delivered or read
+            session_id: Session the messages were sent from; enables
+                reading statuses from the message list in bulk
+            concurrency: Maximum status requests in flight
+            **kwargs: Polling options of StatusTracker
+            
+        Returns:
+            StatusTracker yielding each status as it settles
+        """
+        return StatusTracker(
+            self,
+            message_ids,
+            target=target,
+            session_id=session_id,
+            concurrency=concurrency,
+            **kwargs,
+        )
+
+    def wait_for_status(
+        self,
+        message_id: str,
+        target: str = "delivered",
+        timeout: float = 60,
+        min_interval: float = 1,
+        max_interval: float = 10,
+    ) -> Dict[str, Any]:
+        """
+        Wait until a message reaches a status
+        
+        Args:
+            message_id: Message ID
+            target: Status to wait for: sent, delivered or read
+            timeout: Seconds to wait
+            min_interval: First delay between polls
+            max_interval: Longest delay between polls
+            
+        Returns:
+            Message status data; its status is ``failed`` if the message
+            failed before reaching the target
+        """
+        tracker = self.track(
+            [message_id],
+            target,
+            concurrency=1,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            timeout=timeout,
+        )
+        tracker.wait()
+        return _settled(tracker, message_id)
+
+
+def _settled(tracker, message_id: str) -> Dict[str, Any]:
+    """Status of a message the tracker finished with, or raise"""
+    if message_id in tracker.errors and message_id not in tracker.pending:
+        raise tracker.errors[message_id]
+    if message_id in tracker.pending:
+        raise WhatsAppAPIError(
+            f"Message {message_id} did not reach '{tracker.target}' within {tracker.timeout}s"
+        )
+    return tracker.statuses[message_id]
+
+
+class AsyncMessages(Messages):
+    """Messages resource bound to ``AsyncWhatsAppAPI``"""
+
+    def send_bulk(
+        self,
+        session_id: str,
+        recipients: Iterable[Recipient],
+        message: Optional[str] = None,
+        concurrency: int = 100,
+        normalize: bool = False,
+        default_country_code: CountryCode = None,
+    ) -> AsyncBulkSend:
+        """
+        Send messages to many recipients concurrently
+        
+        Args:
+            session_id: Session ID
+            recipients: Iterable of recipients, as for Messages.send_bulk
+            message: Default text for recipients without their own message
+            concurrency: Maximum sends in flight
+            normalize: Normalize phone numbers, as for Messages.send_bulk
+            default_country_code: Country code of national numbers when
+                normalizing
+            
+        Returns:
+            AsyncBulkSend yielding a BulkResult per recipient via ``async for``
+        """
+        return AsyncBulkSend(
+            lambda item: self._send_one(session_id, item, message),
+            recipients,
+            concurrency=concurrency,
+            prepare=_recipient_filter(default_country_code) if normalize else None,
+        )
+
+    async def broadcast(
+        self,
+        session_id: str,
+        recipients: Iterable[Recipient],
+        message: Optional[str] = None,
+        concurrency: int = 100,
+        normalize: bool = False,
+        default_country_code: CountryCode = None,
+    ) -> BulkStats:
+        """
+        Send messages to many recipients and wait for all of them
+        
+        Args:
+            session_id: Session ID
+            recipients: Iterable of recipients, as for Messages.send_bulk
+            message: Default text for recipients without their own message
+            concurrency: Maximum sends in flight
+            normalize: Normalize phone numbers, as for Messages.send_bulk
+            default_country_code: Country code of national numbers when
+                normalizing
+            
+        Returns:
+            Aggregate stats, including failed results
+        """
+        return await self.send_bulk(
+            session_id, recipients, message, concurrency, normalize, default_country_code
+        ).run()
+
+    def track(
+        self,
+        message_ids: Iterable[str],
+        target: str = "delivered",
+        session_id: Optional[str] = None,
+        concurrency: int = 8,
+        **kwargs,
+    ) -> AsyncStatusTracker:
+        """
+        Track the status of many messages with adaptive polling
+        
+        Args:
+            message_ids: IDs of the messages to track
+            target: Status to wait for: sent, delivered or read
+            session_id: Session the messages were sent from; enables
+                reading statuses from the message list in bulk
+            concurrency: Maximum status requests in flight
+            **kwargs: Polling options of StatusTracker
+            
+        Returns:
+            AsyncStatusTracker yielding each status via ``async for``
+        """
+        return AsyncStatusTracker(
+            self,
+            message_ids,
+            target=target,
+            session_id=session_id,
+            concurrency=concurrency,
+            **kwargs,
+        )
+
+    async def wait_for_status(
+        self,
+        message_id: str,
+        target: str = "delivered",
+        timeout: float = 60,
+        min_interval: float = 1,
+        max_interval: float = 10,
+    ) -> Dict[str, Any]:
+        """
+        Wait until a message reaches a status
+        
+        Args:
+            message_id: Message ID
+            target: Status to wait for: sent, delivered or read
+            timeout: Seconds to wait
+            min_interval: First delay between polls
+            max_interval: Longest delay between polls
+            
+        Returns:
+            Message status data, as for Messages.wait_for_status
+        """
+        tracker = self.track(
+            [message_id],
+            target,
+            concurrency=1,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            timeout=timeout,
+        )
+        await tracker.wait()
+        return _settled(tracker, message_id)
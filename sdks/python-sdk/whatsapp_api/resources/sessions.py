@@ -4,6 +4,7 @@ Sessions resource
 """
 
 from typing import Dict, List, Optional, Any
+from ..pagination import Paginator
 
 
 class Sessions:
@@ -30,6 +31,33 @@ class Sessions:
 
         return self.client.get("/sessions", params=params)
 
+    def iter_all(
+        self,
+        limit: int = 100,
+        status: Optional[str] = None,
+        prefetch: bool = True,
+        concurrency: int = 1,
+    ) -> Paginator:
+        """
+        Iterate over all sessions, fetching pages as needed
+        
+        Args:
+            limit: Items per page
+            status: Filter by status (connected, disconnected, etc.)
+            prefetch: Fetch the next page in the background
+            concurrency: Pages fetched in parallel once the total is known
+            
+        Returns:
+            Paginator yielding individual sessions
+        """
+        return Paginator(
+            lambda page: self.list(page=page, limit=limit, status=status),
+            "sessions",
+            limit,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
+
     def create(self, name: str, webhook_url: Optional[str] = None) -> Dict[str, Any]:
         """
         Create a new session
@@ -4,6 +4,7 @@ Webhooks resource
 """
 
 from typing import Dict, List, Optional, Any
+from ..pagination import Paginator
 
 
 class Webhooks:
@@ -69,8 +70,43 @@ class Webhooks:
         webhook_id: str,
         page: int = 1,
         limit: int = 50,
+        since: Optional[str] = None,
+        order: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get webhook logs"""
+        """
+        Get webhook delivery logs, one entry per delivery attempt
+        
+        Args:
+            webhook_id: Webhook ID
+            page: Page number
+            limit: Items per page
+            since: Only attempts made at or after this ISO 8601 time
+            order: ``"desc"`` (newest first, the default) or ``"asc"``
+            
+        Returns:
+            Logs, webhook failure stats and pagination info
+        """
         params = {"page": page, "limit": limit}
+        if since:
+            params["since"] = since
+        if order:
+            params["order"] = order
         return self.client.get(f"/webhooks/{webhook_id}/logs", params=params)
 
+    def iter_logs(
+        self,
+        webhook_id: str,
+        limit: int = 100,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        since: Optional[str] = None,
+        order: Optional[str] = None,
+    ) -> Paginator:
+        """Iterate over all webhook logs, fetching pages as needed"""
+        return Paginator(
+            lambda page: self.get_logs(webhook_id, page=page, limit=limit, since=since, order=order),
+            "logs",
+            limit,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
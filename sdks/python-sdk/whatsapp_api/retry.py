@@ -0,0 +1,306 @@
+"""
+WhatsApp API Platform - Python SDK
+Retry backoff, retry budget and circuit breaker
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .metrics import _labels, route
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Gateway and availability errors, where the request was most likely not processed
+RETRY_STATUSES = (502, 503, 504)
+
+# Value of each state in the Prometheus gauge
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class Backoff:
+    """
+    Decorrelated-jitter backoff
+
+    Each delay is drawn uniformly between ``base`` and three times the
+    previous delay, capped at ``cap``. Clients that failed together spread
+    their retries out instead of retrying in lockstep.
+
+    Args:
+        base: Shortest delay in seconds (default: 0.5)
+        cap: Longest delay in seconds (default: 30)
+    """
+
+    def __init__(self, base: float = 0.5, cap: float = 30):
+        self.base = base
+        self.cap = cap
+        self._random = random.Random()
+
+    def next(self, previous: Optional[float] = None) -> float:
+        """Delay before the next retry, given the previous delay (None for the first retry)"""
+        upper = max(self.base, (previous or self.base) * 3)
+        return min(self.cap, self._random.uniform(self.base, upper))
+
+
+class RetryBudget:
+    """
+    Thread-safe cap on retries as a fraction of traffic
+
+    Over a sliding ``window``, retries may make up at most ``ratio`` of the
+    requests sent, plus a floor of ``min_per_second`` retries per second so
+    that low traffic can still retry. When the API fails broadly, retries
+    stop once the budget is spent instead of multiplying the load.
+
+    One budget may be shared by several clients.
+
+    Args:
+        ratio: Retries allowed per request (default: 0.2)
+        min_per_second: Retries per second allowed regardless of traffic (default: 10)
+        window: Seconds of traffic considered (default: 10)
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 10, window: int = 10):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = window
+        # Per-second counts, indexed by second modulo window
+        self._seconds: List[int] = [-1] * window
+        self._requests: List[int] = [0] * window
+        self._retries: List[int] = [0] * window
+        self._lock = threading.Lock()
+
+    def _slot(self) -> int:
+        second = int(time.monotonic())
+        slot = second % self.window
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._requests[slot] = 0
+            self._retries[slot] = 0
+        return slot
+
+    def _totals(self):
+        oldest = int(time.monotonic()) - self.window
+        requests = retries = 0
+        for slot, second in enumerate(self._seconds):
+            if second > oldest:
+                requests += self._requests[slot]
+                retries += self._retries[slot]
+        return requests, retries
+
+    def record_request(self) -> None:
+        """Count a request (its first attempt)"""
+        with self._lock:
+            self._requests[self._slot()] += 1
+
+    def try_retry(self) -> bool:
+        """Spend one retry if the budget allows it"""
+        with self._lock:
+            slot = self._slot()
+            requests, retries = self._totals()
+            if retries >= self.min_per_second * self.window + self.ratio * requests:
+                return False
+            self._retries[slot] += 1
+            return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Requests and retries within the window"""
+        with self._lock:
+            self._slot()
+            requests, retries = self._totals()
+        return {"requests": requests, "retries": retries}
+
+
+class _Circuit:
+    """Breaker state of one route"""
+
+    __slots__ = ("state", "failures", "successes", "probes", "opened_at", "rejected")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.successes = 0
+        self.probes = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """
+    Thread-safe per-route circuit breaker
+
+    Each route (IDs in paths are replaced by ``:id``) has its own circuit.
+    After ``failure_threshold`` consecutive failures (5xx responses,
+    connection errors and timeouts) the circuit opens and requests to the
+    route fail fast with ``CircuitOpenError``. After ``recovery_timeout``
+    seconds it lets ``half_open_requests`` probe requests through; once
+    ``success_threshold`` of them succeed it closes, and a failed probe
+    opens it again.
+
+    One breaker may be shared by several clients.
+
+    Args:
+        failure_threshold: Consecutive failures that open a circuit (default: 5)
+        recovery_timeout: Seconds a circuit stays open before probing (default: 30)
+        half_open_requests: Concurrent probe requests while half-open (default: 1)
+        success_threshold: Successful probes that close a circuit (default: 1)
+
+    Example:
+        breaker = CircuitBreaker(failure_threshold=10, recovery_timeout=15)
+        client = WhatsAppAPI(api_key="key", circuit_breaker=breaker)
+        print(breaker.snapshot())
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        half_open_requests: int = 1,
+        success_threshold: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_requests = half_open_requests
+        self.success_threshold = success_threshold
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        key = route(endpoint)
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+        return circuit
+
+    def _transition(self, endpoint: str, circuit: _Circuit, state: str) -> None:
+        logger.log(
+            logging.WARNING if state == OPEN else logging.INFO,
+            "Circuit %s: %s -> %s",
+            route(endpoint),
+            circuit.state,
+            state,
+        )
+        circuit.state = state
+        circuit.failures = 0
+        circuit.successes = 0
+        circuit.probes = 0
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+
+    def allow(self, endpoint: str) -> bool:
+        """Whether a request to the endpoint may be sent now"""
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == OPEN:
+                if time.monotonic() - circuit.opened_at < self.recovery_timeout:
+                    circuit.rejected += 1
+                    return False
+                self._transition(endpoint, circuit, HALF_OPEN)
+
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.half_open_requests:
+                    circuit.rejected += 1
+                    return False
+                circuit.probes += 1
+            return True
+
+    def release(self, endpoint: str) -> None:
+        """
+        Give back the probe slot of a request that ended without an outcome
+
+        Call it for a request allowed by ``allow`` that was cancelled or
+        failed without telling anything about the server, so neither
+        ``record_success`` nor ``record_failure`` applies. Otherwise the
+        slot would stay taken and a half-open circuit would reject every
+        request. Does nothing unless the circuit is half-open.
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def retry_in(self, endpoint: str) -> float:
+        """Seconds until an open circuit starts probing"""
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state != OPEN:
+                return 0.0
+            return max(0.0, circuit.opened_at + self.recovery_timeout - time.monotonic())
+
+    def record_success(self, endpoint: str) -> None:
+        """Report a request that reached a healthy server"""
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == HALF_OPEN:
+                circuit.probes -= 1
+                circuit.successes += 1
+                if circuit.successes >= self.success_threshold:
+                    self._transition(endpoint, circuit, CLOSED)
+            else:
+                circuit.failures = 0
+
+    def record_failure(self, endpoint: str) -> None:
+        """Report a 5xx response, connection error or timeout"""
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == HALF_OPEN:
+                self._transition(endpoint, circuit, OPEN)
+            elif circuit.state == CLOSED:
+                circuit.failures += 1
+                if circuit.failures >= self.failure_threshold:
+                    self._transition(endpoint, circuit, OPEN)
+
+    def state(self, endpoint: str) -> str:
+        """Circuit state of an endpoint: ``closed``, ``open`` or ``half_open``"""
+        with self._lock:
+            return self._circuit(endpoint).state
+
+    def reset(self) -> None:
+        """Close every circuit"""
+        with self._lock:
+            self._circuits.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        State of every route's circuit
+
+        Returns:
+            Mapping of route to state, consecutive failures, seconds until
+            an open circuit probes (``retry_in``) and requests rejected
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key: {
+                    "state": circuit.state,
+                    "failures": circuit.failures,
+                    "retry_in": (
+                        max(0.0, circuit.opened_at + self.recovery_timeout - now)
+                        if circuit.state == OPEN else 0.0
+                    ),
+                    "rejected": circuit.rejected,
+                }
+                for key, circuit in self._circuits.items()
+            }
+
+    def prometheus(self, prefix: str = "whatsapp_api") -> str:
+        """Circuit states in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_circuit_state Circuit state by route (0 closed, 1 half-open, 2 open)",
+            f"# TYPE {prefix}_circuit_state gauge",
+        ]
+        for key, circuit in sorted(snapshot.items()):
+            lines.append(f"{prefix}_circuit_state{_labels(route=key)} {_STATE_VALUES[circuit['state']]}")
+        lines += [
+            f"# HELP {prefix}_circuit_rejected_total Requests rejected by an open circuit",
+            f"# TYPE {prefix}_circuit_rejected_total counter",
+        ]
+        for key, circuit in sorted(snapshot.items()):
+            lines.append(f"{prefix}_circuit_rejected_total{_labels(route=key)} {circuit['rejected']}")
+        return "\n".join(lines) + "\n"
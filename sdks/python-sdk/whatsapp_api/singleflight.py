@@ -0,0 +1,148 @@
+"""
+WhatsApp API Platform - Python SDK
+Coalescing of concurrent identical reads
+"""
+
+import asyncio
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from .cache import _path, _scope
+
+FlightKey = Tuple[str, Tuple]
+
+
+class _Flight:
+    """One in-flight request and the callers waiting on it"""
+
+    __slots__ = ("done", "result", "error", "callers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.callers = 1
+
+
+class _AsyncFlight:
+    """One in-flight request task and the number of callers awaiting it"""
+
+    __slots__ = ("task", "callers")
+
+    def __init__(self):
+        self.task: Optional["asyncio.Future"] = None
+        self.callers = 1
+
+
+class _BaseSingleFlight:
+    """Flight bookkeeping shared by the blocking and asyncio coalescers"""
+
+    def __init__(self):
+        self.requests = 0
+        self.coalesced = 0
+        self._flights: Dict[FlightKey, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict] = None) -> Optional[FlightKey]:
+        """Key identifying a GET request, or None if its params cannot be compared"""
+        items = tuple(sorted((params or {}).items()))
+        if not all(isinstance(value, Hashable) for _, value in items):
+            return None
+        return _path(endpoint), items
+
+    def forget(self, endpoint: str) -> None:
+        """
+        Stop coalescing reads of the endpoint's resource that are in flight
+
+        Called after a write, so that reads issued after it are not answered
+        by a request sent before it. Callers already waiting still get the
+        in-flight result.
+        """
+        scope = _scope(_path(endpoint))
+        with self._lock:
+            for key in [key for key in self._flights if _scope(key[0]) == scope]:
+                del self._flights[key]
+
+    def _finish(self, key: FlightKey, flight: Any) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def snapshot(self) -> Dict[str, int]:
+        """Requests sent, callers that shared another's request, and requests in flight"""
+        with self._lock:
+            return {"requests": self.requests, "coalesced": self.coalesced, "in_flight": len(self._flights)}
+
+
+class SingleFlight(_BaseSingleFlight):
+    """
+    Thread-safe coalescing of concurrent identical GET requests
+
+    While a request is in flight, callers making the same request (same
+    endpoint and params) wait for it instead of sending their own, and all
+    of them get its result or its exception. Each caller of a shared
+    request gets its own copy of the response data.
+    """
+
+    def do(self, key: FlightKey, call: Callable[[], Any]) -> Any:
+        """Run ``call``, or wait for the in-flight call with the same key"""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self.requests += 1
+                leader = True
+            else:
+                flight.callers += 1
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            flight.result = call()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            # No caller can join once the flight is removed, so ``callers``
+            # is final; if the result is shared, everyone gets a copy
+            self._finish(key, flight)
+            flight.done.set()
+        return copy.deepcopy(flight.result) if flight.callers > 1 else flight.result
+
+
+class AsyncSingleFlight(_BaseSingleFlight):
+    """
+    Asyncio version of ``SingleFlight``
+
+    The shared request runs as its own task, so a caller that is cancelled
+    does not cancel it for the others.
+    """
+
+    async def do(self, key: FlightKey, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``call()``, or the in-flight call with the same key"""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _AsyncFlight()
+                flight.task = asyncio.ensure_future(self._run(key, flight, call))
+                self.requests += 1
+            else:
+                flight.callers += 1
+                self.coalesced += 1
+
+        result = await asyncio.shield(flight.task)
+        return copy.deepcopy(result) if flight.callers > 1 else result
+
+    async def _run(self, key: FlightKey, flight: _AsyncFlight, call: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await call()
+        finally:
+            self._finish(key, flight)
@@ -0,0 +1,363 @@
+"""
+WhatsApp API Platform - Python SDK
+Message status tracking
+"""
+
+import asyncio
+import heapq
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .exceptions import NotFoundError
+
+STATUS_ORDER = {"pending": 0, "sent": 1, "delivered": 2, "read": 3}
+STATUS_FIELDS = ("id", "status", "sent_at", "delivered_at", "read_at", "error_message")
+
+# Pages the status sweep reads beyond the ones the tracked messages fill
+SWEEP_SLACK = 5
+
+
+def reached(status: Optional[str], target: str) -> bool:
+    """Whether a status has reached ``target`` or can no longer change"""
+    return status == "failed" or STATUS_ORDER.get(status, -1) >= STATUS_ORDER[target]
+
+
+class _Entry:
+    """Polling state of one tracked message"""
+
+    __slots__ = ("message_id", "status", "interval", "due")
+
+    def __init__(self, message_id: str, interval: float, due: float):
+        self.message_id = message_id
+        self.status: Optional[str] = None
+        self.interval = interval
+        self.due = due
+
+
+class _BaseStatusTracker:
+    """Scheduling shared by the blocking and asyncio status trackers"""
+
+    def __init__(
+        self,
+        messages: Any,
+        message_ids: Iterable[str],
+        target: str = "delivered",
+        session_id: Optional[str] = None,
+        concurrency: int = 8,
+        min_interval: float = 1,
+        max_interval: float = 60,
+        backoff: float = 2,
+        sweep_threshold: int = 20,
+        page_size: int = 100,
+        timeout: Optional[float] = None,
+    ):
+        if target not in STATUS_ORDER:
+            raise ValueError(f"Unknown target status: {target!r}")
+        self.messages = messages
+        self.target = target
+        self.session_id = session_id
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.sweep_threshold = sweep_threshold
+        self.page_size = page_size
+        self.timeout = timeout
+
+        self.statuses: Dict[str, Dict[str, Any]] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.requests = 0
+
+        now = time.monotonic()
+        self._entries: Dict[str, _Entry] = {}
+        self._heap: List[Tuple[float, str]] = []
+        for message_id in message_ids:
+            if message_id not in self._entries:
+                self._entries[message_id] = _Entry(message_id, min_interval, now)
+                self._heap.append((now, message_id))
+        heapq.heapify(self._heap)
+        self._deadline = now + timeout if timeout is not None else None
+
+    @property
+    def pending(self) -> List[str]:
+        """IDs of messages that have not settled yet"""
+        return list(self._entries)
+
+    def _due(self, now: float) -> List[_Entry]:
+        """Pop entries due for a poll, least advanced status first"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, message_id = heapq.heappop(self._heap)
+            entry = self._entries.get(message_id)
+            if entry is not None and entry.due == when:
+                due.append(entry)
+        due.sort(key=lambda entry: STATUS_ORDER.get(entry.status, -1))
+        return due
+
+    def _schedule(self, entry: _Entry, now: float) -> None:
+        entry.due = now + entry.interval
+        heapq.heappush(self._heap, (entry.due, entry.message_id))
+
+    def _record(self, message_id: str, status: Dict[str, Any], now: float) -> Optional[Dict[str, Any]]:
+        """
+        Store a polled status and reschedule its message
+
+        A status change resets the interval, scaled by how far the message
+        has progressed (pending messages are polled most often); an
+        unchanged status backs off. Returns the status once settled.
+        """
+        entry = self._entries.get(message_id)
+        if entry is None:
+            return None
+        self.statuses[message_id] = status
+        self.errors.pop(message_id, None)
+
+        value = status.get("status")
+        if reached(value, self.target):
+            del self._entries[message_id]
+            return status
+
+        if value != entry.status:
+            entry.status = value
+            entry.interval = self.min_interval * self.backoff ** max(STATUS_ORDER.get(value, 0), 0)
+        else:
+            entry.interval *= self.backoff
+        entry.interval = min(entry.interval, self.max_interval)
+        self._schedule(entry, now)
+        return None
+
+    def _fail(self, message_id: str, error: Exception, now: float) -> None:
+        """Record a failed poll; unknown messages stop being tracked"""
+        entry = self._entries.get(message_id)
+        if entry is None:
+            return
+        self.errors[message_id] = error
+        if isinstance(error, NotFoundError):
+            del self._entries[message_id]
+            return
+        entry.interval = min(entry.interval * self.backoff, self.max_interval)
+        self._schedule(entry, now)
+
+    def _sweep_wanted(self, due: List[_Entry]) -> bool:
+        return self.session_id is not None and len(due) >= self.sweep_threshold
+
+    def _sweep_pages(self) -> int:
+        return math.ceil(len(self._entries) / self.page_size) + SWEEP_SLACK
+
+    def _apply_page(self, response: Dict[str, Any], now: float) -> Tuple[List[Dict[str, Any]], int, bool]:
+        """
+        Record the tracked messages found on a message list page
+
+        Returns the statuses that settled, how many tracked messages the
+        page held, and whether it was the last page.
+        """
+        data = response.get("data") or {}
+        items = data.get("messages") or []
+        settled = []
+        found = 0
+        for item in items:
+            message_id = item.get("id")
+            if message_id in self._entries:
+                found += 1
+                status = self._record(message_id, {k: item.get(k) for k in STATUS_FIELDS}, now)
+                if status is not None:
+                    settled.append(status)
+
+        pagination = data.get("pagination") or {}
+        total_pages = pagination.get("totalPages")
+        if total_pages is not None:
+            last = pagination.get("page", 0) >= total_pages
+        else:
+            last = len(items) < self.page_size
+        return settled, found, last or not items
+
+    def _sleep_time(self) -> Optional[float]:
+        """Seconds until the next poll is due, or None once finished"""
+        if not self._entries:
+            return None
+        now = time.monotonic()
+        if self._deadline is not None and now >= self._deadline:
+            return None
+        wait = max(self._heap[0][0] - now, 0) if self._heap else self.min_interval
+        if self._deadline is not None:
+            wait = min(wait, self._deadline - now)
+        return wait
+
+
+class StatusTracker(_BaseStatusTracker):
+    """
+    Track the delivery status of many messages with adaptive polling
+
+    Each message is polled until it reaches ``target`` or fails. Messages
+    whose status just changed are polled again soon; messages whose
+    status holds are polled at growing intervals, up to ``max_interval``,
+    and pending messages are always polled first. At most ``concurrency``
+    requests are in flight.
+
+    When ``session_id`` is given and at least ``sweep_threshold`` messages
+    are due, the session's message list is read instead, 100 statuses per
+    request; messages the sweep does not find fall back to one status
+    request each.
+
+    Iterating yields each message's status as it settles. Messages still
+    pending at ``timeout`` stay in ``pending``. Status reads go through the
+    client's response cache, if any, so give the ``messages`` resource a
+    TTL of 0 there.
+
+    Args:
+        messages: ``Messages`` resource of the client
+        message_ids: IDs of the messages to track
+        target: Status to wait for: sent, delivered or read (default: delivered)
+        session_id: Session the messages were sent from, enabling list sweeps
+        concurrency: Maximum status requests in flight (default: 8)
+        min_interval: Shortest delay between polls of a message (default: 1)
+        max_interval: Longest delay between polls of a message (default: 60)
+        backoff: Interval growth factor while a status holds (default: 2)
+        sweep_threshold: Due messages that trigger a list sweep (default: 20)
+        page_size: Messages per sweep page (default: 100)
+        timeout: Seconds after which tracking stops (default: no limit)
+
+    Example:
+        tracker = client.messages.track(message_ids, target="read", session_id=sid)
+        for status in tracker:
+            print(status["id"], status["status"])
+    """
+
+    def _sweep(self) -> List[Dict[str, Any]]:
+        """Read the session's message list, returning settled statuses"""
+        settled = []
+        seen = False
+        for page in range(1, self._sweep_pages() + 1):
+            try:
+                response = self.messages.list(self.session_id, page=page, limit=self.page_size)
+            except Exception:
+                break
+            finally:
+                self.requests += 1
+            statuses, found, last = self._apply_page(response, time.monotonic())
+            settled.extend(statuses)
+            if found:
+                seen = True
+            elif seen:
+                # Past the tracked messages, which were sent together
+                break
+            if last or not self._entries:
+                break
+        return settled
+
+    def _poll(self, message_id: str) -> Tuple[str, Any, Optional[Exception]]:
+        try:
+            response = self.messages.get_status(message_id)
+        except Exception as e:
+            return message_id, None, e
+        return message_id, response.get("data") or {}, None
+
+    def _round(self, executor: ThreadPoolExecutor) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        due = self._due(now)
+        settled = []
+        if self._sweep_wanted(due):
+            settled.extend(self._sweep())
+            # Entries the sweep found were rescheduled under a new due time
+            due = [entry for entry in due if entry.due <= now and entry.message_id in self._entries]
+
+        for message_id, status, error in executor.map(self._poll, [e.message_id for e in due]):
+            self.requests += 1
+            if error is not None:
+                self._fail(message_id, error, time.monotonic())
+                continue
+            status.setdefault("id", message_id)
+            result = self._record(message_id, status, time.monotonic())
+            if result is not None:
+                settled.append(result)
+        return settled
+
+    def __iter__(self):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while True:
+                yield from self._round(executor)
+                wait = self._sleep_time()
+                if wait is None:
+                    return
+                time.sleep(wait)
+
+    def wait(self) -> Dict[str, Dict[str, Any]]:
+        """Track until every message settles or the timeout passes; returns ``statuses``"""
+        for _ in self:
+            pass
+        return self.statuses
+
+
+class AsyncStatusTracker(_BaseStatusTracker):
+    """
+    Asyncio counterpart of ``StatusTracker``
+
+    ``async for`` yields each message's status as it settles, and ``wait``
+    is a coroutine.
+    """
+
+    async def _sweep(self) -> List[Dict[str, Any]]:
+        settled = []
+        seen = False
+        for page in range(1, self._sweep_pages() + 1):
+            try:
+                response = await self.messages.list(self.session_id, page=page, limit=self.page_size)
+            except Exception:
+                break
+            finally:
+                self.requests += 1
+            statuses, found, last = self._apply_page(response, time.monotonic())
+            settled.extend(statuses)
+            if found:
+                seen = True
+            elif seen:
+                break
+            if last or not self._entries:
+                break
+        return settled
+
+    async def _poll(self, semaphore: asyncio.Semaphore, message_id: str) -> Tuple[str, Any, Optional[Exception]]:
+        async with semaphore:
+            try:
+                response = await self.messages.get_status(message_id)
+            except Exception as e:
+                return message_id, None, e
+        return message_id, response.get("data") or {}, None
+
+    async def _round(self, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        due = self._due(now)
+        settled = []
+        if self._sweep_wanted(due):
+            settled.extend(await self._sweep())
+            due = [entry for entry in due if entry.due <= now and entry.message_id in self._entries]
+
+        results = await asyncio.gather(*(self._poll(semaphore, e.message_id) for e in due))
+        for message_id, status, error in results:
+            self.requests += 1
+            if error is not None:
+                self._fail(message_id, error, time.monotonic())
+                continue
+            status.setdefault("id", message_id)
+            result = self._record(message_id, status, time.monotonic())
+            if result is not None:
+                settled.append(result)
+        return settled
+
+    async def __aiter__(self):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        while True:
+            for status in await self._round(semaphore):
+                yield status
+            wait = self._sleep_time()
+            if wait is None:
+                return
+            await asyncio.sleep(wait)
+
+    async def wait(self) -> Dict[str, Dict[str, Any]]:
+        """Track until every message settles or the timeout passes; returns ``statuses``"""
+        async for _ in self:
+            pass
+        return self.statuses
@@ -0,0 +1,95 @@
+"""
+WhatsApp API Platform - Python SDK
+Streaming helpers
+"""
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, Iterable, Iterator, List
+
+
+class _JSONArrayParser:
+    """
+    Incremental parser for the array under ``key`` in a JSON response
+
+    Bytes are fed as they arrive and complete elements are returned as soon
+    as they have been read, so only one partial element is held in memory.
+    """
+
+    _SEPARATORS = " \t\r\n,"
+    _DELIMITERS = " \t\r\n,]"
+
+    def __init__(self, key: str):
+        self._pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._done = False
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[Any]:
+        """Parse a chunk, returning the elements it completed"""
+        self._buffer += self._decoder.decode(chunk, final)
+        items = []
+
+        if not self._started:
+            match = self._pattern.search(self._buffer)
+            if match is None:
+                if final:
+                    raise ValueError("JSON response has no array to stream")
+                return items
+            self._buffer = self._buffer[match.end():]
+            self._started = True
+
+        buffer = self._buffer
+        pos = 0
+        while not self._done:
+            while pos < len(buffer) and buffer[pos] in self._SEPARATORS:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._done = True
+                break
+            try:
+                item, end = self._json.raw_decode(buffer, pos)
+            except ValueError:
+                if final:
+                    raise
+                break
+            # A number read up to the buffer edge (or cut mid-token, like
+            # "2" of "2.5") may continue in the next chunk
+            if not final and (end == len(buffer) or buffer[end] not in self._DELIMITERS):
+                break
+            items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        if final and not self._done:
+            raise ValueError("Truncated JSON array in response")
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str = "data") -> Iterator[Any]:
+    """
+    Yield the elements of the JSON array under ``key`` from byte chunks
+
+    Args:
+        chunks: Response body chunks
+        key: Name of the array member (default: ``"data"``)
+    """
+    parser = _JSONArrayParser(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.feed(b"", final=True)
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes], key: str = "data"):
+    """Async counterpart of ``iter_json_array``"""
+    parser = _JSONArrayParser(key)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.feed(b"", final=True):
+        yield item
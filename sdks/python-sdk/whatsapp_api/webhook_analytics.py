@@ -0,0 +1,314 @@
+"""
+WhatsApp API Platform - Python SDK
+Webhook delivery-log analytics
+"""
+
+import math
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from .models import RecordList, WebhookLog
+
+# Default of the server's WEBHOOK_RETRY_ATTEMPTS. The server disables a
+# webhook for an hour after retry_attempts * 3 failed attempts in a row.
+RETRY_ATTEMPTS = 3
+
+# Columns that logs can be grouped by
+GROUPS = ("event", "webhook_id", "status_code")
+
+WebhookIds = Union[str, Sequence[str]]
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """Percentile of sorted values, interpolating between neighbours"""
+    position = (len(values) - 1) * percentile / 100
+    low = math.floor(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def _epochs(timestamps: Iterable[Optional[str]]) -> List[Optional[float]]:
+    """
+    Server timestamps (``2024-01-01T12:00:00.123Z``) as Unix times
+
+    Logs arrive many per second, so each second is parsed once and only
+    the milliseconds are read per timestamp.
+    """
+    seconds: Dict[str, float] = {}
+    epochs = []
+    for timestamp in timestamps:
+        if not timestamp:
+            epochs.append(None)
+            continue
+        if len(timestamp) != 24 or timestamp[19] != "." or timestamp[23] != "Z":
+            epochs.append(datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp())
+            continue
+        second = timestamp[:19]
+        base = seconds.get(second)
+        if base is None:
+            base = seconds[second] = datetime.fromisoformat(second).replace(tzinfo=timezone.utc).timestamp()
+        epochs.append(base + int(timestamp[20:23]) / 1000)
+    return epochs
+
+
+def _group_keys(logs: RecordList, by: Optional[str]) -> Union[List[Any], None]:
+    if by is None:
+        return None
+    if by not in GROUPS:
+        raise ValueError(f"Cannot group logs by {by!r}; use one of {', '.join(GROUPS)}")
+    return logs.column(by)
+
+
+class WebhookAnalytics:
+    """
+    Latency, status code and failure statistics of webhook delivery logs
+
+    Logs are held column by column in a ``RecordList`` (one entry per
+    delivery attempt), and each statistic is computed in a single pass over
+    the columns it needs, so millions of attempts fit in memory and are
+    summarized in seconds.
+
+    Args:
+        logs: Delivery logs, as a RecordList or an iterable of log dicts
+        retry_attempts: The server's ``WEBHOOK_RETRY_ATTEMPTS`` (default: 3)
+
+    Example:
+        analytics = WebhookAnalytics.fetch(client, ["webhook-1", "webhook-2"])
+        print(analytics.latency_percentiles(by="event"))
+        print(analytics.disable_risk())
+    """
+
+    def __init__(self, logs: Union[RecordList, Iterable[Dict[str, Any]]], retry_attempts: int = RETRY_ATTEMPTS):
+        if not isinstance(logs, RecordList):
+            logs = RecordList(WebhookLog, logs)
+        self.logs = logs
+        self.retry_attempts = retry_attempts
+        self._times: Optional[List[Optional[float]]] = None
+
+    @classmethod
+    def fetch(
+        cls,
+        client: Any,
+        webhook_ids: WebhookIds,
+        since: Optional[str] = None,
+        concurrency: int = 4,
+        retry_attempts: int = RETRY_ATTEMPTS,
+    ) -> "WebhookAnalytics":
+        """
+        Stream the delivery logs of one or more webhooks into a new instance
+
+        Args:
+            client: WhatsAppAPI client
+            webhook_ids: Webhook ID or IDs
+            since: Only attempts made at or after this ISO 8601 time
+            concurrency: Log pages fetched in parallel per webhook
+            retry_attempts: The server's ``WEBHOOK_RETRY_ATTEMPTS``
+        """
+        logs = RecordList(WebhookLog)
+        for webhook_id in [webhook_ids] if isinstance(webhook_ids, str) else webhook_ids:
+            paginator = client.webhooks.iter_logs(
+                webhook_id, since=since, order="asc", concurrency=concurrency
+            )
+            for items in paginator.pages():
+                logs.extend(items)
+        return cls(logs, retry_attempts)
+
+    @classmethod
+    async def afetch(
+        cls,
+        client: Any,
+        webhook_ids: WebhookIds,
+        since: Optional[str] = None,
+        concurrency: int = 4,
+        retry_attempts: int = RETRY_ATTEMPTS,
+    ) -> "WebhookAnalytics":
+        """Async counterpart of ``fetch``, taking an AsyncWhatsAppAPI client"""
+        logs = RecordList(WebhookLog)
+        for webhook_id in [webhook_ids] if isinstance(webhook_ids, str) else webhook_ids:
+            paginator = client.webhooks.iter_logs(
+                webhook_id, since=since, order="asc", concurrency=concurrency
+            )
+            async for items in paginator.apages():
+                logs.extend(items)
+        return cls(logs, retry_attempts)
+
+    @property
+    def times(self) -> List[Optional[float]]:
+        """Unix time of every attempt, parsed from ``created_at`` on first use"""
+        if self._times is None:
+            self._times = _epochs(self.logs.column("created_at"))
+        return self._times
+
+    def __len__(self) -> int:
+        return len(self.logs)
+
+    def latency_percentiles(
+        self,
+        percentiles: Sequence[float] = (50, 90, 95, 99),
+        by: Optional[str] = "event",
+    ) -> Dict[Any, Dict[str, float]]:
+        """
+        Delivery time percentiles, in milliseconds
+
+        Args:
+            percentiles: Percentiles to compute
+            by: Column to group by (``event``, ``webhook_id`` or
+                ``status_code``), or None for one group named ``"all"``
+
+        Returns:
+            ``{group: {"count": n, "mean": ms, "p50": ms, ...}}``; attempts
+            without a recorded duration are left out
+        """
+        keys = _group_keys(self.logs, by)
+        durations = self.logs.column("duration")
+        groups: Dict[Any, List[float]] = defaultdict(list)
+        if keys is None:
+            groups["all"] = [duration for duration in durations if duration is not None]
+        else:
+            for key, duration in zip(keys, durations):
+                if duration is not None:
+                    groups[key].append(duration)
+
+        result = {}
+        for key, values in groups.items():
+            if not values:
+                continue
+            values.sort()
+            stats = {"count": len(values), "mean": sum(values) / len(values)}
+            for percentile in percentiles:
+                stats[f"p{percentile:g}"] = _percentile(values, percentile)
+            result[key] = stats
+        return result
+
+    def status_codes(self, by: Optional[str] = None) -> Union[Counter, Dict[Any, Counter]]:
+        """
+        Histogram of response status codes
+
+        None counts attempts that got no response (timeouts, refused
+        connections). With ``by``, one histogram per group.
+        """
+        codes = self.logs.column("status_code")
+        keys = _group_keys(self.logs, by)
+        if keys is None:
+            return Counter(codes)
+        result: Dict[Any, Counter] = defaultdict(Counter)
+        for key, code in zip(keys, codes):
+            result[key][code] += 1
+        return dict(result)
+
+    def failure_rates(self, window: float = 300, by: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Failed share of the attempts in consecutive time windows
+
+        Args:
+            window: Window length in seconds (default: 5 minutes)
+            by: Column to also group by, or None
+
+        Returns:
+            One dict per window with attempts, oldest first:
+            ``start`` (Unix time), ``attempts``, ``failures``, ``rate`` and,
+            with ``by``, the group ``key``
+        """
+        keys = _group_keys(self.logs, by)
+        if keys is None:
+            keys = [None] * len(self.logs)
+        counts: Dict[Any, List[int]] = {}
+        for key, at, success in zip(keys, self.times, self.logs.column("success")):
+            if at is None:
+                continue
+            bucket = (int(at // window), key)
+            count = counts.get(bucket)
+            if count is None:
+                count = counts[bucket] = [0, 0]
+            count[0] += 1
+            if not success:
+                count[1] += 1
+
+        rates = []
+        ordered = sorted(counts.items(), key=lambda item: (item[0][0], str(item[0][1])))
+        for (bucket, key), (attempts, failures) in ordered:
+            rate = {"start": bucket * window, "attempts": attempts, "failures": failures, "rate": failures / attempts}
+            if by is not None:
+                rate["key"] = key
+            rates.append(rate)
+        return rates
+
+    def disable_risk(self, horizon: float = 3600, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        How close each webhook is to being disabled by the server
+
+        The server counts failed attempts in a row, resets the count on any
+        success, and disables the webhook for an hour when it reaches
+        ``retry_attempts * 3``. The time left is estimated from the pace of
+        failures over the last ``horizon`` seconds.
+
+        Args:
+            horizon: Seconds of recent logs used for the failure pace
+            now: Current Unix time (default: the clock)
+
+        Returns:
+            Per webhook ID: ``consecutive_failures``, ``threshold``,
+            ``remaining`` failures, recent ``attempts`` and ``failure_rate``,
+            ``failures_per_hour``, ``last_success_at`` (Unix time) and
+            ``eta`` in seconds (0 once reached, None without recent failures)
+        """
+        now = time.time() if now is None else now
+        threshold = self.retry_attempts * 3
+        since = now - horizon
+
+        by_webhook: Dict[str, List[int]] = defaultdict(list)
+        for index, webhook_id in enumerate(self.logs.column("webhook_id")):
+            by_webhook[webhook_id].append(index)
+
+        times = self.times
+        successes = self.logs.column("success")
+        result = {}
+        for webhook_id, indexes in by_webhook.items():
+            indexes.sort(key=lambda index: times[index] or 0.0)
+            streak = 0
+            last_success = None
+            for index in reversed(indexes):
+                if successes[index]:
+                    last_success = times[index]
+                    break
+                streak += 1
+
+            recent = [index for index in indexes if times[index] is not None and times[index] >= since]
+            failures = sum(1 for index in recent if not successes[index])
+            per_hour = failures * 3600 / horizon
+            remaining = max(threshold - streak, 0)
+            if remaining == 0:
+                eta = 0.0
+            elif failures:
+                eta = remaining * horizon / failures
+            else:
+                eta = None
+
+            result[webhook_id] = {
+                "consecutive_failures": streak,
+                "threshold": threshold,
+                "remaining": remaining,
+                "attempts": len(recent),
+                "failure_rate": failures / len(recent) if recent else 0.0,
+                "failures_per_hour": per_hour,
+                "last_success_at": last_success,
+                "eta": eta,
+            }
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """Attempt and failure totals, overall latency and status codes"""
+        successes = self.logs.column("success")
+        failures = sum(1 for success in successes if not success)
+        return {
+            "attempts": len(successes),
+            "failures": failures,
+            "failure_rate": failures / len(successes) if successes else 0.0,
+            "latency": self.latency_percentiles(by=None).get("all"),
+            "status_codes": dict(self.status_codes()),
+        }
+
+    def __repr__(self) -> str:
+        return f"<WebhookAnalytics attempts={len(self.logs)}>"
@@ -101,6 +101,7 @@ const config = {
     retryAttempts: parseInt(process.env.WEBHOOK_RETRY_ATTEMPTS, 10) || 3,
     retryDelay: parseInt(process.env.WEBHOOK_RETRY_DELAY, 10) || 1000,
     timeout: parseInt(process.env.WEBHOOK_TIMEOUT, 10) || 10000,
+    logRetentionDays: parseInt(process.env.WEBHOOK_LOG_RETENTION_DAYS, 10) || 30,
     secret: process.env.WEBHOOK_SECRET || 'webhook-secret',
   },
   
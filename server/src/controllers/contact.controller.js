@@ -9,9 +9,14 @@ const { Op } = require('sequelize');
 
 /**
  * Get all contacts for a session
+ *
+ * With updated_since, only contacts updated at or after that time are
+ * listed, oldest change first. Passing the updated_at and id of the last
+ * contact received as updated_since and after_id fetches the next batch
+ * (keyset pagination), so changes made while paging are not skipped.
  */
 exports.listContacts = async (req, res) => {
-  const { session_id } = req.query;
+  const { session_id, updated_since, after_id } = req.query;
   const page = parseInt(req.query.page) || 1;
   const limit = parseInt(req.query.limit) || 50;
   const offset = (page - 1) * limit;
@@ -30,20 +35,42 @@ exports.listContacts = async (req, res) => {
   }
 
   const where = { session_id };
+  const filters = [];
 
   // Add search filter
   if (search) {
-    where[Op.or] = [
-      { name: { [Op.iLike]: `%${search}%` } },
-      { phone_number: { [Op.iLike]: `%${search}%` } },
-    ];
+    filters.push({
+      [Op.or]: [
+        { name: { [Op.iLike]: `%${search}%` } },
+        { phone_number: { [Op.iLike]: `%${search}%` } },
+      ],
+    });
+  }
+
+  // Add change cursor
+  let order = [['name', 'ASC']];
+  if (updated_since) {
+    const since = new Date(updated_since);
+    filters.push(after_id
+      ? {
+        [Op.or]: [
+          { updated_at: { [Op.gt]: since } },
+          { updated_at: since, id: { [Op.gt]: after_id } },
+        ],
+      }
+      : { updated_at: { [Op.gte]: since } });
+    order = [['updated_at', 'ASC'], ['id', 'ASC']];
+  }
+
+  if (filters.length) {
+    where[Op.and] = filters;
   }
 
   const { count, rows: contacts } = await Contact.findAndCountAll({
     where,
     limit,
     offset,
-    order: [['name', 'ASC']],
+    order,
   });
 
   res.json({
@@ -3,8 +3,9 @@
  * Handles webhook management operations
  */
 
-const { Webhook, Session } = require('../models');
+const { Webhook, WebhookLog, Session } = require('../models');
 const { ApiError } = require('../middleware/errorHandler');
+const { Op } = require('sequelize');
 const webhookService = require('../services/webhook.service');
 
 /**
@@ -285,6 +286,7 @@ exports.getWebhookLogs = async (req, res) => {
   const page = parseInt(req.query.page) || 1;
   const limit = parseInt(req.query.limit) || 50;
   const offset = (page - 1) * limit;
+  const { since, order = 'desc' } = req.query;
 
   const webhook = await Webhook.findOne({
     where: { id: req.params.id },
@@ -301,8 +303,19 @@ exports.getWebhookLogs = async (req, res) => {
     throw new ApiError(404, 'Webhook not found');
   }
 
-  // TODO: Implement webhook delivery logging
-  // For now, return basic stats from the webhook model
+  const where = { webhook_id: webhook.id };
+  if (since) {
+    where.created_at = { [Op.gte]: new Date(since) };
+  }
+
+  // Oldest first keeps pages stable while new deliveries are logged
+  const direction = order === 'asc' ? 'ASC' : 'DESC';
+  const { count, rows: logs } = await WebhookLog.findAndCountAll({
+    where,
+    limit,
+    offset,
+    order: [['created_at', direction], ['id', direction]],
+  });
 
   res.json({
     success: true,
@@ -312,13 +325,14 @@ exports.getWebhookLogs = async (req, res) => {
         total_failures: webhook.failure_count,
         last_failure: webhook.last_failure_at,
         is_active: webhook.is_active,
+        disabled_until: webhook.disabled_until,
       },
-      logs: [], // TODO: Implement actual logging
+      logs,
       pagination: {
         page,
         limit,
-        total: 0,
-        totalPages: 0,
+        total: count,
+        totalPages: Math.ceil(count / limit),
       },
     },
   });
@@ -0,0 +1,77 @@
+/**
+ * Idempotency Middleware
+ * Replays the stored response of a request repeated with the same Idempotency-Key
+ */
+
+const { redisClient } = require('../config/redis');
+const { ApiError } = require('./errorHandler');
+const logger = require('../utils/logger');
+
+const HEADER = 'Idempotency-Key';
+const MAX_KEY_LENGTH = 255;
+const RESPONSE_TTL = 86400; // Keep responses for 24 hours
+const LOCK_TTL = 120; // Longest time a request may hold its key
+
+/**
+ * Deduplicate requests carrying an Idempotency-Key header
+ *
+ * The first request with a key is processed and its response stored; a
+ * repeat (a client retry or hedged copy) gets the stored response with an
+ * Idempotent-Replayed header instead of being processed again. A repeat
+ * arriving while the first is still in progress gets 409. Only 2xx
+ * responses are stored: an error such as a 429 from the rate limiter, a
+ * 409 or a 5xx releases the key, so a retry is processed. Keys are scoped
+ * to the user and route. If Redis is unavailable, requests are processed
+ * normally.
+ */
+const idempotency = async (req, res, next) => {
+  const key = req.get(HEADER);
+  if (!key) {
+    return next();
+  }
+
+  if (key.length > MAX_KEY_LENGTH) {
+    return next(new ApiError(400, `${HEADER} must be at most ${MAX_KEY_LENGTH} characters`));
+  }
+
+  const redisKey = `idem:${req.user.id}:${req.method}:${req.baseUrl}${req.path}:${key}`;
+
+  try {
+    const locked = await redisClient.set(redisKey, JSON.stringify({ state: 'processing' }), 'EX', LOCK_TTL, 'NX');
+
+    if (!locked) {
+      const stored = JSON.parse(await redisClient.get(redisKey));
+      if (!stored || stored.state === 'processing') {
+        res.setHeader('Retry-After', 1);
+        return next(new ApiError(409, 'A request with this Idempotency-Key is in progress'));
+      }
+
+      res.setHeader('Idempotent-Replayed', 'true');
+      return res.status(stored.status).json(stored.body);
+    }
+  } catch (error) {
+    logger.error('Idempotency check failed:', error);
+    // If Redis fails, process the request
+    return next();
+  }
+
+  const json = res.json.bind(res);
+  res.json = (body) => {
+    const succeeded = res.statusCode >= 200 && res.statusCode < 300;
+    const release = succeeded
+      ? redisClient.setex(redisKey, RESPONSE_TTL, JSON.stringify({
+        state: 'done',
+        status: res.statusCode,
+        body,
+      }))
+      : redisClient.del(redisKey);
+    release.catch((error) => logger.error('Idempotency store failed:', error));
+    return json(body);
+  };
+
+  next();
+};
+
+module.exports = {
+  idempotency,
+};
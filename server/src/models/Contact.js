@@ -90,6 +90,9 @@ Contact.init(
       {
         fields: ['name'],
       },
+      {
+        fields: ['session_id', 'updated_at', 'id'],
+      },
     ],
   }
 );
@@ -0,0 +1,72 @@
+/**
+ * WebhookLog Model
+ * Records every webhook delivery attempt
+ */
+
+const { DataTypes, Model } = require('sequelize');
+const { sequelize } = require('../config/database');
+
+class WebhookLog extends Model {}
+
+WebhookLog.init(
+  {
+    id: {
+      type: DataTypes.UUID,
+      defaultValue: DataTypes.UUIDV4,
+      primaryKey: true,
+    },
+    webhook_id: {
+      type: DataTypes.UUID,
+      allowNull: false,
+      references: {
+        model: 'webhooks',
+        key: 'id',
+      },
+      onDelete: 'CASCADE',
+    },
+    event: {
+      type: DataTypes.STRING,
+      allowNull: false,
+    },
+    status_code: {
+      type: DataTypes.INTEGER,
+      allowNull: true,
+      comment: 'HTTP status of the response; null when no response was received',
+    },
+    success: {
+      type: DataTypes.BOOLEAN,
+      allowNull: false,
+    },
+    attempt: {
+      type: DataTypes.INTEGER,
+      defaultValue: 1,
+      comment: 'Delivery attempt of the queue job, starting at 1',
+    },
+    duration: {
+      type: DataTypes.INTEGER,
+      allowNull: true,
+      comment: 'Delivery time in milliseconds',
+    },
+    error: {
+      type: DataTypes.TEXT,
+      allowNull: true,
+    },
+  },
+  {
+    sequelize,
+    modelName: 'WebhookLog',
+    tableName: 'webhook_logs',
+    updatedAt: false,
+    indexes: [
+      {
+        fields: ['webhook_id', 'created_at', 'id'],
+      },
+      {
+        // Retention pruning deletes by age across all webhooks
+        fields: ['created_at'],
+      },
+    ],
+  }
+);
+
+module.exports = WebhookLog;
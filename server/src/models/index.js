@@ -10,6 +10,7 @@ const Message = require('./Message');
 const Contact = require('./Contact');
 const Group = require('./Group');
 const Webhook = require('./Webhook');
+const WebhookLog = require('./WebhookLog');
 
 /**
  * Define model associations
@@ -99,6 +100,18 @@ Webhook.belongsTo(Session, {
   as: 'session',
 });
 
+Webhook.hasMany(WebhookLog, {
+  foreignKey: 'webhook_id',
+  as: 'logs',
+  onDelete: 'CASCADE',
+});
+
+// WebhookLog associations
+WebhookLog.belongsTo(Webhook, {
+  foreignKey: 'webhook_id',
+  as: 'webhook',
+});
+
 module.exports = {
   User,
   ApiKey,
@@ -107,5 +120,6 @@ module.exports = {
   Contact,
   Group,
   Webhook,
+  WebhookLog,
 };
 
@@ -12,7 +12,7 @@ const contactController = require('../controllers/contact.controller');
 
 /**
  * @route   GET /api/v1/contacts
- * @desc    List all contacts for a session
+ * @desc    List all contacts for a session, or those changed since a cursor
  * @access  Private
  */
 router.get(
@@ -24,6 +24,8 @@ router.get(
     query('page').optional().isInt({ min: 1 }),
     query('limit').optional().isInt({ min: 1, max: 100 }),
     query('search').optional().trim(),
+    query('updated_since').optional().isISO8601().withMessage('updated_since must be an ISO 8601 date'),
+    query('after_id').optional().isUUID().withMessage('Invalid after_id'),
   ],
   validationHandler,
   asyncHandler(contactController.listContacts)
@@ -9,6 +9,7 @@ const { body, param, query } = require('express-validator');
 const { asyncHandler, validationHandler, ApiError } = require('../middleware/errorHandler');
 const { authenticate, requireScope } = require('../middleware/auth');
 const rateLimiter = require('../middleware/rateLimiter');
+const { idempotency } = require('../middleware/idempotency');
 const { whatsappManager } = require('../services/whatsapp.service');
 const { Message, Session } = require('../models');
 const { MessageMedia } = require('whatsapp-web.js');
@@ -22,6 +23,7 @@ router.post(
   '/send',
   authenticate,
   requireScope('messages:write'),
+  idempotency,
   rateLimiter.messages,
   [
     body('session_id').isUUID().withMessage('Valid session ID is required'),
@@ -87,6 +89,7 @@ router.post(
   '/media',
   authenticate,
   requireScope('messages:write'),
+  idempotency,
   rateLimiter.messages,
   [
     body('session_id').isUUID().withMessage('Valid session ID is required'),
@@ -160,6 +163,7 @@ router.post(
   '/location',
   authenticate,
   requireScope('messages:write'),
+  idempotency,
   rateLimiter.messages,
   [
     body('session_id').isUUID().withMessage('Valid session ID is required'),
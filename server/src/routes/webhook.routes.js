@@ -142,6 +142,8 @@ router.get(
     param('id').isUUID().withMessage('Invalid webhook ID'),
     query('page').optional().isInt({ min: 1 }),
     query('limit').optional().isInt({ min: 1, max: 100 }),
+    query('since').optional().isISO8601().withMessage('since must be an ISO 8601 date'),
+    query('order').optional().isIn(['asc', 'desc']),
   ],
   validationHandler,
   asyncHandler(webhookController.getWebhookLogs)
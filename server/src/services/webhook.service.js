@@ -5,7 +5,8 @@
 
 const axios = require('axios');
 const crypto = require('crypto');
-const { Webhook, Session } = require('../models');
+const { Op } = require('sequelize');
+const { Webhook, WebhookLog, Session } = require('../models');
 const config = require('../config');
 const logger = require('../utils/logger');
 const Queue = require('bull');
@@ -39,7 +40,18 @@ webhookQueue.process(config.queue.concurrency, async (job) => {
       return;
     }
 
-    await deliverWebhook(webhook, event, payload);
+    const startedAt = Date.now();
+    try {
+      const response = await deliverWebhook(webhook, event, payload);
+      await logDelivery(job, { statusCode: response.status, duration: Date.now() - startedAt });
+    } catch (error) {
+      await logDelivery(job, {
+        statusCode: error.response ? error.response.status : null,
+        duration: Date.now() - startedAt,
+        error,
+      });
+      throw error;
+    }
     
     // Update success timestamp
     await webhook.resetFailures();
@@ -68,6 +80,55 @@ webhookQueue.process(config.queue.concurrency, async (job) => {
   }
 });
 
+/**
+ * Prune delivery logs past the retention period once an hour
+ * A repeatable job, so only one server instance runs each prune
+ */
+const PRUNE_LOGS_JOB = 'prune-logs';
+
+webhookQueue.process(PRUNE_LOGS_JOB, () => pruneLogs());
+
+webhookQueue
+  .add(PRUNE_LOGS_JOB, {}, { repeat: { every: 3600000 }, removeOnFail: true })
+  .catch((error) => logger.error('Failed to schedule webhook log pruning', error));
+
+/**
+ * Delete delivery logs older than the retention period
+ * @param {number} retentionDays - Days of logs kept
+ * @returns {Promise<number>} Number of deleted logs
+ */
+async function pruneLogs(retentionDays = config.webhook.logRetentionDays) {
+  const cutoff = new Date(Date.now() - retentionDays * 24 * 60 * 60 * 1000);
+  const deleted = await WebhookLog.destroy({
+    where: { created_at: { [Op.lt]: cutoff } },
+  });
+
+  logger.info(`Pruned ${deleted} webhook delivery logs older than ${retentionDays} days`);
+  return deleted;
+}
+
+/**
+ * Record a delivery attempt in the webhook's delivery log
+ * Logging failures are only reported, so they never fail the delivery
+ * @param {Object} job - Queue job of the delivery
+ * @param {Object} result - statusCode, duration (ms) and error, if any
+ */
+async function logDelivery(job, { statusCode, duration, error }) {
+  try {
+    await WebhookLog.create({
+      webhook_id: job.data.webhookId,
+      event: job.data.event,
+      status_code: statusCode,
+      success: !error,
+      attempt: job.attemptsMade + 1,
+      duration,
+      error: error ? error.message : null,
+    });
+  } catch (logError) {
+    logger.error(`Failed to log webhook delivery: ${job.data.webhookId}`, logError);
+  }
+}
+
 /**
  * Deliver webhook to URL
  * @param {Object} webhook - Webhook record
@@ -95,13 +156,11 @@ async function deliverWebhook(webhook, event, payload) {
   };
 
   // Send webhook request
-  const response = await axios.post(webhook.url, webhookPayload, {
+  return axios.post(webhook.url, webhookPayload, {
     headers,
     timeout: config.webhook.timeout,
     validateStatus: (status) => status >= 200 && status < 300,
   });
-
-  return response.data;
 }
 
 /**
@@ -259,6 +318,7 @@ module.exports = {
   verifySignature,
   generateSignature,
   getQueueStats,
+  pruneLogs,
   webhookQueue,
 };
 